@@ -58,11 +58,14 @@ def main() -> int:
     _bootstrap_safety_checks()
     _performance_mark("bootstrap_checks_complete")
 
-    # Slightly darker neutral background for the whole app (without affecting input widgets).
+    # Slightly darker neutral background for the whole app (without affecting input widgets),
+    # plus the top-right language selector styling.
     app.setStyleSheet(
         """
         QMainWindow { background-color: #f0f0f0; }
         QTabWidget::pane { background-color: #f0f0f0; }
+        QToolButton#lang_btn { padding: 4px 12px; text-align: left; }
+        QToolButton#lang_btn::menu-indicator { subcontrol-position: right center; }
         """
     )
 
@@ -311,8 +311,10 @@ def update_ftp_state(
 
 
 def save_config(cfg: Dict[str, Any]) -> None:
+    global _profiles_map_memo
     p = _config_path()
     p.write_text(json.dumps(cfg, ensure_ascii=False, indent=2), encoding="utf-8")
+    _profiles_map_memo = None
 
 
 def load_profiles() -> List[Dict[str, Any]]:
@@ -321,6 +323,35 @@ def load_profiles() -> List[Dict[str, Any]]:
     return profs if isinstance(profs, list) else []
 
 
+# (size, mtime_ns) of config.json -> profiles indexed by name.
+_profiles_map_memo: tuple[tuple[int, int], Dict[str, Dict[str, Any]]] | None = None
+
+
+def load_profiles_map() -> Dict[str, Dict[str, Any]]:
+    """Return profiles keyed by name, first occurrence wins.
+
+    The parsed index is reused until config.json changes on disk (or is
+    rewritten through ``save_config``). Treat the returned dicts as
+    read-only; copy before modifying.
+    """
+    global _profiles_map_memo
+    try:
+        st = _config_path().stat()
+        signature = (st.st_size, st.st_mtime_ns)
+    except OSError:
+        signature = None
+    memo = _profiles_map_memo
+    if signature is not None and memo is not None and memo[0] == signature:
+        return memo[1]
+    by_name: Dict[str, Dict[str, Any]] = {}
+    for p in load_profiles():
+        name = p.get("name", "") if isinstance(p, dict) else ""
+        if name:
+            by_name.setdefault(name, p)
+    _profiles_map_memo = (signature, by_name) if signature is not None else None
+    return by_name
+
+
 def upsert_profile(profile: Dict[str, Any]) -> None:
     """Insert or update by profile['name'] (case-sensitive)."""
     name = (profile.get("name") or "").strip()
@@ -3,6 +3,7 @@ from __future__ import annotations
 import base64
 import os
 from dataclasses import dataclass
+from functools import lru_cache
 
 from cryptography.fernet import Fernet
 from cryptography.hazmat.primitives import hashes
@@ -17,8 +18,19 @@ class EncryptedSecret:
     salt: str
 
 
+# Salt shared by secrets encrypted during this process. Fernet adds a random
+# IV per token, so reusing the KDF salt lets several saves share one PBKDF2
+# run instead of paying it again for every profile.
+_SESSION_SALT_B64 = base64.urlsafe_b64encode(os.urandom(16)).decode("ascii")
+
+
+@lru_cache(maxsize=8)
 def _derive_fernet_key(master_password: str, salt_b64: str, *, iterations: int = 200_000) -> bytes:
-    """Derive a Fernet key from a user-provided master password and salt."""
+    """Derive a Fernet key from a user-provided master password and salt.
+
+    Results are memoized in process memory, where the master password is
+    already held for the session; call ``clear_key_cache`` to drop them.
+    """
     if not master_password:
         raise ValueError("master password is required")
     salt = base64.urlsafe_b64decode(salt_b64.encode("ascii"))
@@ -32,12 +44,16 @@ def _derive_fernet_key(master_password: str, salt_b64: str, *, iterations: int =
     return base64.urlsafe_b64encode(key)
 
 
+def clear_key_cache() -> None:
+    """Forget every derived key (e.g. on shutdown or a wrong master password)."""
+    _derive_fernet_key.cache_clear()
+
+
 def encrypt_with_master(master_password: str, plaintext: str) -> EncryptedSecret:
-    """Encrypt plaintext using a master password. Returns token + per-secret salt."""
+    """Encrypt plaintext using a master password. Returns token + salt."""
     if plaintext is None:
         plaintext = ""
-    salt = os.urandom(16)
-    salt_b64 = base64.urlsafe_b64encode(salt).decode("ascii")
+    salt_b64 = _SESSION_SALT_B64
     f = Fernet(_derive_fernet_key(master_password, salt_b64))
     token = f.encrypt(plaintext.encode("utf-8")).decode("ascii")
     return EncryptedSecret(token=token, salt=salt_b64)
@@ -1,9 +1,17 @@
+import atexit
 import json
+import logging
+import threading
 from pathlib import Path
 from datetime import datetime
 
 from truba_gui.services.command_history_store import is_sensitive_command
 
+try:
+    import orjson
+except ImportError:  # optional speedup; stdlib json is the fallback
+    orjson = None
+
 
 def _redact_cmd(cmd: str) -> str:
     """Redact secrets inside a command string.
@@ -31,15 +39,70 @@ def _history_path() -> Path:
     base.mkdir(parents=True, exist_ok=True)
     return base / "history.json"
 
-def append_event(event: dict) -> None:
+# Events are buffered briefly and written in one read-modify-write, so a
+# burst of UI actions costs a single rewrite of history.json instead of one
+# per event.
+_FLUSH_DELAY_S = 0.5
+_pending: list[dict] = []
+_pending_lock = threading.Lock()
+_write_lock = threading.Lock()
+_flush_timer: threading.Timer | None = None
+
+
+def _loads(raw: bytes):
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw.decode("utf-8"))
+
+
+def _dumps(data) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, ensure_ascii=False, indent=2).encode("utf-8")
+
+
+def _write_events(events: list[dict]) -> None:
     p = _history_path()
     data = []
     if p.exists():
         try:
-            data = json.loads(p.read_text(encoding="utf-8"))
+            data = _loads(p.read_bytes())
         except Exception:
             data = []
+    data.extend(events)
+    p.write_bytes(_dumps(data))
+
+
+def flush_events() -> None:
+    """Write buffered events to disk now. Safe to call from any thread."""
+    global _flush_timer
+    with _write_lock:
+        with _pending_lock:
+            timer, _flush_timer = _flush_timer, None
+            batch = list(_pending)
+            _pending.clear()
+        if timer is not None and timer is not threading.current_thread():
+            timer.cancel()
+        if not batch:
+            return
+        try:
+            _write_events(batch)
+        except Exception:
+            logging.getLogger("truba_gui").warning(
+                "history: failed to write %d event(s)", len(batch), exc_info=True
+            )
+
+
+def append_event(event: dict) -> None:
+    global _flush_timer
     event = _sanitize_event(event)
     event["ts"] = datetime.now().isoformat(timespec="seconds")
-    data.append(event)
-    p.write_text(json.dumps(data, ensure_ascii=False, indent=2), encoding="utf-8")
+    with _pending_lock:
+        _pending.append(event)
+        if _flush_timer is None:
+            _flush_timer = threading.Timer(_FLUSH_DELAY_S, flush_events)
+            _flush_timer.daemon = True
+            _flush_timer.start()
+
+
+atexit.register(flush_events)
@@ -6,14 +6,31 @@ _SETTINGS_DIR = Path.home() / ".truba_slurm_gui"
 _LANG_FILE = _SETTINGS_DIR / "language.json"
 
 _LANG: dict = {}
+# Dotted key -> string, rebuilt once per language load so ``t`` is a single
+# dict lookup instead of a walk through the nested JSON.
+_FLAT: dict[str, str] = {}
 _CURRENT = "tr"
 
+def _flatten_strings(d: dict, prefix: str = "") -> dict[str, str]:
+    out: dict[str, str] = {}
+    for k, v in d.items():
+        if not isinstance(k, str):
+            continue
+        p = f"{prefix}.{k}" if prefix else k
+        if isinstance(v, dict):
+            out.update(_flatten_strings(v, p))
+        elif isinstance(v, str):
+            out[p] = v
+    return out
+
+
 def load_language(lang: str = "tr") -> None:
-    global _LANG, _CURRENT
+    global _LANG, _FLAT, _CURRENT
     base = Path(__file__).resolve().parent.parent
     path = base / "i18n" / f"{lang}.json"
     with open(path, "r", encoding="utf-8") as f:
         _LANG = json.load(f)
+    _FLAT = _flatten_strings(_LANG)
     _CURRENT = lang
 
 
@@ -59,13 +76,18 @@ def load_saved_language(default: str = "tr") -> str:
     return lang
 
 def t(key: str) -> str:
-    cur = _LANG
-    try:
-        for part in key.split("."):
-            cur = cur[part]
-        return cur if isinstance(cur, str) else f"[{key}]"
-    except Exception:
-        return f"[{key}]"
+    value = _FLAT.get(key)
+    return value if value is not None else f"[{key}]"
+
+
+def tr(key: str, fallback: str) -> str:
+    """Like ``t`` but return ``fallback`` when the key is missing.
+
+    Replaces the ``t(k) if t(k) != "[k]" else fallback`` idiom with a single
+    lookup.
+    """
+    value = _FLAT.get(key)
+    return fallback if value is None else value
 
 
 def _flatten_keys(d: dict, prefix: str = "") -> set[str]:
@@ -1,8 +1,10 @@
 from __future__ import annotations
 
+import atexit
 import logging
+import queue
 import sys
-from logging.handlers import RotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 
 from truba_gui.core.logging import log_path
 
@@ -12,6 +14,8 @@ def setup_logging(level: int = logging.INFO) -> None:
 
     - Never raises (must not crash the GUI)
     - Single file: ~/.truba_slurm_gui/app.log
+    - Records are queued; a listener thread does the file writes, so
+      console lines logged from the GUI thread never wait on disk I/O
     """
     try:
         p = log_path()
@@ -21,7 +25,7 @@ def setup_logging(level: int = logging.INFO) -> None:
         root.setLevel(level)
 
         # Avoid duplicating handlers on restart (e.g. interactive reload)
-        if any(isinstance(h, RotatingFileHandler) for h in root.handlers):
+        if any(isinstance(h, (RotatingFileHandler, QueueHandler)) for h in root.handlers):
             return
 
         fmt = logging.Formatter(
@@ -37,7 +41,13 @@ def setup_logging(level: int = logging.INFO) -> None:
         )
         fh.setFormatter(fmt)
         fh.setLevel(level)
-        root.addHandler(fh)
+
+        records: queue.SimpleQueue = queue.SimpleQueue()
+        listener = QueueListener(records, fh, respect_handler_level=True)
+        listener.start()
+        # stop() drains the queue, so lines logged right before exit persist.
+        atexit.register(listener.stop)
+        root.addHandler(QueueHandler(records))
 
         # Also capture warnings and reduce silent failures
         logging.captureWarnings(True)
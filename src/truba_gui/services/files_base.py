@@ -2,9 +2,9 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import List, Tuple
+from typing import Dict, List, Tuple
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class RemoteEntry:
     name: str
     path: str
@@ -45,6 +45,9 @@ class FilesBackend(ABC):
     def upload(self, local_path: str, remote_path: str) -> None:
         raise NotImplementedError
 
+    def close(self) -> None:
+        """Release connections held by the backend itself (default: none)."""
+
     # --- Optional file operations (used by RemoteDirPanel context menu) ---
     # Backends that don't support these can rely on the default NotImplementedError.
     def remove(self, remote_path: str, recursive: bool = False) -> None:
@@ -72,3 +75,11 @@ class FilesBackend(ABC):
     def is_dir(self, remote_path: str) -> bool:
         """Return True if remote_path is a directory."""
         raise NotImplementedError
+
+    def is_symlink(self, remote_path: str) -> bool:
+        """Return True if remote_path itself is a symbolic link (not followed)."""
+        raise NotImplementedError
+
+    def exists_many(self, remote_paths: List[str]) -> Dict[str, bool]:
+        """Return {path: exists} for several paths; backends may batch this."""
+        return {path: self.exists(path) for path in remote_paths}
@@ -41,6 +41,9 @@ class FTPFilesBackend(FilesBackend):
     """Plain FTP implementation of the app's file-transfer backend."""
 
     supports_parallel_transfers = False
+    # copy() re-uploads with resume semantics and RNTO onto an existing file
+    # is server-dependent, so overwrites keep their explicit delete.
+    supports_overwrite = False
 
     def __init__(
         self,
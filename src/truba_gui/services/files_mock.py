@@ -19,6 +19,7 @@ def _norm(path: str) -> str:
 
 class MockFilesBackend(FilesBackend):
     supports_parallel_transfers = True
+    supports_overwrite = True
 
     def __init__(self):
         now = int(time.time())
@@ -137,6 +138,11 @@ class MockFilesBackend(FilesBackend):
     def is_dir(self, remote_path: str) -> bool:
         return _norm(remote_path) in self._dirs
 
+    def is_symlink(self, remote_path: str) -> bool:
+        if not self.exists(remote_path):
+            raise FileNotFoundError(remote_path)
+        return False
+
     def mkdir(self, remote_dir: str) -> None:
         remote_dir = _norm(remote_dir)
         self._ensure_parent_dirs(remote_dir)
@@ -2,12 +2,19 @@ from __future__ import annotations
 
 import os
 import stat as pystat
-from typing import List, Tuple
+import threading
+from typing import Dict, List, Tuple
 
 from truba_gui.services.files_base import FilesBackend, RemoteEntry
 from truba_gui.ssh.client import SSHClientWrapper
 
+# Isolated SFTP channels used when probing many paths without a shell.
+_EXISTS_PROBE_WORKERS = 8
+
 class SSHFilesBackend(FilesBackend):
+    # copy()/move() run cp/mv, which replace an existing regular file.
+    supports_overwrite = True
+
     def __init__(self, ssh: SSHClientWrapper):
         if not ssh.sftp:
             raise RuntimeError("SFTP not available")
@@ -19,6 +26,11 @@ class SSHFilesBackend(FilesBackend):
         self._supports_parallel_transfers = bool(
             capability_probe()
         ) if callable(capability_probe) else False
+        # Background listings get their own channel, opened on first use
+        # and used by one listing at a time.
+        self._listing_lock = threading.Lock()
+        self._listing_sftp = None
+        self._closed = False
 
         # Edge-case notes (for maintainers):
         # - NFS "stale file handle" can occur after scratch purge; operations may fail
@@ -35,8 +47,55 @@ class SSHFilesBackend(FilesBackend):
         return self.ssh.sftp.listdir(remote_dir)
 
     def listdir_entries(self, remote_dir: str) -> List[RemoteEntry]:
+        return self._listdir_entries(self.ssh.sftp, remote_dir)
+
+    def listdir_entries_isolated(self, remote_dir: str) -> List[RemoteEntry]:
+        """``listdir_entries`` that is safe to call off the GUI thread.
+
+        The browsing channel is not thread safe, so background listings use
+        a dedicated SFTP channel and are serialized on it.  Only available
+        when ``supports_parallel_transfers`` is true.
+        """
+        with self._listing_lock:
+            if self._closed:
+                raise RuntimeError("SFTP backend closed")
+            if self._listing_sftp is None:
+                self._listing_sftp = self.ssh.open_transfer_sftp()
+                if self._closed:
+                    # close() ran while the channel was opening.
+                    self.close()
+                    raise RuntimeError("SFTP backend closed")
+            sftp = self._listing_sftp
+            try:
+                return self._listdir_entries(sftp, remote_dir)
+            except Exception:
+                channel = getattr(sftp, "sock", None)
+                if channel is None or getattr(channel, "closed", False):
+                    # Reopen on the next listing instead of reusing a dead channel.
+                    self._listing_sftp = None
+                raise
+
+    def close(self) -> None:
+        """Close the background listing channel; the SSH connection stays open.
+
+        Does not wait for a listing in progress: closing its channel makes
+        it fail instead.
+        """
+        self._closed = True
+        sftp, self._listing_sftp = self._listing_sftp, None
+        if sftp is not None:
+            try:
+                sftp.close()
+            except Exception:
+                pass
+
+    @staticmethod
+    def _listdir_entries(sftp, remote_dir: str) -> List[RemoteEntry]:
         entries: List[RemoteEntry] = []
-        for attr in self.ssh.sftp.listdir_attr(remote_dir):
+        # listdir_iter keeps several READDIR requests in flight, so a large
+        # directory on a high-latency link is not fetched one round trip at
+        # a time like listdir_attr does.
+        for attr in sftp.listdir_iter(remote_dir):
             name = getattr(attr, "filename", "") or ""
             path = remote_dir.rstrip("/") + "/" + name
             mode = getattr(attr, "st_mode", 0) or 0
@@ -218,6 +277,59 @@ class SSHFilesBackend(FilesBackend):
         except Exception:
             return False
 
+    def exists_many(self, remote_paths: List[str]) -> Dict[str, bool]:
+        """Probe several paths with one remote command instead of one stat each."""
+        paths = list(dict.fromkeys(remote_paths))
+        if len(paths) < 2:
+            return {path: self.exists(path) for path in paths}
+        import shlex
+        quoted = " ".join(shlex.quote(path) for path in paths)
+        cmd = (
+            f"for p in {quoted}; do "
+            'if [ -e "$p" ] || [ -L "$p" ]; then echo 1; else echo 0; fi; done'
+        )
+        code, out, _err = self.ssh.run(cmd, log_output=False)
+        flags = out.split()
+        if code != 0 or len(flags) != len(paths):
+            return self._exists_parallel(paths)
+        return {path: flag == "1" for path, flag in zip(paths, flags)}
+
+    def _exists_parallel(self, paths: List[str]) -> Dict[str, bool]:
+        """Stat ``paths`` over several isolated SFTP channels at once.
+
+        Used when the shell probe is unavailable.  The shared browsing
+        channel is not thread safe, so each worker opens its own channel.
+        """
+        if not self._supports_parallel_transfers or len(paths) < 2:
+            return {path: self.exists(path) for path in paths}
+        from concurrent.futures import ThreadPoolExecutor
+
+        workers = min(_EXISTS_PROBE_WORKERS, len(paths))
+        chunks = [paths[i::workers] for i in range(workers)]
+
+        def probe(chunk: List[str]) -> Dict[str, bool]:
+            sftp = self.ssh.open_transfer_sftp()
+            try:
+                found: Dict[str, bool] = {}
+                for path in chunk:
+                    try:
+                        sftp.stat(path)
+                        found[path] = True
+                    except Exception:
+                        found[path] = False
+                return found
+            finally:
+                sftp.close()
+
+        result: Dict[str, bool] = {}
+        try:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                for found in executor.map(probe, chunks):
+                    result.update(found)
+        except Exception:
+            return {path: self.exists(path) for path in paths}
+        return {path: result[path] for path in paths}
+
     def is_dir(self, remote_path: str) -> bool:
         try:
             st = self.ssh.sftp.stat(remote_path)
@@ -225,6 +337,10 @@ class SSHFilesBackend(FilesBackend):
         except Exception:
             return False
 
+    def is_symlink(self, remote_path: str) -> bool:
+        st = self.ssh.sftp.lstat(remote_path)
+        return pystat.S_ISLNK(getattr(st, "st_mode", 0) or 0)
+
     def copy(self, src_remote_path: str, dst_remote_path: str, recursive: bool = False) -> None:
         import shlex
         s = shlex.quote(src_remote_path)
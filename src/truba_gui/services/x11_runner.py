@@ -1,8 +1,9 @@
 from __future__ import annotations
 
+import codecs
 from typing import Callable, Optional
 
-from PySide6.QtCore import QProcess
+from PySide6.QtCore import QProcess, QTimer
 
 from truba_gui.core.i18n import t
 from truba_gui.services.putty_manager import ensure_plink_available
@@ -10,11 +11,17 @@ from truba_gui.services.x11_system_ssh import (
     build_x11_launch,
     is_likely_x11_gui_command,
     is_likely_x11_related_command,
+    is_silent_x11_gui_command,
     wrap_remote_cmd_clean_env,
 )
 from truba_gui.services.xserver_manager import ensure_x_server_running, stop_x_server_started_by_app
 
 
+# Chatty X11 programs fire readyRead many times per second; output is
+# buffered per process/stream and logged once per window.
+_IO_FLUSH_MS = 50
+
+
 class X11Runner:
     """Single-responsibility X11 execution manager.
 
@@ -28,6 +35,11 @@ class X11Runner:
         self._log = log_cb
         self._parent = parent
         self._bg_procs: list[QProcess] = []
+        self._pending_io: dict[tuple[QProcess, bool], bytearray] = {}
+        self._io_flush_scheduled = False
+        # One incremental decoder per stream keeps multi-byte UTF-8 glyphs
+        # split across reads intact.
+        self._decoders: dict[tuple[QProcess, bool], codecs.IncrementalDecoder] = {}
 
     def preflight(self, *, enabled: bool, parent=None, allow_download: bool = True) -> bool:
         if not enabled:
@@ -89,29 +101,50 @@ class X11Runner:
         proc.setProgram(launch.program)
         proc.setArguments(launch.args)
         proc.readyReadStandardError.connect(lambda: self._append_process_io(proc, err=True))
-        proc.readyReadStandardOutput.connect(lambda: self._append_process_io(proc, err=False))
+        if is_silent_x11_gui_command(cmd):
+            # Known GUI-only programs: let the OS discard stdout instead of
+            # piping every byte through Python. stderr stays visible.
+            proc.setStandardOutputFile(QProcess.nullDevice())
+        else:
+            proc.readyReadStandardOutput.connect(lambda: self._append_process_io(proc, err=False))
 
-        cmd_show = " ".join([launch.program] + launch.args)
+        cmd_show = " ".join((launch.program, *launch.args))
 
-        def _on_finished(code, _status):
-            self._log(t("login.x11_finished").format(code=code))
+        pid = 0
+
+        def _forget() -> None:
+            # Only live processes stay tracked; a finished or never-started
+            # one is dropped and freed together with its connected closures.
             try:
                 self._bg_procs.remove(proc)
-            except Exception:
-                pass
+            except ValueError:
+                return
             try:
                 from truba_gui.services.process_registry import unregister
 
-                pid = int(proc.processId() or 0)
                 if pid:
                     unregister(pid)
             except Exception:
                 pass
+            proc.deleteLater()
+
+        def _on_finished(code, _status):
+            self._flush_process_io(finished=proc)
+            self._log(t("login.x11_finished").format(code=code))
+            _forget()
+
+        def _on_error(error):
+            # FailedToStart never emits finished.
+            if error == QProcess.ProcessError.FailedToStart:
+                self._log(f"X11: {proc.errorString()}")
+                _forget()
 
         def _on_started():
+            nonlocal pid
             try:
                 from truba_gui.services.process_registry import register
 
+                # Read now: processId() is 0 once the process has exited.
                 pid = int(proc.processId() or 0)
                 if pid:
                     register(pid, kind=f"x11_{launch.backend}", cmd=cmd_show)
@@ -119,6 +152,7 @@ class X11Runner:
                 pass
 
         proc.finished.connect(_on_finished)
+        proc.errorOccurred.connect(_on_error)
         proc.started.connect(_on_started)
         self._log(t("login.x11_started").format(cmd=cmd_show))
         self._bg_procs.append(proc)
@@ -126,9 +160,16 @@ class X11Runner:
         return True
 
     def shutdown(self, *, close_x11_procs: bool, close_vcxsrv: bool) -> None:
+        self._flush_process_io()
+        self._decoders.clear()
         if close_x11_procs:
             for p in list(self._bg_procs):
+                # Cleanup happens right here; keep the per-process finished
+                # handler from logging and unregistering a second time.
+                p.blockSignals(True)
+                pid = 0
                 try:
+                    pid = int(p.processId() or 0)
                     if p.state() != QProcess.ProcessState.NotRunning:
                         p.terminate()
                         p.waitForFinished(1000)
@@ -137,7 +178,6 @@ class X11Runner:
                 try:
                     from truba_gui.services.process_registry import unregister
 
-                    pid = int(p.processId() or 0)
                     if pid:
                         unregister(pid)
                 except Exception:
@@ -151,10 +191,32 @@ class X11Runner:
                 pass
 
     def _append_process_io(self, proc: QProcess, *, err: bool) -> None:
-        data = bytes(proc.readAllStandardError() if err else proc.readAllStandardOutput()).decode(errors="replace")
-        if not data.strip():
+        data = (proc.readAllStandardError() if err else proc.readAllStandardOutput()).data()
+        if not data:
             return
-        if err:
-            self._log(t("login.stderr").format(data=data.rstrip()))
-        else:
-            self._log(data.rstrip())
+        self._pending_io.setdefault((proc, err), bytearray()).extend(data)
+        if not self._io_flush_scheduled:
+            self._io_flush_scheduled = True
+            QTimer.singleShot(_IO_FLUSH_MS, self._flush_process_io)
+
+    def _flush_process_io(self, finished: QProcess | None = None) -> None:
+        self._io_flush_scheduled = False
+        pending, self._pending_io = self._pending_io, {}
+        if finished is not None:
+            for key in (k for k in list(self._decoders) if k[0] is finished):
+                pending.setdefault(key, bytearray())
+        for key, buf in pending.items():
+            proc, err = key
+            decoder = self._decoders.get(key)
+            if decoder is None:
+                decoder = self._decoders[key] = codecs.getincrementaldecoder("utf-8")(errors="replace")
+            final = proc is finished
+            data = decoder.decode(buf, final=final).rstrip()
+            if final:
+                del self._decoders[key]
+            if not data:
+                continue
+            if err:
+                self._log(t("login.stderr").format(data=data))
+            else:
+                self._log(data)
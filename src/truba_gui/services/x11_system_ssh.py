@@ -56,6 +56,39 @@ def _find_plink_program() -> Optional[str]:
     return shutil.which("plink")
 
 
+def _ssh_control_dir() -> Optional[Path]:
+    """Private directory for OpenSSH ControlMaster sockets (mode 0700)."""
+    try:
+        from truba_gui.core.paths import app_data_dir
+
+        d = app_data_dir() / "ssh-mux"
+        d.mkdir(parents=True, exist_ok=True)
+        os.chmod(d, 0o700)
+        return d
+    except Exception:
+        return None
+
+
+def _ssh_multiplex_args() -> List[str]:
+    """OpenSSH options that share one master connection across X11 launches.
+
+    The first launch becomes the master (ControlMaster=auto) and stays alive
+    for ControlPersist after its command exits, so later launches open a
+    channel on the existing connection instead of a full handshake.
+    Win32-OpenSSH has no ControlMaster support, so Windows is skipped.
+    """
+    if platform.system().lower() == "windows":
+        return []
+    control_dir = _ssh_control_dir()
+    if control_dir is None:
+        return []
+    return [
+        "-o", "ControlMaster=auto",
+        "-o", f"ControlPath={control_dir / 'truba-ssh-%r@%h:%p'}",
+        "-o", "ControlPersist=10m",
+    ]
+
+
 def wrap_remote_cmd_clean_env(cmd: str) -> str:
     """Run remote cmd in a login shell and avoid LD_LIBRARY_PATH issues.
 
@@ -100,6 +133,19 @@ def is_likely_x11_gui_command(cmd: str) -> bool:
     return False
 
 
+# GUI programs whose stdout carries nothing worth showing in the console.
+_SILENT_X11_PROGRAMS = {
+    "xclock", "xeyes", "xterm", "xcalc", "xlogo", "glxgears",
+    "firefox", "gedit", "nautilus",
+}
+
+
+def is_silent_x11_gui_command(cmd: str) -> bool:
+    """True for X11 GUI commands whose stdout can be discarded unread."""
+    parts = cmd.strip().lower().split()
+    return bool(parts) and parts[0] in _SILENT_X11_PROGRAMS
+
+
 def build_x11_launch(
     host: str,
     port: int,
@@ -116,7 +162,8 @@ def build_x11_launch(
     # If password auth is used, prefer plink on Windows (OpenSSH will prompt on a hidden console and hang).
     plink_prog = _find_plink_program()
     if platform.system().lower() == "windows" and password and plink_prog:
-        args = ["-ssh", "-X", "-P", str(port), "-batch", "-pw", password]
+        # -share: PuTTY connection sharing, plink's counterpart of ControlMaster.
+        args = ["-ssh", "-X", "-share", "-P", str(port), "-batch", "-pw", password]
         if key_path:
             args += ["-i", key_path]
         args.append(f"{user}@{host}")
@@ -131,6 +178,7 @@ def build_x11_launch(
         # Make failures explicit and non-interactive by default
         strict_mode = "yes" if (host_key_policy or "").strip().lower() == "strict" else "accept-new"
         args += ["-o", "ExitOnForwardFailure=yes", "-o", "ForwardX11=yes", "-o", f"StrictHostKeyChecking={strict_mode}"]
+        args += _ssh_multiplex_args()
         if password:
             # Don't attempt password auth here; it will prompt in a hidden console.
             args += ["-o", "BatchMode=yes"]
@@ -142,7 +190,7 @@ def build_x11_launch(
 
     if plink_prog:
         # plink supports -X for X11; -ssh is implied in modern versions but add
-        args = ["-ssh", "-X", "-P", str(port), "-batch"]
+        args = ["-ssh", "-X", "-share", "-P", str(port), "-batch"]
         if password:
             args += ["-pw", password]
         if key_path:
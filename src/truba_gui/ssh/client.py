@@ -15,6 +15,10 @@ from truba_gui.core.logging import get_logger
 from truba_gui.services.command_history_store import is_sensitive_command
 
 
+# Keep idle sessions alive through NAT/firewalls between polls, so the
+# single authenticated transport is not silently dropped and re-handshaked.
+_KEEPALIVE_INTERVAL_S = 30
+
 _ACS_MAP = {
     "j": "┘",
     "k": "┐",
@@ -95,6 +99,10 @@ def _sanitize_terminal_text(text: str) -> str:
     return "".join(out)
 
 
+def _recv_all(recv: Callable[[int], bytes]) -> bytes:
+    return b"".join(iter(lambda: recv(32768), b""))
+
+
 @dataclass
 class SSHConnInfo:
     host: str
@@ -196,6 +204,10 @@ class SSHClientWrapper:
             )
         transport = self.client.get_transport()
         if transport is not None:
+            try:
+                transport.set_keepalive(_KEEPALIVE_INTERVAL_S)
+            except Exception:
+                pass
             banner = transport.get_banner()
             if banner:
                 if isinstance(banner, bytes):
@@ -208,6 +220,42 @@ class SSHClientWrapper:
         self.sftp = self.client.open_sftp()
         self.log("SSH: connected, SFTP ready")
 
+    def is_active(self) -> bool:
+        """Return True while the authenticated transport is still usable."""
+        if self.client is None:
+            return False
+        try:
+            transport = self.client.get_transport()
+        except Exception:
+            return False
+        if transport is None or not transport.is_active():
+            return False
+        is_authenticated = getattr(transport, "is_authenticated", None)
+        return not callable(is_authenticated) or bool(is_authenticated())
+
+    def can_reuse_for(self, info: SSHConnInfo) -> bool:
+        """Whether this live connection already serves ``info``'s target.
+
+        Reconnecting to the same endpoint with the same identity can keep the
+        existing transport (and its shell/SFTP channels) instead of paying a
+        new TCP + key exchange + authentication round trip.  A wrapper whose
+        interactive shell has died is not reused, so reconnecting recovers it.
+        """
+        current = self.info
+        if current is None or not self.is_active():
+            return False
+        channel = self._shell_channel
+        if channel is None or getattr(channel, "closed", False):
+            return False
+        return (
+            current.host == info.host
+            and int(current.port) == int(info.port)
+            and (current.username or "") == (info.username or "")
+            and (current.key_path or "") == (info.key_path or "")
+            and (current.host_key_policy or "") == (info.host_key_policy or "")
+            and bool(current.x11_forwarding) == bool(info.x11_forwarding)
+        )
+
     def _start_shell_session(self) -> None:
         if not self.client:
             return
@@ -413,6 +461,21 @@ class SSHClientWrapper:
                 except Exception:
                     pass
 
+    def _open_exec_channel(self, command: str, timeout_s: Optional[float]):
+        """Run ``command`` on a fresh session channel of the live transport.
+
+        The channel is read directly and closed by ``run``, without the
+        file objects ``SSHClient.exec_command`` wraps around it.
+        """
+        transport = self.client.get_transport() if self.client else None
+        if transport is None or not transport.is_active():
+            raise RuntimeError("SSH transport is not active")
+        chan = transport.open_session()
+        if timeout_s is not None:
+            chan.settimeout(timeout_s)
+        chan.exec_command(command)
+        return chan
+
     def run(
         self,
         command: str,
@@ -428,23 +491,22 @@ class SSHClientWrapper:
             self.log("SSH$ <redacted>")
         else:
             self.log(f"SSH$ {command}")
-        stdin, stdout, stderr = self.client.exec_command(command)
-        if timeout_s is not None:
-            try:
-                stdout.channel.settimeout(timeout_s)
-                stderr.channel.settimeout(timeout_s)
-            except Exception:
-                pass
+        chan = self._open_exec_channel(command, timeout_s)
         try:
-            out = stdout.read().decode(errors="replace")
-            err = stderr.read().decode(errors="replace")
-            code = stdout.channel.recv_exit_status()
+            out = _recv_all(chan.recv).decode(errors="replace")
+            err = _recv_all(chan.recv_stderr).decode(errors="replace")
+            code = chan.recv_exit_status()
             timed_out = False
         except socket.timeout:
             out = ""
             err = ""
             code = 124
             timed_out = True
+        finally:
+            try:
+                chan.close()
+            except Exception:
+                pass
         if log_output and out.strip():
             self.log(_sanitize_terminal_text(out).rstrip("\n"))
         if log_output and err.strip():
@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+from PySide6.QtWidgets import (
+    QDialog,
+    QDialogButtonBox,
+    QFormLayout,
+    QLabel,
+    QLineEdit,
+    QVBoxLayout,
+)
+
+from truba_gui.core.i18n import t, tr
+
+
+class MasterPasswordDialog(QDialog):
+    """Ask for the master password, optionally with a confirmation field.
+
+    Both fields live in one modal dialog, so saving a profile takes a single
+    round trip instead of two stacked input prompts.
+    """
+
+    def __init__(self, parent=None, *, confirm: bool = False) -> None:
+        super().__init__(parent)
+        self.setWindowTitle(tr("login.master_title", "Encryption Password"))
+        self._confirm = confirm
+
+        root = QVBoxLayout(self)
+        prompt = QLabel(
+            tr(
+                "login.master_prompt",
+                "Enter a master password to encrypt/decrypt saved passwords.",
+            )
+        )
+        prompt.setWordWrap(True)
+        root.addWidget(prompt)
+
+        form = QFormLayout()
+        self.password = QLineEdit()
+        self.password.setEchoMode(QLineEdit.EchoMode.Password)
+        form.addRow(tr("login.master_password", "Master password:"), self.password)
+        self.password_confirm = QLineEdit()
+        self.password_confirm.setEchoMode(QLineEdit.EchoMode.Password)
+        if confirm:
+            form.addRow(
+                tr("login.master_confirm", "Repeat (verification):"),
+                self.password_confirm,
+            )
+        root.addLayout(form)
+
+        self.error = QLabel()
+        self.error.setStyleSheet("color: #b00020;")
+        self.error.setVisible(False)
+        root.addWidget(self.error)
+
+        buttons = QDialogButtonBox(
+            QDialogButtonBox.StandardButton.Ok
+            | QDialogButtonBox.StandardButton.Cancel
+        )
+        buttons.accepted.connect(self.validate)
+        buttons.rejected.connect(self.reject)
+        root.addWidget(buttons)
+
+    def value(self) -> str:
+        return self.password.text().strip()
+
+    def validate(self) -> None:
+        pw = self.value()
+        if not pw:
+            self._show_error(t("login.err_master_empty"))
+            self.password.setFocus()
+            return
+        if self._confirm and self.password_confirm.text().strip() != pw:
+            self._show_error(t("login.err_master_mismatch"))
+            self.password_confirm.clear()
+            self.password_confirm.setFocus()
+            return
+        self.accept()
+
+    def _show_error(self, text: str) -> None:
+        self.error.setText(text)
+        self.error.setVisible(True)
@@ -114,7 +114,7 @@ class QuickTourOverlay(QWidget):
                 title=t("tour.s6_title"),
                 body=t("tour.s6_body"),
                 target_getter=lambda: getattr(m.logs, "btn_diag", None),
-                tab_index=m.tabs.indexOf(m.logs),
+                tab_index=m.tabs.indexOf(m.logs_tab),
             ),
         ]
 
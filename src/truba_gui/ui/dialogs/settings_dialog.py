@@ -31,18 +31,13 @@ from truba_gui.config.storage import (
     set_file_association,
     update_settings,
 )
-from truba_gui.core.i18n import t
+from truba_gui.core.i18n import t, tr
 from truba_gui.config.system_profile import (
     normalize_system_settings,
     truba_default_remote_paths,
 )
 
 
-def _tr(key: str, fallback: str) -> str:
-    value = t(key)
-    return fallback if value == f"[{key}]" else value
-
-
 class SettingsDialog(QDialog):
     def __init__(
         self,
@@ -105,7 +100,7 @@ class SettingsDialog(QDialog):
         self.sp_transfer_parallelism.setToolTip(t("settings.transfer_parallelism_tip"))
 
         self.cb_upload_preflight_confirmation = QCheckBox(
-            _tr(
+            tr(
                 "settings.upload_preflight_confirmation_label",
                 "Show upload plan confirmation",
             )
@@ -206,8 +201,8 @@ class SettingsDialog(QDialog):
         )
         self.btn_apply = self.buttons.button(QDialogButtonBox.StandardButton.Apply)
         self.btn_close = self.buttons.button(QDialogButtonBox.StandardButton.Close)
-        self.btn_apply.setText(_tr("settings.apply", "Apply"))
-        self.btn_close.setText(_tr("common.close", "Close"))
+        self.btn_apply.setText(tr("settings.apply", "Apply"))
+        self.btn_close.setText(tr("common.close", "Close"))
         self.btn_apply.clicked.connect(self._apply_settings)
         self.btn_close.clicked.connect(self.reject)
 
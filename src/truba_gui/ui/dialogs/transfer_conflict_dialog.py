@@ -17,12 +17,7 @@ from PySide6.QtWidgets import (
     QWidget,
 )
 
-from truba_gui.core.i18n import t
-
-
-def _tr(key: str, fallback: str) -> str:
-    value = t(key)
-    return fallback if value == f"[{key}]" else value
+from truba_gui.core.i18n import tr
 
 
 _ACTION_FALLBACKS = {
@@ -71,7 +66,7 @@ class TransferConflictDialog(QDialog):
     ) -> None:
         super().__init__(parent)
         self.setWindowTitle(
-            _tr("transfer.conflict_title", "Target file already exists")
+            tr("transfer.conflict_title", "Target file already exists")
         )
         self._source = source
         self._target = target
@@ -81,7 +76,7 @@ class TransferConflictDialog(QDialog):
         root.setSpacing(8)
         root.addWidget(
             QLabel(
-                _tr(
+                tr(
                     "transfer.conflict_intro",
                     "The target file already exists.\nPlease choose an action.",
                 )
@@ -91,20 +86,21 @@ class TransferConflictDialog(QDialog):
         body = QHBoxLayout()
         file_col = QVBoxLayout()
         file_col.setSpacing(6)
-        file_col.addWidget(self._file_block(_tr("transfer.source_file", "Source file:"), source))
+        self._file_labels: list[tuple[QLabel, QLabel]] = []
+        file_col.addWidget(self._file_block(tr("transfer.source_file", "Source file:"), source))
         file_col.addSpacing(8)
-        file_col.addWidget(self._file_block(_tr("transfer.target_file", "Target file:"), target))
+        file_col.addWidget(self._file_block(tr("transfer.target_file", "Target file:"), target))
         file_col.addStretch(1)
         body.addLayout(file_col, 1)
 
         right_col = QVBoxLayout()
-        action_box = QGroupBox(_tr("transfer.conflict_action", "Action:"))
+        action_box = QGroupBox(tr("transfer.conflict_action", "Action:"))
         action_layout = QVBoxLayout(action_box)
         action_layout.setSpacing(4)
         self.action_buttons: dict[str, QRadioButton] = {}
         for action in self.ACTIONS:
             button = QRadioButton(
-                _tr(f"transfer.conflict_{action}", _ACTION_FALLBACKS[action])
+                tr(f"transfer.conflict_{action}", _ACTION_FALLBACKS[action])
             )
             self.action_buttons[action] = button
             action_layout.addWidget(button)
@@ -115,13 +111,13 @@ class TransferConflictDialog(QDialog):
         options.setSpacing(4)
         options.setContentsMargins(0, 4, 0, 0)
         self.cb_always = QCheckBox(
-            _tr("transfer.conflict_always_use", "Always use this action")
+            tr("transfer.conflict_always_use", "Always use this action")
         )
         self.cb_queue_only = QCheckBox(
-            _tr("transfer.conflict_current_queue_only", "Apply to current queue only")
+            tr("transfer.conflict_current_queue_only", "Apply to current queue only")
         )
         self.cb_downloads_only = QCheckBox(
-            _tr("transfer.conflict_downloads_only", "Apply only to downloads")
+            tr("transfer.conflict_downloads_only", "Apply only to downloads")
         )
         options.addWidget(self.cb_always)
         options.addWidget(self.cb_queue_only)
@@ -158,10 +154,29 @@ class TransferConflictDialog(QDialog):
             self.style().standardIcon(QStyle.StandardPixmap.SP_FileIcon).pixmap(24, 24)
         )
         detail_row.addWidget(icon_label)
-        detail_row.addWidget(QLabel(self._format_info(info)), 1)
+        info_label = QLabel(self._format_info(info))
+        detail_row.addWidget(info_label, 1)
         layout.addLayout(detail_row)
+        self._file_labels.append((path_label, info_label))
         return container
 
+    def set_files(
+        self,
+        *,
+        source: TransferConflictInfo,
+        target: TransferConflictInfo,
+    ) -> None:
+        """Point the dialog at another conflict and restore default choices."""
+        self._source = source
+        self._target = target
+        self._accepted = False
+        for (path_label, info_label), info in zip(self._file_labels, (source, target)):
+            path_label.setText(info.path)
+            info_label.setText(self._format_info(info))
+        self.action_buttons["overwrite"].setChecked(True)
+        for checkbox in (self.cb_always, self.cb_queue_only, self.cb_downloads_only):
+            checkbox.setChecked(False)
+
     @staticmethod
     def _format_time(ts: int | None) -> str:
         if not ts:
@@ -188,7 +203,7 @@ class TransferConflictDialog(QDialog):
 
     @classmethod
     def _format_info(cls, info: TransferConflictInfo) -> str:
-        return _tr("transfer.conflict_file_info", "{size}\n{mtime}").format(
+        return tr("transfer.conflict_file_info", "{size}\n{mtime}").format(
             size=cls._format_size(info.size),
             mtime=cls._format_time(info.mtime),
         )
@@ -211,15 +226,7 @@ class TransferConflictDialog(QDialog):
         self._accepted = True
         super().accept()
 
-    @classmethod
-    def get_decision(
-        cls,
-        parent,
-        *,
-        source: TransferConflictInfo,
-        target: TransferConflictInfo,
-    ) -> TransferConflictDecision:
-        dialog = cls(parent, source=source, target=target)
-        if dialog.exec() != QDialog.DialogCode.Accepted:
+    def ask(self) -> TransferConflictDecision:
+        if self.exec() != QDialog.DialogCode.Accepted:
             return TransferConflictDecision(action="cancel")
-        return dialog.decision()
+        return self.decision()
@@ -24,12 +24,11 @@ from PySide6.QtWidgets import (
     QVBoxLayout,
 )
 
-from truba_gui.core.i18n import t
+from truba_gui.core.i18n import t, tr
 
 
-def _tr(key: str, fallback: str) -> str:
-    value = t(key)
-    return fallback if value == f"[{key}]" else value
+# Minimum spacing between per-item "Running: ..." status updates.
+_ITEM_STATS_INTERVAL_S = 1 / 30
 
 
 @dataclass
@@ -59,14 +58,14 @@ class TransferPreflightDialog(QDialog):
         super().__init__(parent)
         self.setModal(True)
         self.setWindowTitle(
-            _tr("transfer.preflight_title", "Confirm upload plan")
+            tr("transfer.preflight_title", "Confirm upload plan")
         )
         self._items = list(items)
 
         file_count = sum(item.op == "upload" for item in self._items)
         folder_count = sum(item.op == "mkdir_remote" for item in self._items)
         self.lbl_summary = QLabel(
-            _tr(
+            tr(
                 "transfer.preflight_summary",
                 "{files} files, {folders} folder steps, {steps} total steps. "
                 "Up to {parallel} transfers will run at once.",
@@ -83,15 +82,15 @@ class TransferPreflightDialog(QDialog):
         self.plan_list.setColumnCount(3)
         self.plan_list.setHeaderLabels(
             [
-                _tr("transfer.preflight_operation", "Operation"),
-                _tr("transfer.preflight_source", "Source"),
-                _tr("transfer.preflight_destination", "Destination"),
+                tr("transfer.preflight_operation", "Operation"),
+                tr("transfer.preflight_source", "Source"),
+                tr("transfer.preflight_destination", "Destination"),
             ]
         )
         operation_labels = {
-            "upload": _tr("transfer.preflight_upload", "Upload"),
-            "mkdir_remote": _tr("transfer.preflight_create_folder", "Create folder"),
-            "delete": _tr("transfer.preflight_delete", "Delete existing"),
+            "upload": tr("transfer.preflight_upload", "Upload"),
+            "mkdir_remote": tr("transfer.preflight_create_folder", "Create folder"),
+            "delete": tr("transfer.preflight_delete", "Delete existing"),
         }
         for item in self._items:
             QTreeWidgetItem(
@@ -111,12 +110,12 @@ class TransferPreflightDialog(QDialog):
         )
         self.btn_start = self.buttons.button(QDialogButtonBox.StandardButton.Ok)
         self.btn_cancel = self.buttons.button(QDialogButtonBox.StandardButton.Cancel)
-        self.btn_start.setText(_tr("transfer.preflight_start", "Start transfer"))
-        self.btn_cancel.setText(_tr("common.cancel", "Cancel"))
+        self.btn_start.setText(tr("transfer.preflight_start", "Start transfer"))
+        self.btn_cancel.setText(tr("common.cancel", "Cancel"))
         self.buttons.accepted.connect(self.accept)
         self.buttons.rejected.connect(self.reject)
         self.cb_dont_ask_again = QCheckBox(
-            _tr("transfer.preflight_dont_ask_again", "Don't ask again")
+            tr("transfer.preflight_dont_ask_again", "Don't ask again")
         )
 
         root = QVBoxLayout(self)
@@ -150,7 +149,7 @@ class _TransferWorker(QObject):
         total = len(self._items)
         for idx, item in enumerate(self._items, start=1):
             if self._cancel:
-                self.finished.emit(item, True, t("dirs.cancelled") if t("dirs.cancelled") != "[dirs.cancelled]" else "Cancelled.")
+                self.finished.emit(item, True, tr("dirs.cancelled", "Cancelled."))
                 return
             self.progress.emit(idx, item)
             try:
@@ -205,7 +204,7 @@ class TransferDialog(QDialog):
         self._active_items: List[TransferItem] = []
 
         self.lbl_status = QLabel(self._status_text())
-        self.lbl_transfer_stats = QLabel(_tr("transfer.no_active_transfer", "No active transfer."))
+        self.lbl_transfer_stats = QLabel(tr("transfer.no_active_transfer", "No active transfer."))
 
         self.tabs = QTabWidget()
         self.queue_list = QListWidget()
@@ -223,7 +222,7 @@ class TransferDialog(QDialog):
 
         self.btn_stop = QPushButton(t("transfer.stop"))
         self.btn_cancel = QPushButton(t("transfer.cancel"))
-        self.btn_clear_pending = QPushButton(_tr("transfer.clear_pending", "Clear queued"))
+        self.btn_clear_pending = QPushButton(tr("transfer.clear_pending", "Clear queued"))
         self.btn_retry = QPushButton(t("transfer.retry_failed"))
         self.btn_close = QPushButton(t("common.close"))
         self.btn_stop.clicked.connect(self.cancel_all)
@@ -244,7 +243,7 @@ class TransferDialog(QDialog):
         root.addWidget(self.lbl_status)
         root.addWidget(self.lbl_transfer_stats)
         self.lbl_parallel_hint = QLabel(
-            _tr(
+            tr(
                 "transfer.parallel_hint",
                 "Configured parallel transfer limit: {limit}",
             ).format(limit=self._parallel_limit)
@@ -257,6 +256,10 @@ class TransferDialog(QDialog):
         self._worker = None
         self._worker_state = {"cancelled": False, "error": ""}
         self._refresh_scheduled = False
+        # "Running: ..." text for small items arrives once per item; hold
+        # back bursts and publish the latest with the scheduled refresh.
+        self._pending_stats_text: str | None = None
+        self._last_item_stats_at = 0.0
 
     def set_parallel_limit(self, parallel_limit: int) -> int:
         """Set queue concurrency without exceeding the backend-safe cap."""
@@ -264,7 +267,7 @@ class TransferDialog(QDialog):
         self._parallel_limit = min(requested, self._max_parallel_limit)
         if hasattr(self, "lbl_parallel_hint"):
             self.lbl_parallel_hint.setText(
-                _tr(
+                tr(
                     "transfer.parallel_hint",
                     "Configured parallel transfer limit: {limit}",
                 ).format(limit=self._parallel_limit)
@@ -315,8 +318,15 @@ class TransferDialog(QDialog):
 
     def _run_scheduled_refresh(self) -> None:
         self._refresh_scheduled = False
+        if self._pending_stats_text is not None:
+            self._publish_stats(self._pending_stats_text)
         self._refresh()
 
+    def _publish_stats(self, text: str) -> None:
+        self._pending_stats_text = None
+        self.lbl_transfer_stats.setText(text)
+        self.transferStatsChanged.emit(text)
+
     def start(self) -> None:
         if self._running or self._active_items or self._active_item is not None:
             return
@@ -350,9 +360,13 @@ class TransferDialog(QDialog):
         if item not in self._active_items:
             self._active_items.append(item)
         self._active_item = self._active_items[0] if self._active_items else item
-        text = _tr("transfer.active_item", "Running: {item}").format(item=item.label())
-        self.lbl_transfer_stats.setText(text)
-        self.transferStatsChanged.emit(text)
+        text = tr("transfer.active_item", "Running: {item}").format(item=item.label())
+        now = time.monotonic()
+        if now - self._last_item_stats_at < _ITEM_STATS_INTERVAL_S:
+            self._pending_stats_text = text
+        else:
+            self._last_item_stats_at = now
+            self._publish_stats(text)
         try:
             self._pending.remove(item)
         except ValueError:
@@ -396,7 +410,7 @@ class TransferDialog(QDialog):
         remaining = max(0, int(total) - int(done)) if total else 0
         eta = remaining / speed if speed > 0 and total else 0
 
-        text = _tr(
+        text = tr(
             "transfer.progress_detail",
             "{item} — {done}/{total}, {speed}, remaining {eta}",
         ).format(
@@ -406,8 +420,7 @@ class TransferDialog(QDialog):
             speed=f"{_format_size(speed)}/s",
             eta=_format_duration(eta) if total else "?",
         )
-        self.lbl_transfer_stats.setText(text)
-        self.transferStatsChanged.emit(text)
+        self._publish_stats(text)
         self.transferProgressChanged.emit(item, done, total)
 
     @Slot()
@@ -415,14 +428,12 @@ class TransferDialog(QDialog):
         self._running = False
         self._refresh()
         if self._stopped and self._pending:
-            text = _tr("transfer.stopped_after_current", "Stopped after the current transfer.")
-            self.lbl_transfer_stats.setText(text)
-            self.transferStatsChanged.emit(text)
+            text = tr("transfer.stopped_after_current", "Stopped after the current transfer.")
+            self._publish_stats(text)
             return
         if self._cancelled:
-            text = _tr("transfer.cancelled", "Transfer cancelled.")
-            self.lbl_transfer_stats.setText(text)
-            self.transferStatsChanged.emit(text)
+            text = tr("transfer.cancelled", "Transfer cancelled.")
+            self._publish_stats(text)
             return
         if not self._errors and not self._stopped and not self._cancelled and not self._pending:
             self._finished_cleanly = True
@@ -563,12 +574,20 @@ class TransferDialog(QDialog):
     def finished_cleanly(self) -> bool:
         return self._finished_cleanly and not self._errors
 
+    def unfinished_items(self) -> List[TransferItem]:
+        """Items that are still running or waiting in the queue."""
+        return list(self._active_items) + list(self._pending)
+
     def reject(self) -> None:  # type: ignore[override]
         self.cancel_all()
         super().reject()
 
 
 class _WorkerThread(QObject):
+    # Paramiko reports progress every 32 KiB; forward at most ~30 updates a
+    # second per item to the GUI thread, plus the final one.
+    _PROGRESS_INTERVAL_S = 1 / 30
+
     item_started = Signal(int, object)
     item_finished = Signal(object, bool, str)
     transfer_progress = Signal(object, object, object)
@@ -679,10 +698,19 @@ class _WorkerThread(QObject):
 
     def _run_one(self, item: TransferItem) -> tuple[TransferItem, bool, str]:
         try:
+            last_emit = [0.0]
+
             def progress(done: int, total: int, current=item) -> None:
                 cancel, _stop, _clear = self._state()
                 if cancel:
                     raise _TransferCancelled()
+                now = time.monotonic()
+                if (
+                    now - last_emit[0] < self._PROGRESS_INTERVAL_S
+                    and not (total and done >= total)
+                ):
+                    return
+                last_emit[0] = now
                 self.transfer_progress.emit(current, int(done), int(total))
 
             self._run_item(item, progress)
@@ -691,9 +719,7 @@ class _WorkerThread(QObject):
             return (
                 item,
                 True,
-                t("dirs.cancelled")
-                if t("dirs.cancelled") != "[dirs.cancelled]"
-                else "Cancelled.",
+                tr("dirs.cancelled", "Cancelled."),
             )
         except Exception as exc:
             return item, False, str(exc)
@@ -735,6 +761,10 @@ class _WorkerThread(QObject):
                         # Barrier: wait for the active transfer batch before
                         # running a later mkdir or other remote mutation.
                         break
+                    if any(active.dst == item.dst for active in futures.values()):
+                        # Same target as an in-flight transfer: keep queue
+                        # order instead of writing one file from two threads.
+                        break
                     next_index += 1
                     if self._is_removed(item):
                         continue
@@ -7,7 +7,7 @@ from PySide6.QtWidgets import (
 from PySide6.QtWidgets import (
     QMenu, QToolButton, QWidget, QSizePolicy, QHBoxLayout, QLabel
 )
-from PySide6.QtGui import QAction, QIcon, QPixmap, QPainter, QColor
+from PySide6.QtGui import QAction, QIcon, QImage, QPixmap, QPainter, QColor
 from PySide6.QtCore import QObject, QThread, QThreadPool, QTimer, Qt, QSize, Signal, Slot
 from PySide6.QtSvg import QSvgRenderer
 
@@ -17,7 +17,7 @@ from truba_gui.config.storage import (
     set_last_seen_changelog_version,
 )
 from truba_gui.core.paths import is_frozen_exe
-from truba_gui.core.i18n import t, set_language
+from truba_gui.core.i18n import t, tr, set_language
 from truba_gui.services.changelog import chronological_changelog, load_changelog_text
 from truba_gui.services.app_updater import (
     download_and_verify_release,
@@ -29,9 +29,9 @@ from .widgets.login_widget import LoginWidget
 from .widgets.jobs_outputs_widget import JobsOutputsWidget
 from .widgets.directories_widget import DirectoriesWidget
 from .widgets.ftp_widget import FtpWidget
+from .widgets.remote_dir_panel import wait_for_retired_threads
 from .widgets.editor_widget import EditorWidget
 from .widgets.logs_widget import LogsWidget
-from .dialogs.help_dialog import HelpDialog
 from .dialogs.settings_dialog import SettingsDialog
 from truba_gui.config.storage import (
     SBATCH_FOLLOW_MODE_NEW_TABS_SPLIT,
@@ -42,6 +42,11 @@ from .dialogs.quick_tour import QuickTourOverlay
 from .async_call import AsyncCall
 
 
+# Flag icons depend only on the country code; they are rebuilt on every
+# retranslate otherwise. QPixmap needs a QApplication, so fill lazily.
+_FLAG_ICONS: dict[str, QIcon] = {}
+
+
 class _BackgroundCall(QObject):
     finished = Signal(object)
     failed = Signal(str)
@@ -69,19 +74,21 @@ class MainWindow(QMainWindow):
         cc = (country_code or "").strip().lower()
         if cc == "en":
             cc = "gb"
+        cached = _FLAG_ICONS.get(cc)
+        if cached is not None:
+            return cached
+        icon = self._render_flag_icon(cc)
+        _FLAG_ICONS[cc] = icon
+        return icon
+
+    def _render_flag_icon(self, cc: str) -> QIcon:
         # Load SVG from: truba_gui/assets/flags/{cc}.svg
         try:
             from pathlib import Path
             base = Path(__file__).resolve().parent.parent  # ui -> truba_gui
             svg_path = base / "assets" / "flags" / f"{cc}.svg"
             if svg_path.exists():
-                renderer = QSvgRenderer(str(svg_path))
-                pm = QPixmap(18, 12)
-                pm.fill(Qt.transparent)
-                painter = QPainter(pm)
-                renderer.render(painter)
-                painter.end()
-                return QIcon(pm)
+                return self._svg_to_icon(svg_path, 18, 12)
         except Exception:
             pass
 
@@ -118,17 +125,22 @@ class MainWindow(QMainWindow):
         self.directories = DirectoriesWidget()
         self.ftp = FtpWidget()
         self.editor = EditorWidget()
-        self.logs = LogsWidget()
+        # The log viewer is built the first time its tab is opened; until
+        # then only an empty page sits in the tab bar.
+        self.logs: LogsWidget | None = None
+        self.logs_tab = QWidget()
+        QVBoxLayout(self.logs_tab).setContentsMargins(0, 0, 0, 0)
 
         self.tabs.addTab(self.login, t("tabs.login"))
         self.tabs.addTab(self.jobs_outputs, t("tabs.jobs_outputs"))
         self.tabs.addTab(self.directories, t("tabs.directories"))
         self.tabs.addTab(
             self.ftp,
-            t("tabs.ftp") if t("tabs.ftp") != "[tabs.ftp]" else "FTP",
+            tr("tabs.ftp", "FTP"),
         )
         self.tabs.addTab(self.editor, t("tabs.editor"))
-        self.tabs.addTab(self.logs, t("tabs.logs") if t("tabs.logs") != "[tabs.logs]" else "Logs")
+        self.tabs.addTab(self.logs_tab, tr("tabs.logs", "Logs"))
+        self.tabs.currentChanged.connect(self._ensure_lazy_tab)
         self.tabs.currentChanged.connect(self._sync_command_polling)
         self.jobs_outputs.polling_visibility_changed.connect(
             self._sync_command_polling
@@ -202,6 +214,12 @@ class MainWindow(QMainWindow):
             except Exception:
                 pass
 
+            # 3b) Give parked file-operation threads a bounded chance to finish
+            try:
+                wait_for_retired_threads(1500)
+            except Exception:
+                pass
+
             # 4) External processes (VcXsrv / X11 ssh/plink)
             try:
                 if hasattr(self, "login") and self.login and hasattr(self.login, "shutdown_external_processes"):
@@ -209,7 +227,15 @@ class MainWindow(QMainWindow):
             except Exception:
                 pass
 
-            # 5) Final marker for file log
+            # 5) Persist buffered history events
+            try:
+                from truba_gui.core.history import flush_events
+
+                flush_events()
+            except Exception:
+                pass
+
+            # 6) Final marker for file log
             try:
                 import logging
 
@@ -252,10 +278,9 @@ class MainWindow(QMainWindow):
         self._lang_btn.setToolButtonStyle(Qt.ToolButtonTextBesideIcon)
         self._lang_btn.setIconSize(QSize(20, 14))
         self._lang_btn.setMinimumWidth(220)
-        self._lang_btn.setStyleSheet(
-            "QToolButton { padding: 4px 12px; text-align: left; }"
-            "QToolButton::menu-indicator { subcontrol-position: right center; }"
-        )
+        # Styled by the application stylesheet (see app.main) so Qt does not
+        # keep a per-widget style sheet to re-resolve on every retranslate.
+        self._lang_btn.setObjectName("lang_btn")
 
         self._help_btn = QToolButton(self)
         self._help_btn.setToolButtonStyle(Qt.ToolButtonStyle.ToolButtonTextBesideIcon)
@@ -293,6 +318,17 @@ class MainWindow(QMainWindow):
         layout.addWidget(self._lang_btn)
         menubar.setCornerWidget(lang_container, Qt.TopRightCorner)
 
+    @staticmethod
+    def _svg_to_icon(svg_path, w: int, h: int) -> QIcon:
+        """Rasterize an SVG through QImage (always the raster engine)."""
+        renderer = QSvgRenderer(str(svg_path))
+        img = QImage(w, h, QImage.Format.Format_ARGB32_Premultiplied)
+        img.fill(0)
+        painter = QPainter(img)
+        renderer.render(painter)
+        painter.end()
+        return QIcon(QPixmap.fromImage(img))
+
     def _asset_svg_icon(self, rel_path: str, w: int = 18, h: int = 18) -> QIcon:
         """Render an SVG asset into a QIcon (stable across platforms)."""
         try:
@@ -300,19 +336,17 @@ class MainWindow(QMainWindow):
             base = Path(__file__).resolve().parent.parent  # ui -> truba_gui
             svg_path = base / rel_path
             if svg_path.exists():
-                renderer = QSvgRenderer(str(svg_path))
-                pm = QPixmap(w, h)
-                pm.fill(Qt.transparent)
-                painter = QPainter(pm)
-                renderer.render(painter)
-                painter.end()
-                return QIcon(pm)
+                return self._svg_to_icon(svg_path, w, h)
         except Exception:
             pass
         return QIcon()
 
     def _open_help(self):
         try:
+            # Imported lazily: the help dialog is rarely opened, so keep it
+            # out of the startup import graph.
+            from .dialogs.help_dialog import HelpDialog
+
             dlg = HelpDialog(self)
             dlg.exec()
         except Exception:
@@ -529,10 +563,10 @@ class MainWindow(QMainWindow):
             self.tabs.setTabText(self.tabs.indexOf(self.directories), t("tabs.directories"))
             self.tabs.setTabText(
                 self.tabs.indexOf(self.ftp),
-                t("tabs.ftp") if t("tabs.ftp") != "[tabs.ftp]" else "FTP",
+                tr("tabs.ftp", "FTP"),
             )
             self.tabs.setTabText(self.tabs.indexOf(self.editor), t("tabs.editor"))
-            self.tabs.setTabText(self.tabs.indexOf(self.logs), t("tabs.logs"))
+            self.tabs.setTabText(self.tabs.indexOf(self.logs_tab), t("tabs.logs"))
 
         # Language menu labels / selected language display
         if hasattr(self, "_act_tr"):
@@ -589,6 +623,11 @@ class MainWindow(QMainWindow):
                 except Exception:
                     pass
 
+    def _ensure_lazy_tab(self, index: int) -> None:
+        if self.logs is None and self.tabs.widget(index) is self.logs_tab:
+            self.logs = LogsWidget()
+            self.logs_tab.layout().addWidget(self.logs)
+
     def on_session_changed(self, session):
         self._job_poll_generation += 1
         self._job_poll_worker = None
@@ -12,7 +12,7 @@ from PySide6.QtWidgets import (
     QDialog, QPushButton, QPlainTextEdit, QFileDialog, QInputDialog, QDialogButtonBox
 )
 
-from truba_gui.core.i18n import t
+from truba_gui.core.i18n import t, tr
 from truba_gui.core.ui_errors import show_exception
 from truba_gui.core.history import append_event
 from truba_gui.config.system_profile import format_remote_path, normalize_system_settings
@@ -106,7 +106,7 @@ class DirectoriesWidget(QWidget):
         self.splitter.setStretchFactor(1, 1)
 
         self.btn_new_slurm = QPushButton(
-            t("dirs.new_slurm_edit") if t("dirs.new_slurm_edit") != "[dirs.new_slurm_edit]" else "Create/Edit ARF Slurm"
+            tr("dirs.new_slurm_edit", "Create/Edit ARF Slurm")
         )
         self.btn_new_slurm.clicked.connect(self.create_slurm_from_template)
 
@@ -183,7 +183,7 @@ class DirectoriesWidget(QWidget):
 
     def retranslate_ui(self):
         self.btn_new_slurm.setText(
-            t("dirs.new_slurm_edit") if t("dirs.new_slurm_edit") != "[dirs.new_slurm_edit]" else "Create/Edit ARF Slurm"
+            tr("dirs.new_slurm_edit", "Create/Edit ARF Slurm")
         )
         self.panel_scratch.retranslate_ui()
         self.panel_home.retranslate_ui()
@@ -242,9 +242,10 @@ class DirectoriesWidget(QWidget):
                     "error": "no valid job ID",
                 }
             )
-            message = t("dirs.submit_failed_no_job_id")
-            if message == "[dirs.submit_failed_no_job_id]":
-                message = "Submission returned no valid job ID. Check the script and Slurm response."
+            message = tr(
+                "dirs.submit_failed_no_job_id",
+                "Submission returned no valid job ID. Check the script and Slurm response.",
+            )
             if output:
                 message += f"\n\n{output}"
             QMessageBox.critical(self, t("common.error"), message)
@@ -260,9 +261,7 @@ class DirectoriesWidget(QWidget):
             }
         )
         self.script_submitted.emit(job_id, script_path)
-        message = t("dirs.submit_success")
-        if message == "[dirs.submit_success]":
-            message = "Submitted with sbatch. Job ID: {jobid}"
+        message = tr("dirs.submit_success", "Submitted with sbatch. Job ID: {jobid}")
         QMessageBox.information(
             self,
             t("common.info"),
@@ -280,9 +279,10 @@ class DirectoriesWidget(QWidget):
                 "error": error,
             }
         )
-        message = t("dirs.submit_failed")
-        if message == "[dirs.submit_failed]":
-            message = "sbatch submission failed: {err}\nCheck the connection and Slurm script directives."
+        message = tr(
+            "dirs.submit_failed",
+            "sbatch submission failed: {err}\nCheck the connection and Slurm script directives.",
+        )
         QMessageBox.critical(self, t("common.error"), message.format(err=error))
 
     def _create_shell_run_result_dialog(
@@ -329,9 +329,7 @@ class DirectoriesWidget(QWidget):
                 "result": output,
             }
         )
-        message = t("dirs.run_shell_success")
-        if message == "[dirs.run_shell_success]":
-            message = "Script completed in terminal."
+        message = tr("dirs.run_shell_success", "Script completed in terminal.")
         self._create_shell_run_result_dialog(script_path, message, output).exec()
 
     @Slot(object, str, str)
@@ -345,9 +343,7 @@ class DirectoriesWidget(QWidget):
                 "error": error,
             }
         )
-        message = t("dirs.run_shell_failed")
-        if message == "[dirs.run_shell_failed]":
-            message = "Script run failed: {err}"
+        message = tr("dirs.run_shell_failed", "Script run failed: {err}")
         QMessageBox.critical(self, t("common.error"), message.format(err=error))
 
     @staticmethod
@@ -384,8 +380,8 @@ class DirectoriesWidget(QWidget):
 
         name, ok = QInputDialog.getText(
             self,
-            t("dirs.new_slurm_name_title") if t("dirs.new_slurm_name_title") != "[dirs.new_slurm_name_title]" else "New Slurm Script",
-            t("dirs.new_slurm_name_label") if t("dirs.new_slurm_name_label") != "[dirs.new_slurm_name_label]" else "File name:",
+            tr("dirs.new_slurm_name_title", "New Slurm Script"),
+            tr("dirs.new_slurm_name_label", "File name:"),
             text="new_job.slurm",
         )
         if not ok:
@@ -408,7 +404,7 @@ class DirectoriesWidget(QWidget):
                 ans = QMessageBox.question(
                     self,
                     t("dirs.conflict_title"),
-                    (t("dirs.new_slurm_exists") if t("dirs.new_slurm_exists") != "[dirs.new_slurm_exists]" else "File already exists. Overwrite in editor?"),
+                    tr("dirs.new_slurm_exists", "File already exists. Overwrite in editor?"),
                     QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
                     QMessageBox.StandardButton.No,
                 )
@@ -420,15 +416,15 @@ class DirectoriesWidget(QWidget):
 
     def _pick_template_key(self) -> str:
         options = [
-            t("dirs.template_core") if t("dirs.template_core") != "[dirs.template_core]" else "Core template",
-            t("dirs.template_cpu") if t("dirs.template_cpu") != "[dirs.template_cpu]" else "CPU template",
-            t("dirs.template_gpu") if t("dirs.template_gpu") != "[dirs.template_gpu]" else "GPU template",
-            t("dirs.template_mpi") if t("dirs.template_mpi") != "[dirs.template_mpi]" else "MPI template",
+            tr("dirs.template_core", "Core template"),
+            tr("dirs.template_cpu", "CPU template"),
+            tr("dirs.template_gpu", "GPU template"),
+            tr("dirs.template_mpi", "MPI template"),
         ]
         choice, ok = QInputDialog.getItem(
             self,
-            t("dirs.template_select_title") if t("dirs.template_select_title") != "[dirs.template_select_title]" else "Slurm template",
-            t("dirs.template_select_label") if t("dirs.template_select_label") != "[dirs.template_select_label]" else "Template type:",
+            tr("dirs.template_select_title", "Slurm template"),
+            tr("dirs.template_select_label", "Template type:"),
             options,
             0,
             False,
@@ -487,10 +483,10 @@ class DirectoriesWidget(QWidget):
             return
 
         dlg = QDialog(self)
-        dlg.setWindowTitle(t("dirs.file_actions") if t("dirs.file_actions") != "[dirs.file_actions]" else "Dosya İşlemleri")
+        dlg.setWindowTitle(tr("dirs.file_actions", "Dosya İşlemleri"))
 
-        btn_download = QPushButton(t("dirs.download") if t("dirs.download") != "[dirs.download]" else "İndir")
-        btn_edit = QPushButton(t("dirs.edit") if t("dirs.edit") != "[dirs.edit]" else "Düzelt")
+        btn_download = QPushButton(tr("dirs.download", "İndir"))
+        btn_edit = QPushButton(tr("dirs.edit", "Düzelt"))
         btn_close = QPushButton(t("common.cancel"))
 
         row = QHBoxLayout(dlg)
@@ -509,7 +505,7 @@ class DirectoriesWidget(QWidget):
             except Exception as e:
                 show_exception(self, title=t("common.error"), user_message=t("dirs.unreadable").format(err=e), exc=e, area="FILES")
                 return
-            save_path, _ = QFileDialog.getSaveFileName(self, t("dirs.save_as") if t("dirs.save_as") != "[dirs.save_as]" else "Farklı Kaydet")
+            save_path, _ = QFileDialog.getSaveFileName(self, tr("dirs.save_as", "Farklı Kaydet"))
             if not save_path:
                 return
             try:
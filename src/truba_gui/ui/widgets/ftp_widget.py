@@ -29,7 +29,7 @@ from truba_gui.config.storage import (
     update_ftp_state,
 )
 from truba_gui.config.system_profile import format_remote_path, normalize_system_settings
-from truba_gui.core.i18n import t
+from truba_gui.core.i18n import t, tr
 from truba_gui.services.transfer_mode import (
     ASCII,
     AUTO,
@@ -41,11 +41,6 @@ from truba_gui.ui.widgets.remote_accordion import RemoteAccordion
 from truba_gui.ui.widgets.remote_dir_panel import RemoteDirPanel
 
 
-def _tr(key: str, fallback: str) -> str:
-    value = t(key)
-    return fallback if value == f"[{key}]" else value
-
-
 class TransferActivityPanel(QGroupBox):
     _MAX_VISIBLE_TRANSFER_ROWS = 500
 
@@ -67,9 +62,9 @@ class TransferActivityPanel(QGroupBox):
         self._controller_connections_by_id: dict[int, list[tuple[object, object]]] = {}
         self._finished_errors: list[tuple[object, str]] = []
         self._finished_completed: list = []
-        self._last_status_text = _tr("transfer.no_active_transfer", "No active transfer.")
+        self._last_status_text = tr("transfer.no_active_transfer", "No active transfer.")
         self._progress_by_item: dict[int, int] = {}
-        self.status_label = QLabel(_tr("transfer.no_active_transfer", "No active transfer."))
+        self.status_label = QLabel(tr("transfer.no_active_transfer", "No active transfer."))
         self.summary_label = QLabel()
         self.tabs = QTabWidget()
         self.tabs.setTabPosition(QTabWidget.TabPosition.South)
@@ -82,9 +77,9 @@ class TransferActivityPanel(QGroupBox):
             self.completed_list,
         ):
             view.setMinimumHeight(92)
-        self.tabs.addTab(self.queue_list, _tr("transfer.queue_tab", "Queue"))
-        self.tabs.addTab(self.failed_list, _tr("transfer.failed_tab", "Failed"))
-        self.tabs.addTab(self.completed_list, _tr("transfer.completed_tab", "Completed"))
+        self.tabs.addTab(self.queue_list, tr("transfer.queue_tab", "Queue"))
+        self.tabs.addTab(self.failed_list, tr("transfer.failed_tab", "Failed"))
+        self.tabs.addTab(self.completed_list, tr("transfer.completed_tab", "Completed"))
         for view, kind in (
             (self.queue_list, "queue"),
             (self.failed_list, "failed"),
@@ -99,9 +94,9 @@ class TransferActivityPanel(QGroupBox):
                 )
             )
 
-        self.btn_stop = QPushButton(_tr("transfer.stop", "Stop"))
-        self.btn_cancel = QPushButton(_tr("transfer.cancel", "Cancel"))
-        self.btn_clear_pending = QPushButton(_tr("transfer.clear_pending", "Clear queued"))
+        self.btn_stop = QPushButton(tr("transfer.stop", "Stop"))
+        self.btn_cancel = QPushButton(tr("transfer.cancel", "Cancel"))
+        self.btn_clear_pending = QPushButton(tr("transfer.clear_pending", "Clear queued"))
         self.btn_stop.clicked.connect(lambda: self._call_controller("cancel_all"))
         self.btn_cancel.clicked.connect(lambda: self._call_controller("cancel_all"))
         self.btn_clear_pending.clicked.connect(lambda: self._call_controller("clear_pending"))
@@ -131,7 +126,7 @@ class TransferActivityPanel(QGroupBox):
         return view
 
     def retranslate_ui(self) -> None:
-        self.setTitle(_tr("transfer.ftp_activity_title", "Transfers"))
+        self.setTitle(tr("transfer.ftp_activity_title", "Transfers"))
         labels = (
             self._tab_label("Queued files", self.queue_list.topLevelItemCount()),
             self._tab_label("Failed transfers", self.failed_list.topLevelItemCount()),
@@ -139,9 +134,9 @@ class TransferActivityPanel(QGroupBox):
         )
         for index, label in enumerate(labels):
             self.tabs.setTabText(index, label)
-        self.btn_stop.setText(_tr("transfer.stop", "Stop"))
-        self.btn_cancel.setText(_tr("transfer.cancel", "Cancel"))
-        self.btn_clear_pending.setText(_tr("transfer.clear_pending", "Clear queued"))
+        self.btn_stop.setText(tr("transfer.stop", "Stop"))
+        self.btn_cancel.setText(tr("transfer.cancel", "Cancel"))
+        self.btn_clear_pending.setText(tr("transfer.clear_pending", "Clear queued"))
 
     @staticmethod
     def _item_label(item) -> str:
@@ -230,9 +225,8 @@ class TransferActivityPanel(QGroupBox):
         view.addTopLevelItem(row)
         self._install_progress_bar(view, row, item, status)
         if detail:
-            child = QTreeWidgetItem(["", "", detail, "", "", "", ""])
-            row.addChild(child)
-            row.setExpanded(True)
+            # Callers expand the whole view once after adding their rows.
+            row.addChild(QTreeWidgetItem(["", "", detail, "", "", "", ""]))
         return row
 
     def _render_transfer_rows(
@@ -243,15 +237,26 @@ class TransferActivityPanel(QGroupBox):
         detail: str = "",
     ) -> list:
         logical_items = self._visible_transfer_items(items)
-        for item in logical_items[: self._MAX_VISIBLE_TRANSFER_ROWS]:
-            self._add_transfer_row(view, item, status, detail)
-        hidden_count = len(logical_items) - self._MAX_VISIBLE_TRANSFER_ROWS
-        if hidden_count > 0:
-            view.addTopLevelItem(
-                QTreeWidgetItem(
-                    ["", "", f"Remaining: {hidden_count}", "", "", "", ""]
+        # Callers such as _sync_lists may already hold updates off; only the
+        # outermost level turns them back on.
+        suspend = view.updatesEnabled()
+        if suspend:
+            view.setUpdatesEnabled(False)
+        try:
+            for item in logical_items[: self._MAX_VISIBLE_TRANSFER_ROWS]:
+                self._add_transfer_row(view, item, status, detail)
+            hidden_count = len(logical_items) - self._MAX_VISIBLE_TRANSFER_ROWS
+            if hidden_count > 0:
+                view.addTopLevelItem(
+                    QTreeWidgetItem(
+                        ["", "", f"Remaining: {hidden_count}", "", "", "", ""]
+                    )
                 )
-            )
+            if detail:
+                view.expandAll()
+        finally:
+            if suspend:
+                view.setUpdatesEnabled(True)
         return logical_items
 
     def _progress_value(self, item, status: str) -> int:
@@ -436,6 +441,20 @@ class TransferActivityPanel(QGroupBox):
         self._sync_lists(pending, errors, completed, active_items)
 
     def _sync_lists(self, pending, errors, completed, active_items=None) -> None:
+        # Up to three full list rebuilds per update; repaint each view once.
+        views = (self.queue_list, self.failed_list, self.completed_list)
+        for view in views:
+            view.setUpdatesEnabled(False)
+        try:
+            queue_items = self._rebuild_lists(pending, errors, completed, active_items)
+        finally:
+            for view in views:
+                view.setUpdatesEnabled(True)
+        self._update_summary(queue_items)
+        self.retranslate_ui()
+        self._update_controls()
+
+    def _rebuild_lists(self, pending, errors, completed, active_items) -> list:
         self.queue_list.clear()
         active_items = list(active_items or [])
         active_transfers = self._visible_transfer_items(active_items)
@@ -487,11 +506,11 @@ class TransferActivityPanel(QGroupBox):
                     ["", "", f"Remaining: {failed_hidden}", "", "", "", ""]
                 )
             )
+        self.queue_list.expandAll()
+        self.failed_list.expandAll()
         self.completed_list.clear()
         self._render_transfer_rows(self.completed_list, completed, "Successful")
-        self._update_summary(queue_items)
-        self.retranslate_ui()
-        self._update_controls()
+        return queue_items
 
     def _call_controller(self, method: str, *args) -> None:
         if method in {"cancel_all", "clear_pending"}:
@@ -588,33 +607,33 @@ class TransferActivityPanel(QGroupBox):
             *args,
             enabled: bool = True,
         ) -> None:
-            action = menu.addAction(_tr(label_key, fallback))
+            action = menu.addAction(tr(label_key, fallback))
             action.setEnabled(enabled and self._controller_action_available(method))
             if args and not args[0]:
                 action.setEnabled(False)
             actions[action] = (method, args)
 
         def add_disabled_action(label_key: str, fallback: str, tooltip_key: str) -> None:
-            action = menu.addAction(_tr(label_key, fallback))
+            action = menu.addAction(tr(label_key, fallback))
             action.setEnabled(False)
-            tooltip = _tr(tooltip_key, "Not available in this version.")
+            tooltip = tr(tooltip_key, "Not available in this version.")
             if hasattr(action, "setToolTip"):
                 action.setToolTip(tooltip)
 
         def add_priority_menu() -> None:
             priority_menu = menu.addMenu(
-                _tr("transfer.set_priority", "Set Priority")
+                tr("transfer.set_priority", "Set Priority")
             )
             for priority in ("Highest", "High", "Normal", "Low", "Lowest"):
                 action = priority_menu.addAction(
-                    _tr(f"transfer.priority_{priority.lower()}", priority)
+                    tr(f"transfer.priority_{priority.lower()}", priority)
                 )
                 action.setEnabled(bool(selected) and self._controller_action_available("set_pending_priority"))
                 actions[action] = ("set_pending_priority", (selected, priority))
 
         def add_completion_menu() -> None:
             completion_menu = menu.addMenu(
-                _tr("transfer.after_completion", "Action after queue completion")
+                tr("transfer.after_completion", "Action after queue completion")
             )
             selected_action = get_transfer_completion_action()
             choices = (
@@ -630,7 +649,7 @@ class TransferActivityPanel(QGroupBox):
                 ("suspend_once", "transfer.completion_suspend_once", "Suspend system once"),
             )
             for value, key, fallback in choices:
-                action = completion_menu.addAction(_tr(key, fallback))
+                action = completion_menu.addAction(tr(key, fallback))
                 if hasattr(action, "setCheckable"):
                     action.setCheckable(True)
                     action.setChecked(value == selected_action)
@@ -722,13 +741,13 @@ class TransferActivityPanel(QGroupBox):
         if selected == "play_sound":
             QApplication.beep()
         if selected in observable:
-            text = _tr(
-                "transfer.completion_action_saved",
+            text = tr(
+                "settings.completion_action_saved",
                 "Completion action saved: {action}",
             ).format(action=selected)
         else:
-            text = _tr(
-                "transfer.completion_action_unsupported",
+            text = tr(
+                "settings.completion_action_unsupported",
                 "This completion action was saved but needs confirmation and is not executed.",
             )
         self._set_status_text(text)
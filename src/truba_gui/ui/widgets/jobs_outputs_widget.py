@@ -3,6 +3,7 @@ from __future__ import annotations
 import html
 import re
 import shlex
+from functools import lru_cache
 
 from PySide6.QtCore import QThreadPool, QTimer, Signal, Qt
 from PySide6.QtGui import QFontDatabase, QTextCursor
@@ -20,7 +21,7 @@ from truba_gui.config.storage import (
     get_jobs_outputs_refresh_interval_seconds,
     get_lssrv_auto_refresh_enabled,
 )
-from truba_gui.core.i18n import t
+from truba_gui.core.i18n import t, tr
 from truba_gui.core.ui_errors import show_exception
 from truba_gui.core.history import append_event
 from truba_gui.ui.widgets.remote_dir_panel import RemoteDirPanel
@@ -46,6 +47,21 @@ _LIVE_TAIL_INTERVAL_MS = 1000
 _LIVE_TAIL_LINE_COUNT = 200
 
 
+@lru_cache(maxsize=64)
+def _live_tail_command(path: str) -> str:
+    """Return the remote tail command for ``path``.
+
+    Followed paths change rarely while the live timer fires every second,
+    so the quoted command is built once per path and reused on each tick.
+    """
+    return f"tail -n {_LIVE_TAIL_LINE_COUNT} -- {shlex.quote(path)}"
+
+
+def _tail_lines(text: str) -> str:
+    lines = text.splitlines()[-_LIVE_TAIL_LINE_COUNT:]
+    return "\n".join(lines) + ("\n" if lines else "")
+
+
 class _NavigableTextEdit(QTextEdit):
     def keyPressEvent(self, event) -> None:  # type: ignore[override]
         if (
@@ -263,6 +279,8 @@ class _OutputFollowerWidget(QWidget):
             self._live_timer.stop()
             return
 
+        commands = tuple(_live_tail_command(path) if path else "" for path in paths)
+
         def fetch() -> list[tuple[int, str, str, str]]:
             results = []
             for slot, path in enumerate(paths):
@@ -270,17 +288,12 @@ class _OutputFollowerWidget(QWidget):
                     continue
                 try:
                     if ssh:
-                        code, out, err = ssh.run(
-                            f"tail -n {_LIVE_TAIL_LINE_COUNT} -- {shlex.quote(path)}",
-                            log_output=False,
-                        )
+                        code, out, err = ssh.run(commands[slot], log_output=False)
                         if code != 0:
                             raise RuntimeError(err.strip() or f"exit={code}")
                         text = out
                     else:
-                        all_text = files.read_text(path)
-                        lines = all_text.splitlines()[-_LIVE_TAIL_LINE_COUNT:]
-                        text = "\n".join(lines) + ("\n" if lines else "")
+                        text = _tail_lines(files.read_text(path))
                     results.append((slot, path, text, ""))
                 except Exception as exc:
                     results.append((slot, path, "", str(exc)))
@@ -359,17 +372,17 @@ class JobsOutputsWidget(QWidget):
         self.outputs_tab = QWidget(self.section_tabs)
 
         # --- Jobs box
-        self.jobs_box = QGroupBox(t("jobs.title") if t("jobs.title") != "[jobs.title]" else "İşler")
+        self.jobs_box = QGroupBox(tr("jobs.title", "İşler"))
         self.jobs_text = QTextEdit()
         self.jobs_text.setReadOnly(True)
         self._apply_terminal_output_style(self.jobs_text)
 
-        self.btn_refresh = QPushButton(t("jobs.refresh") if t("jobs.refresh") != "[jobs.refresh]" else "Yenile")
+        self.btn_refresh = QPushButton(tr("jobs.refresh", "Yenile"))
         self.btn_refresh.clicked.connect(self.refresh_jobs)
 
         self.cancel_id = QLineEdit()
         self.cancel_id.setPlaceholderText(t("jobs.job_id"))
-        self.btn_cancel = QPushButton(t("jobs.cancel") if t("jobs.cancel") != "[jobs.cancel]" else "İşi İptal Et")
+        self.btn_cancel = QPushButton(tr("jobs.cancel", "İşi İptal Et"))
         self.btn_cancel.clicked.connect(self.cancel_job)
 
         row = QHBoxLayout()
@@ -419,7 +432,7 @@ class JobsOutputsWidget(QWidget):
 
         # --- Scratch panel (Files subtab)
         self.scratch_panel = RemoteDirPanel(
-            title=t("jobs_outputs.scratch_title") if t("jobs_outputs.scratch_title") != "[jobs_outputs.scratch_title]" else "Scratch"
+            title=tr("jobs_outputs.scratch_title", "Scratch")
         )
         self.scratch_panel.open_file.connect(self.load_one_file)  # double click
         self.scratch_panel.enable_output_menu = True
@@ -451,11 +464,11 @@ class JobsOutputsWidget(QWidget):
         files_layout.addWidget(self.scratch_panel)
 
         # --- Outputs group (2 panels)
-        self.out_group = QGroupBox(t("jobs_outputs.outputs_title") if t("jobs_outputs.outputs_title") != "[jobs_outputs.outputs_title]" else "Çıktılar")
+        self.out_group = QGroupBox(tr("jobs_outputs.outputs_title", "Çıktılar"))
         outputs_layout = QVBoxLayout(self.outputs_tab)
         vg = QVBoxLayout(self.out_group)
 
-        self.lbl_script = QLabel(t("jobs_outputs.no_script") if t("jobs_outputs.no_script") != "[jobs_outputs.no_script]" else "Aktif Slurm Script: (yok)")
+        self.lbl_script = QLabel(tr("jobs_outputs.no_script", "Aktif Slurm Script: (yok)"))
         vg.addWidget(self.lbl_script)
         self.btn_tail_pause = QPushButton()
         self.btn_tail_pause.clicked.connect(self._toggle_tail_pause)
@@ -1268,6 +1281,8 @@ class JobsOutputsWidget(QWidget):
             self._live_timer.stop()
             return
 
+        commands = tuple(_live_tail_command(path) if path else "" for path in paths)
+
         def fetch() -> list[tuple[int, str, str, str]]:
             results = []
             for slot, path in enumerate(paths):
@@ -1275,18 +1290,12 @@ class JobsOutputsWidget(QWidget):
                     continue
                 try:
                     if ssh:
-                        code, out, err = ssh.run(
-                            f"tail -n {_LIVE_TAIL_LINE_COUNT} -- {shlex.quote(path)}",
-                            log_output=False,
-                        )
+                        code, out, err = ssh.run(commands[slot], log_output=False)
                         if code == 0:
                             results.append((slot, path, out, ""))
                             continue
                         raise RuntimeError(err.strip() or f"exit={code}")
-                    text = files.read_text(path)
-                    lines = text.splitlines()[-_LIVE_TAIL_LINE_COUNT:]
-                    tail = "\n".join(lines) + ("\n" if lines else "")
-                    results.append((slot, path, tail, ""))
+                    results.append((slot, path, _tail_lines(files.read_text(path)), ""))
                 except Exception as exc:
                     results.append((slot, path, "", str(exc)))
             return results
@@ -1326,19 +1335,19 @@ class JobsOutputsWidget(QWidget):
     def retranslate_ui(self):
         details_title = f"{t('jobs.title')} / {t('common.details')}"
         files_title = t("jobs_outputs.files_title")
-        outputs_title = t("jobs_outputs.outputs_title") if t("jobs_outputs.outputs_title") != "[jobs_outputs.outputs_title]" else "Çıktılar"
+        outputs_title = tr("jobs_outputs.outputs_title", "Çıktılar")
         self.section_tabs.setTabText(0, details_title)
         self.section_tabs.setTabText(1, files_title)
         self.section_tabs.setTabText(2, outputs_title)
-        self.jobs_box.setTitle(t("jobs.title") if t("jobs.title") != "[jobs.title]" else "İşler")
+        self.jobs_box.setTitle(tr("jobs.title", "İşler"))
         self.meta_box.setTitle(t("jobs_outputs.accounting_details"))
         self.lssrv_box.setTitle(t("jobs_outputs.lssrv_title"))
         self.out_group.setTitle(outputs_title)
         self.out_box.setTitle(t("jobs_outputs.output_stdout"))
         self.err_box.setTitle(t("jobs_outputs.output_stderr"))
-        self.lbl_script.setText(t("jobs_outputs.no_script") if t("jobs_outputs.no_script") != "[jobs_outputs.no_script]" else "Aktif Slurm Script: (yok)")
-        self.btn_refresh.setText(t("jobs.refresh") if t("jobs.refresh") != "[jobs.refresh]" else "Yenile")
-        self.btn_cancel.setText(t("jobs.cancel") if t("jobs.cancel") != "[jobs.cancel]" else "İşi İptal Et")
+        self.lbl_script.setText(tr("jobs_outputs.no_script", "Aktif Slurm Script: (yok)"))
+        self.btn_refresh.setText(tr("jobs.refresh", "Yenile"))
+        self.btn_cancel.setText(tr("jobs.cancel", "İşi İptal Et"))
         self.cancel_id.setPlaceholderText(t("jobs.job_id"))
         self.meta_job_id.setPlaceholderText(t("jobs.job_id"))
         self.meta_text.setPlaceholderText(t("jobs_outputs.accounting_placeholder"))
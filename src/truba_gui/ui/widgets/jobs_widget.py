@@ -1,17 +1,21 @@
-from PySide6.QtWidgets import QWidget, QVBoxLayout, QPushButton, QTextEdit, QLineEdit, QHBoxLayout
+from PySide6.QtCore import QThreadPool
+from PySide6.QtWidgets import QWidget, QVBoxLayout, QPushButton, QPlainTextEdit, QLineEdit, QHBoxLayout
 from truba_gui.core.i18n import t
 from truba_gui.core.history import append_event
+from truba_gui.ui.async_call import AsyncCall
 
 class JobsWidget(QWidget):
     def __init__(self):
         super().__init__()
         self.session = None
+        self._session_generation = 0
+        self._async_workers: set[AsyncCall] = set()
 
-        self.out = QTextEdit()
+        self.out = QPlainTextEdit()
         self.out.setReadOnly(True)
+        self.out.setMaximumBlockCount(2000)
 
         self.btn_refresh = QPushButton(t("jobs.refresh"))
-        self.btn_refresh.setText(t("jobs.refresh"))
         self.btn_refresh.clicked.connect(self.refresh)
 
         self.cancel_id = QLineEdit()
@@ -30,17 +34,42 @@ class JobsWidget(QWidget):
         lay.addWidget(self.out)
 
     def set_session(self, session):
+        self._session_generation += 1
         self.session = session
         self.out.setPlainText("")
 
+    def _start_async(self, fn, on_success) -> None:
+        # squeue/scancel block on an SSH round trip; keep them off the GUI
+        # thread and drop results that belong to an older session.
+        worker = AsyncCall(self._session_generation, fn)
+        self._async_workers.add(worker)
+
+        def finished(token, result) -> None:
+            self._async_workers.discard(worker)
+            if token == self._session_generation:
+                on_success(result)
+
+        def failed(token, exc) -> None:
+            self._async_workers.discard(worker)
+            if token == self._session_generation:
+                self.out.appendPlainText("\n" + str(exc))
+
+        worker.signals.finished.connect(finished)
+        worker.signals.failed.connect(failed)
+        QThreadPool.globalInstance().start(worker)
+
     def refresh(self):
         if not self.session or not self.session.get("slurm"):
             self.out.setPlainText(t("common.no_connection"))
             return
         user = self.session["cfg"].username
-        text = self.session["slurm"].squeue(user)
-        self.out.setPlainText(text)
-        append_event({"type": "squeue", "user": user})
+        slurm = self.session["slurm"]
+
+        def success(text) -> None:
+            self.out.setPlainText(text)
+            append_event({"type": "squeue", "user": user})
+
+        self._start_async(lambda: slurm.squeue(user), success)
 
     def cancel(self):
         if not self.session or not self.session.get("slurm"):
@@ -48,6 +77,10 @@ class JobsWidget(QWidget):
         jobid = self.cancel_id.text().strip()
         if not jobid:
             return
-        res = self.session["slurm"].scancel(jobid)
-        self.out.append("\n" + res)
-        append_event({"type": "scancel", "jobid": jobid})
+        slurm = self.session["slurm"]
+
+        def success(res) -> None:
+            self.out.appendPlainText("\n" + res)
+            append_event({"type": "scancel", "jobid": jobid})
+
+        self._start_async(lambda: slurm.scancel(jobid), success)
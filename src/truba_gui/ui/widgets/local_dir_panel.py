@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 import datetime
-import json
 import os
 import re
 import shutil
@@ -28,7 +27,7 @@ from PySide6.QtWidgets import (
     QWidget,
 )
 
-from truba_gui.core.i18n import t
+from truba_gui.core.i18n import t, tr
 from truba_gui.config.storage import (
     get_file_association,
     set_file_association,
@@ -39,7 +38,7 @@ from truba_gui.services.local_files import (
     safe_initial_local_directory,
 )
 from truba_gui.services.file_clipboard import get_file_clipboard
-from truba_gui.ui.widgets.remote_dir_panel import MIME_REMOTE_PATHS
+from truba_gui.ui.widgets.remote_dir_panel import MIME_REMOTE_PATHS, _decode_payload
 
 LOCAL_CONTEXT_MENU_LABELS = [
     "Upload",
@@ -179,12 +178,9 @@ class _LocalTree(QTreeWidget):
         if not mime.hasFormat(MIME_REMOTE_PATHS):
             super().dropEvent(event)
             return
-        try:
-            payload = json.loads(bytes(mime.data(MIME_REMOTE_PATHS)).decode("utf-8"))
-            paths = [str(path) for path in payload.get("paths", []) if path]
-            source = str(payload.get("src_panel_id", ""))
-        except Exception:
-            paths, source = [], ""
+        payload = _decode_payload(bytes(mime.data(MIME_REMOTE_PATHS)))
+        paths = payload.paths if payload is not None else []
+        source = payload.src_panel_id if payload is not None else ""
         if paths and source:
             event.acceptProposedAction()
             QTimer.singleShot(
@@ -539,8 +535,8 @@ class LocalDirPanel(QWidget):
     def create_directory(self, *, enter: bool = False) -> bool:
         name, ok = QInputDialog.getText(
             self,
-            t("dirs.new_folder") if t("dirs.new_folder") != "[dirs.new_folder]" else "Yeni Klasör",
-            t("dirs.new_folder_label") if t("dirs.new_folder_label") != "[dirs.new_folder_label]" else "Klasör adı:",
+            tr("dirs.new_folder", "Yeni Klasör"),
+            tr("dirs.new_folder_label", "Klasör adı:"),
         )
         if not ok or not name.strip():
             return False
@@ -582,6 +578,8 @@ class LocalDirPanel(QWidget):
         one_selected = len(paths) == 1
         one_is_dir = one_selected and Path(paths[0]).is_dir()
 
+        # Parented to the panel for positioning; delete it once handled so
+        # every right-click does not leave a menu and its actions behind.
         menu = QMenu(self)
         act_upload = menu.addAction(LOCAL_CONTEXT_MENU_LABELS[0])
         act_add_queue = menu.addAction(LOCAL_CONTEXT_MENU_LABELS[1])
@@ -616,6 +614,7 @@ class LocalDirPanel(QWidget):
             act_rename.setEnabled(False)
 
         chosen = menu.exec(self.tree.viewport().mapToGlobal(pos))
+        menu.deleteLater()
         if not chosen:
             return
         if chosen == act_upload:
@@ -653,7 +652,7 @@ class LocalDirPanel(QWidget):
         old = Path(str(selected[0].data(0, Qt.ItemDataRole.UserRole)))
         new_name, ok = QInputDialog.getText(
             self,
-            t("dirs.rename") if t("dirs.rename") != "[dirs.rename]" else "Yeniden Adlandır",
+            tr("dirs.rename", "Yeniden Adlandır"),
             t("dirs.rename_label"),
             text=old.name,
         )
@@ -6,13 +6,13 @@ from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QFormLayout, QHBoxLayout,
     QLineEdit, QPushButton, QCheckBox, QLabel, QFileDialog,
     QApplication, QListWidget, QSplitter, QMessageBox, QPlainTextEdit,
-    QInputDialog, QMenu
+    QInputDialog, QMenu, QDialog
 )
 
-from truba_gui.core.i18n import t
+from truba_gui.core.i18n import t, tr
 from truba_gui.core.ui_errors import show_exception
 from truba_gui.config.models import SSHConfig
-from truba_gui.config.storage import load_profiles, upsert_profile, load_settings, delete_profile
+from truba_gui.config.storage import load_profiles_map, upsert_profile, load_settings, delete_profile
 from truba_gui.config.system_profile import normalize_system_settings
 from truba_gui.core.history import append_event
 from truba_gui.core.logging import append_log
@@ -22,7 +22,7 @@ from truba_gui.services.x11_runner import X11Runner
 from truba_gui.ssh.client import SSHClientWrapper, SSHConnInfo
 from truba_gui.services.files_ssh import SSHFilesBackend
 from truba_gui.services.slurm_ssh import SSHSlurmBackend
-from truba_gui.core.crypto_master import encrypt_with_master, decrypt_with_master
+from truba_gui.core.crypto_master import clear_key_cache, encrypt_with_master, decrypt_with_master
 from truba_gui.core.secret_store import (
     is_available as os_secret_store_available,
     protect_secret,
@@ -31,6 +31,7 @@ from truba_gui.core.secret_store import (
 from truba_gui.services.terminal_emulator import TerminalEmulator
 from truba_gui.ui.widgets.terminal_input import TerminalInput
 from truba_gui.ui.dialogs.connection_dialog import ConnectionDialog
+from truba_gui.ui.dialogs.master_password_dialog import MasterPasswordDialog
 
 import os
 import shiboken6
@@ -79,9 +80,10 @@ class _ConnectionWorker(QObject):
     finished = Signal(object)
     failed = Signal(str, object)
 
-    def __init__(self, cfg: SSHConfig, shell_size: tuple[int, int], log_cb, shell_output_cb, disconnect_cb=None):
+    def __init__(self, cfg: SSHConfig, shell_size: tuple[int, int], log_cb, shell_output_cb, disconnect_cb=None, reuse_ssh=None):
         super().__init__()
         self._cfg = cfg
+        self._reuse_ssh = reuse_ssh
         self._shell_size = shell_size
         self._log_cb = log_cb
         self._shell_output_cb = shell_output_cb
@@ -98,13 +100,18 @@ class _ConnectionWorker(QObject):
                 host_key_policy=self._cfg.host_key_policy,
                 x11_forwarding=self._cfg.x11_forwarding,
             )
-            ssh = SSHClientWrapper(
-                conn,
-                log_cb=self._log_cb,
-                shell_output_cb=self._shell_output_cb,
-                disconnect_cb=self._disconnect_cb,
-            )
-            ssh.connect(shell_size=self._shell_size)
+            reuse = self._reuse_ssh
+            if reuse is not None and hasattr(reuse, "can_reuse_for") and reuse.can_reuse_for(conn):
+                ssh = reuse
+                ssh.log("SSH: reusing active connection")
+            else:
+                ssh = SSHClientWrapper(
+                    conn,
+                    log_cb=self._log_cb,
+                    shell_output_cb=self._shell_output_cb,
+                    disconnect_cb=self._disconnect_cb,
+                )
+                ssh.connect(shell_size=self._shell_size)
             transport = ssh.client.get_transport() if ssh.client else None
             if transport is not None:
                 authenticated_user = transport.get_username() or ""
@@ -153,20 +160,20 @@ class LoginWidget(QWidget):
         self.password = QLineEdit()
         self.password.setEchoMode(QLineEdit.EchoMode.Password)
 
-        self.cb_save_password = QCheckBox(t("login.save_password") if t("login.save_password") != "[login.save_password]" else "Şifreyi kaydet")
+        self.cb_save_password = QCheckBox(tr("login.save_password", "Şifreyi kaydet"))
         self._profile_system_settings = normalize_system_settings(None)
         self._password_prompt_policy = "when-needed"
         self.key_path = QLineEdit()
-        self.btn_browse_key = QPushButton(t("login.browse") if t("login.browse") != "[login.browse]" else "Seç")
+        self.btn_browse_key = QPushButton(tr("login.browse", "Seç"))
         self.btn_browse_key.clicked.connect(self.pick_key)
 
-        self.cb_x11 = QCheckBox(t("login.x11_enable") if t("login.x11_enable") != "[login.x11_enable]" else "X11 Forwarding")
+        self.cb_x11 = QCheckBox(tr("login.x11_enable", "X11 Forwarding"))
         self.cb_strict_hostkey = QCheckBox(t("login.strict_host_key"))
 
         # Simulation / dry-run option removed from UI.
         # (If a legacy profile contains a 'dry_run' field, it is ignored.)
 
-        self.btn_save = QPushButton(t("login.save") if t("login.save") != "[login.save]" else "Kaydet")
+        self.btn_save = QPushButton(tr("login.save", "Kaydet"))
         self.btn_save.clicked.connect(self.save_profile)
 
         self.btn_add_connection = QPushButton(t("login.add_connection"))
@@ -175,11 +182,13 @@ class LoginWidget(QWidget):
         self.btn_connect = QPushButton(t("login.connect_selected"))
         self.btn_connect.clicked.connect(self.connect_selected_profile)
 
-        self.status_label = QLabel(t("login.status_disconnected") if t("login.status_disconnected") != "[login.status_disconnected]" else "Bağlı değil")
+        self.status_label = QLabel(tr("login.status_disconnected", "Bağlı değil"))
 
         # ---- Console
         self.console = _TerminalConsole(self)
         self.console.setReadOnly(True)
+        # The console is edited in place; an undo stack would only grow.
+        self.console.setUndoRedoEnabled(False)
         self.console.setLineWrapMode(QPlainTextEdit.LineWrapMode.NoWrap)
         self.console.setFont(QFontDatabase.systemFont(QFontDatabase.SystemFont.FixedFont))
         self.console.setStyleSheet(
@@ -201,7 +210,7 @@ class LoginWidget(QWidget):
             "selection-background-color: #264f78; }"
         )
         self.cmd_in.setPlaceholderText(t("login.command_placeholder"))
-        self.btn_run_cmd = QPushButton(t("login.run_command") if t("login.run_command") != "[login.run_command]" else "Çalıştır")
+        self.btn_run_cmd = QPushButton(tr("login.run_command", "Çalıştır"))
         self.btn_run_cmd.clicked.connect(self.cmd_in.submit_current)
         self.cmd_in.command_submitted.connect(self.run_command_text)
         self.cmd_in.reconnect_requested.connect(self._prompt_reconnect)
@@ -254,6 +263,13 @@ class LoginWidget(QWidget):
 
         self._session = {"connected": False, "cfg": SSHConfig(), "ssh": None, "slurm": None, "files": None}
         self._console_log_lines: list[str] = []
+        # What the console document currently shows: the first
+        # _console_doc_log_lines blocks are log lines, followed by the
+        # terminal screen tail. Log lines not yet in the document wait in
+        # _console_pending_lines so a render only touches what changed.
+        self._console_pending_lines: list[str] = []
+        self._console_doc_log_lines = 0
+        self._console_doc_tail = ""
         self._terminal_emulator = TerminalEmulator(columns=self._console_shell_geometry()[0], rows=self._console_shell_geometry()[1])
         self._terminal_emulation_enabled = True
         self._last_shell_geometry: tuple[int, int] | None = None
@@ -263,6 +279,9 @@ class LoginWidget(QWidget):
         self._pending_old_ssh = None
         self._reconnect_prompt_open = False
         self._master_password_cache = ""
+        # Profiles are only written from this widget and every write ends in
+        # refresh_profiles(), so the parsed config can be kept in memory.
+        self._profiles_by_name: dict[str, dict] = {}
         self._console_render_timer = QTimer(self)
         self._console_render_timer.setSingleShot(True)
         self._console_render_timer.setInterval(50)
@@ -288,6 +307,7 @@ class LoginWidget(QWidget):
             close_vcxsrv=bool(st.get("close_vcxsrv_on_exit", True)),
         )
 
+        self._close_session_files()
         try:
             ssh = self._session.get("ssh") if hasattr(self, "_session") else None
             if ssh is not None:
@@ -313,6 +333,7 @@ class LoginWidget(QWidget):
             pass
 
         self._master_password_cache = ""
+        clear_key_cache()
 
     # ---- public helpers
     def append_console(self, msg: str) -> None:
@@ -340,19 +361,21 @@ class LoginWidget(QWidget):
             self._console_render_timer.start()
 
     def _render_console_view(self) -> None:
+        if not shiboken6.isValid(self.console):
+            return
         try:
-            lines = list(self._console_log_lines)
+            pending, self._console_pending_lines = self._console_pending_lines, []
             terminal_text = ""
             if self._terminal_emulation_enabled:
                 terminal_text = self._terminal_emulator.render().rstrip("\n")
+            log_lines = len(self._console_log_lines)
+            tail = ""
             if terminal_text:
-                if lines:
-                    lines.append("")
-                lines.extend(terminal_text.splitlines())
-            text = "\n".join(lines)
+                tail = ("\n\n" if log_lines else "") + terminal_text
             self.console.blockSignals(True)
             try:
-                self.console.setPlainText(text)
+                if pending or tail != self._console_doc_tail:
+                    self._update_console_document(pending, tail)
                 cursor = self.console.textCursor()
                 cursor.movePosition(QTextCursor.MoveOperation.End)
                 self.console.setTextCursor(cursor)
@@ -362,33 +385,69 @@ class LoginWidget(QWidget):
         except Exception:
             pass
 
+    def _update_console_document(self, pending: list[str], tail: str) -> None:
+        # Edit the document in place instead of setPlainText: appending a
+        # line or redrawing the shell screen must not re-lay out the whole
+        # 2000-line log.
+        doc = self.console.document()
+        cursor = QTextCursor(doc)
+        cursor.beginEditBlock()
+        try:
+            shown = self._console_doc_log_lines
+            if shown:
+                last = doc.findBlockByNumber(shown - 1)
+                cursor.setPosition(last.position() + last.length() - 1)
+            cursor.movePosition(QTextCursor.MoveOperation.End, QTextCursor.MoveMode.KeepAnchor)
+            cursor.removeSelectedText()
+            if pending:
+                cursor.insertText(("\n" if shown else "") + "\n".join(pending))
+                shown += len(pending)
+            excess = shown - len(self._console_log_lines)
+            if excess > 0:
+                cursor.movePosition(QTextCursor.MoveOperation.Start)
+                cursor.movePosition(
+                    QTextCursor.MoveOperation.NextBlock,
+                    QTextCursor.MoveMode.KeepAnchor,
+                    excess,
+                )
+                cursor.removeSelectedText()
+                shown -= excess
+            if tail:
+                cursor.movePosition(QTextCursor.MoveOperation.End)
+                cursor.insertText(tail)
+        finally:
+            cursor.endEditBlock()
+        self._console_doc_log_lines = shown
+        self._console_doc_tail = tail
+
     def _append_log_line(self, msg: str) -> None:
         text = (msg or "").rstrip("\n")
-        self._console_log_lines.extend(text.splitlines() or [""])
+        lines = text.splitlines() or [""]
+        self._console_log_lines.extend(lines)
+        self._console_pending_lines.extend(lines)
         if len(self._console_log_lines) > 2000:
             del self._console_log_lines[:-2000]
+            del self._console_pending_lines[:-2000]
         self._schedule_console_render()
 
+    # The append slots only buffer text and arm the render timer; the
+    # console itself is touched (and checked for validity) once per render.
     def _append_console_to_widget(self, msg: str) -> None:
         # Guard against "Internal C++ object already deleted" during shutdown.
         try:
-            if hasattr(self, "console") and shiboken6.isValid(self.console):
-                self._append_log_line(msg)
+            self._append_log_line(msg)
         except RuntimeError:
             pass
         append_log(msg)
 
     def _append_ssh_console_to_widget(self, msg: str) -> None:
         try:
-            if hasattr(self, "console") and shiboken6.isValid(self.console):
-                self._append_log_line(msg)
+            self._append_log_line(msg)
         except RuntimeError:
             pass
 
     def _append_shell_output_to_widget(self, msg: str) -> None:
         try:
-            if not hasattr(self, "console") or not shiboken6.isValid(self.console):
-                return
             if not self._terminal_emulation_enabled:
                 self._append_log_line(msg)
                 return
@@ -535,6 +594,7 @@ class LoginWidget(QWidget):
             self.append_ssh_console,
             self.append_shell_output,
             self._notify_ssh_disconnected,
+            reuse_ssh=old_ssh,
         )
         self._connect_thread = thread
         self._connect_worker = worker
@@ -566,6 +626,7 @@ class LoginWidget(QWidget):
         cfg = data.get("cfg")
         old_ssh = self._pending_old_ssh
         try:
+            self._close_session_files()
             if old_ssh is not None and old_ssh is not ssh:
                 try:
                     old_ssh.close()
@@ -579,7 +640,7 @@ class LoginWidget(QWidget):
                 "files": files,
                 "profile_name": self.profile_name.text().strip(),
             }
-            self.status_label.setText(t("login.status_connected") if t("login.status_connected") != "[login.status_connected]" else "Bağlı")
+            self.status_label.setText(tr("login.status_connected", "Bağlı"))
             self.cmd_in.set_connected(True)
             self.append_console("SSH bağlantısı kuruldu.")
             self._sync_shell_geometry()
@@ -595,7 +656,7 @@ class LoginWidget(QWidget):
             self.btn_connect.setEnabled(bool(self._selected_profile_name()))
 
     def _on_connect_failed(self, message: str, exc: object) -> None:
-        self.status_label.setText(t("login.status_disconnected") if t("login.status_disconnected") != "[login.status_disconnected]" else "Bağlı değil")
+        self.status_label.setText(tr("login.status_disconnected", "Bağlı değil"))
         self.cmd_in.set_connected(False)
         self.append_console(t("login.conn_error_prefix").format(err=message))
         if "SSH protocol banner" in message or "banner" in message.lower():
@@ -607,14 +668,20 @@ class LoginWidget(QWidget):
         self.btn_connect.setEnabled(bool(self._selected_profile_name()))
 
     # ---- profiles
+    def _reload_profiles_cache(self) -> None:
+        self._profiles_by_name = load_profiles_map()
+
     def refresh_profiles(self, select_name: str | None = None) -> None:
-        self.profiles_list.clear()
         self.btn_connect.setEnabled(False)
-        profiles = load_profiles()
-        for p in profiles:
-            name = p.get("name", "")
-            if name:
-                self.profiles_list.addItem(name)
+        self._reload_profiles_cache()
+        # One batched rebuild; selection signals would only re-disable the
+        # connect button for every removed row.
+        signals_were_blocked = self.profiles_list.blockSignals(True)
+        try:
+            self.profiles_list.clear()
+            self.profiles_list.addItems(list(self._profiles_by_name))
+        finally:
+            self.profiles_list.blockSignals(signals_were_blocked)
         if select_name:
             items = self.profiles_list.findItems(select_name, Qt.MatchFlag.MatchExactly)
             if items:
@@ -625,9 +692,7 @@ class LoginWidget(QWidget):
         if not item:
             self.btn_connect.setEnabled(False)
             return
-        name = item.text()
-        profiles = load_profiles()
-        prof = next((p for p in profiles if p.get("name") == name), None)
+        prof = self._profiles_by_name.get(item.text())
         if not prof:
             self.btn_connect.setEnabled(False)
             return
@@ -639,27 +704,10 @@ class LoginWidget(QWidget):
         if self._master_password_cache:
             return self._master_password_cache
 
-        title = "Şifreleme Parolası"
-        prompt = "Kaydedilen şifreleri şifrelemek/çözmek için bir ana parola girin."
-        pw, ok = QInputDialog.getText(self, title, prompt, QLineEdit.EchoMode.Password)
-        if not ok:
+        dlg = MasterPasswordDialog(self, confirm=confirm)
+        if dlg.exec() != QDialog.DialogCode.Accepted:
             return None
-        pw = (pw or "").strip()
-        if not pw:
-            QMessageBox.warning(self, t("login.err_title"), t("login.err_master_empty"))
-            return None
-        if confirm:
-            pw2, ok2 = QInputDialog.getText(
-                self,
-                title,
-                "Ana parolayı tekrar girin (doğrulama):",
-                QLineEdit.EchoMode.Password,
-            )
-            if not ok2:
-                return None
-            if pw2 != pw:
-                QMessageBox.warning(self, t("login.err_title"), t("login.err_master_mismatch"))
-                return None
+        pw = dlg.value()
         self._master_password_cache = pw
         return pw
 
@@ -689,6 +737,7 @@ class LoginWidget(QWidget):
                     pass
 
         self._master_password_cache = ""
+        clear_key_cache()
         QMessageBox.critical(self, t("login.err_title"), t("login.err_master_wrong"))
         return None
 
@@ -716,7 +765,7 @@ class LoginWidget(QWidget):
         return ""
 
     def pick_key(self) -> None:
-        path, _ = QFileDialog.getOpenFileName(self, t("login.ssh_key") if t("login.ssh_key") != "[login.ssh_key]" else "SSH Anahtar Seç")
+        path, _ = QFileDialog.getOpenFileName(self, tr("login.ssh_key", "SSH Anahtar Seç"))
         if path:
             self.key_path.setText(path)
 
@@ -746,8 +795,7 @@ class LoginWidget(QWidget):
             self.password.setText("")
 
     def _load_profile_by_name(self, name: str) -> dict | None:
-        profiles = load_profiles()
-        return next((p for p in profiles if p.get("name") == name), None)
+        return self._profiles_by_name.get(name)
 
     def open_add_connection_dialog(self) -> None:
         dlg = ConnectionDialog(
@@ -793,7 +841,7 @@ class LoginWidget(QWidget):
             on_save=self._save_profile_from_dialog,
             on_connect=self._save_and_connect_from_dialog,
         )
-        dlg.setWindowTitle(t("connection.edit_dialog_title") if t("connection.edit_dialog_title") != "[connection.edit_dialog_title]" else "Edit Connection")
+        dlg.setWindowTitle(tr("connection.edit_dialog_title", "Edit Connection"))
         self._editing_profile_original_name = name
         try:
             dlg.exec()
@@ -810,8 +858,8 @@ class LoginWidget(QWidget):
             return
         self.profiles_list.setCurrentItem(item)
         menu = QMenu(self)
-        act_connect = menu.addAction(t("login.connect") if t("login.connect") != "[login.connect]" else "Bağlan")
-        act_edit = menu.addAction(t("connection.edit_action") if t("connection.edit_action") != "[connection.edit_action]" else "Edit")
+        act_connect = menu.addAction(tr("login.connect", "Bağlan"))
+        act_edit = menu.addAction(tr("connection.edit_action", "Edit"))
         chosen = menu.exec(self.profiles_list.mapToGlobal(pos))
         if chosen == act_connect:
             self.connect_selected_profile()
@@ -909,7 +957,7 @@ class LoginWidget(QWidget):
                 prof["password_salt"] = enc.salt
             else:
                 # keep existing encrypted password if present (when editing profile)
-                current = next((p for p in load_profiles() if p.get("name") == name), None)
+                current = self._profiles_by_name.get(name)
                 if current:
                     for key in ("password_dpapi", "password_enc", "password_salt"):
                         if current.get(key):
@@ -964,7 +1012,18 @@ class LoginWidget(QWidget):
         return True
 
     # ---- connect / command
+    def _close_session_files(self) -> None:
+        """Release the current files backend before the session drops it."""
+        files = self._session.get("files") if hasattr(self, "_session") else None
+        if files is None:
+            return
+        try:
+            files.close()
+        except Exception:
+            pass
+
     def _finish_mock_connection(self, cfg: SSHConfig, old_ssh) -> None:
+        self._close_session_files()
         if old_ssh is not None:
             try:
                 old_ssh.close()
@@ -981,7 +1040,7 @@ class LoginWidget(QWidget):
             "files": files,
             "profile_name": self.profile_name.text().strip(),
         }
-        self.status_label.setText(t("login.status_mock") if t("login.status_mock") != "[login.status_mock]" else "Mock mod")
+        self.status_label.setText(tr("login.status_mock", "Mock mod"))
         self.cmd_in.set_connected(False)
         self.append_console("Mock bağlantı aktif.")
         append_event({"type": "connect", "host": cfg.host, "user": cfg.username, "dry_run": True})
@@ -1001,7 +1060,7 @@ class LoginWidget(QWidget):
         if not password:
             name = (self.profile_name.text() or "").strip()
             if name:
-                prof = next((p for p in load_profiles() if p.get("name") == name), None)
+                prof = self._profiles_by_name.get(name)
                 if prof and prof.get("save_password"):
                     password = self._decrypt_profile_password(
                         prof,
@@ -1046,7 +1105,7 @@ class LoginWidget(QWidget):
             else:
                 return self._begin_connect_async(cfg, old_ssh)
         except Exception as e:
-            self.status_label.setText(t("login.status_disconnected") if t("login.status_disconnected") != "[login.status_disconnected]" else "Bağlı değil")
+            self.status_label.setText(tr("login.status_disconnected", "Bağlı değil"))
             self.append_console(t("login.conn_error_prefix").format(err=e))
             msg = str(e)
             if "SSH protocol banner" in msg or "banner" in msg.lower():
@@ -1106,11 +1165,14 @@ class LoginWidget(QWidget):
         if not self._session.get("connected", False):
             return
         self._session["connected"] = False
-        self.status_label.setText(t("login.status_disconnected") if t("login.status_disconnected") != "[login.status_disconnected]" else "Bağlı değil")
+        self.status_label.setText(tr("login.status_disconnected", "Bağlı değil"))
         self.cmd_in.set_connected(False)
-        notice = t("login.reconnect_notice").format(reason=reason or "")
-        if notice != "[login.reconnect_notice]":
-            self.append_console(notice)
+        self.append_console(
+            tr(
+                "login.reconnect_notice",
+                "SSH connection dropped: {reason}\nPress r or choose Yes to reconnect.",
+            ).format(reason=reason or "")
+        )
         self.session_changed.emit(self._session)
         self._prompt_reconnect()
 
@@ -2,26 +2,35 @@ from __future__ import annotations
 
 from PySide6.QtCore import QTimer
 from PySide6.QtGui import QTextCursor, QGuiApplication
-from PySide6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QTextEdit, QLabel, QFileDialog, QMessageBox
+from PySide6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QPlainTextEdit, QLabel, QFileDialog, QMessageBox
 
-from truba_gui.core.i18n import t
+from truba_gui.core.i18n import t, tr
 from truba_gui.core.logging import log_path
 from truba_gui.core.diagnostics import create_diagnostic_bundle
 
+
+_TAIL_BYTES = 16384
+_MAX_LOG_LINES = 500
+
+
 class LogsWidget(QWidget):
     def __init__(self):
         super().__init__()
         self.setObjectName("LogsWidget")
         self._last_signature = None
+        # Byte offset of the log file already shown; growth since then is
+        # appended instead of re-reading and re-laying out the whole tail.
+        self._read_offset = 0
 
-        self.lbl = QLabel(t("logs.title") if t("logs.title") != "[logs.title]" else "Logs")
-        self.txt = QTextEdit()
+        self.lbl = QLabel(tr("logs.title", "Logs"))
+        self.txt = QPlainTextEdit()
         self.txt.setReadOnly(True)
+        self.txt.setMaximumBlockCount(_MAX_LOG_LINES)
 
-        self.btn_refresh = QPushButton(t("logs.refresh") if t("logs.refresh") != "[logs.refresh]" else "Yenile")
+        self.btn_refresh = QPushButton(tr("logs.refresh", "Yenile"))
         self.btn_refresh.clicked.connect(self.refresh)
 
-        self.btn_copy = QPushButton(t("logs.copy") if t("logs.copy") != "[logs.copy]" else "Kopyala")
+        self.btn_copy = QPushButton(tr("logs.copy", "Kopyala"))
         self.btn_copy.clicked.connect(self.copy_all)
 
         self.btn_copy_path = QPushButton(t("logs.copy_path"))
@@ -42,20 +51,29 @@ class LogsWidget(QWidget):
         lay.addLayout(top)
         lay.addWidget(self.txt)
 
-        # light auto-refresh
+        # light auto-refresh, only while the tab is shown (see show/hideEvent)
         self._timer = QTimer(self)
         self._timer.setInterval(1500)
-        self._timer.timeout.connect(self.refresh)
+        self._timer.timeout.connect(self._auto_refresh)
 
     def showEvent(self, event) -> None:
         super().showEvent(event)
-        self.refresh()
-        self._timer.start()
+        if not self._timer.isActive():
+            self.refresh()
+            self._timer.start()
 
     def hideEvent(self, event) -> None:
         self._timer.stop()
         super().hideEvent(event)
 
+    def _auto_refresh(self) -> None:
+        # A minimized window does not hide its children, so the tab still
+        # counts as visible; skip the disk read until it is restored.
+        window = self.window()
+        if window is not None and window.isMinimized():
+            return
+        self.refresh()
+
     def retranslate_ui(self) -> None:
         self.lbl.setText(t("logs.title"))
         self.btn_refresh.setText(t("logs.refresh"))
@@ -66,6 +84,8 @@ class LogsWidget(QWidget):
     def refresh(self) -> None:
         p = log_path()
         if not p.exists():
+            self._last_signature = None
+            self._read_offset = 0
             self.txt.setPlainText(t("logs.not_created").format(path=str(p)))
             return
         try:
@@ -73,17 +93,31 @@ class LogsWidget(QWidget):
             signature = (stat.st_size, stat.st_mtime_ns)
             if signature == self._last_signature:
                 return
-            self._last_signature = signature
+            offset = self._read_offset
+            # First read, rotation/truncation, or a burst larger than the tail
+            # window: reload the tail. Otherwise read only the new bytes.
+            reload = (
+                offset <= 0
+                or stat.st_size < offset
+                or stat.st_size - offset > _TAIL_BYTES
+            )
+            start = max(0, stat.st_size - _TAIL_BYTES) if reload else offset
             with p.open("rb") as stream:
-                stream.seek(max(0, stat.st_size - 16384))
-                data = stream.read().decode("utf-8", errors="replace")
+                stream.seek(start)
+                data = stream.read(stat.st_size - start).decode("utf-8", errors="replace")
         except Exception as e:
+            self._last_signature = None
+            self._read_offset = 0
             self.txt.setPlainText(t("logs.read_failed").format(err=str(e)))
             return
-        # tail last ~4000 chars
-        if len(data) > 4000:
-            data = data[-4000:]
-        self.txt.setPlainText(data)
+        self._last_signature = signature
+        self._read_offset = stat.st_size
+        if reload:
+            self.txt.setPlainText(data)
+        elif data:
+            cursor = self.txt.textCursor()
+            cursor.movePosition(QTextCursor.End)
+            cursor.insertText(data)
         self.txt.moveCursor(QTextCursor.End)
 
     def copy_all(self) -> None:
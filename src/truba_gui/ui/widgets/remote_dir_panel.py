@@ -1,19 +1,21 @@
 from __future__ import annotations
 
-import datetime
 import json
 import os
 import re
 import shutil
 import stat as pystat
+import struct
+import time
 import weakref
 from time import monotonic
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Callable, Dict, Generator, Iterable, List, Optional, Tuple
+from typing import Callable, Dict, Generator, Iterable, Iterator, List, Optional, Tuple
 
-from PySide6.QtCore import QEvent, QPoint, Qt, Signal, QObject, QThread, Slot, QTimer
-from PySide6.QtGui import QDrag, QIcon, QKeyEvent, QKeySequence, QShortcut
+from PySide6.QtCore import QEvent, QEventLoop, QPoint, Qt, Signal, QObject, QThread, QThreadPool, Slot, QTimer
+from PySide6.QtGui import QAction, QDrag, QIcon, QKeyEvent, QKeySequence, QShortcut
 from PySide6.QtCore import QMimeData
 from PySide6.QtWidgets import (
     QApplication,
@@ -23,7 +25,6 @@ from PySide6.QtWidgets import (
     QFileDialog,
     QGridLayout,
     QGroupBox,
-    QListWidget,
     QHBoxLayout,
     QInputDialog,
     QLabel,
@@ -42,7 +43,7 @@ from PySide6.QtWidgets import (
     QWidget,
 )
 
-from truba_gui.core.i18n import t
+from truba_gui.core.i18n import t, tr
 from truba_gui.core.ui_errors import show_exception
 from truba_gui.config.storage import (
     get_transfer_parallelism,
@@ -57,6 +58,7 @@ from truba_gui.services.transfer_mode import (
     normalize_transfer_mode,
     upload_with_mode,
 )
+from truba_gui.ui.async_call import AsyncCall
 from truba_gui.ui.dialogs.transfer_conflict_dialog import (
     TransferConflictDecision,
     TransferConflictDialog,
@@ -68,62 +70,136 @@ from truba_gui.ui.dialogs.transfer_dialog import (
     TransferPreflightDialog,
 )
 
+try:
+    import orjson
+except ImportError:  # optional speedup; stdlib json is the fallback
+    orjson = None
+
+
+_SIZE_UNITS = ("B", "KB", "MB", "GB", "TB")
+
 
 def _fmt_size(n: int) -> str:
     try:
         n = int(n)
     except Exception:
         return ""
-    units = ["B", "KB", "MB", "GB", "TB"]
-    v = float(n)
-    i = 0
-    while v >= 1024 and i < len(units) - 1:
-        v /= 1024.0
-        i += 1
-    return f"{v:.1f} {units[i]}" if i else f"{int(v)} {units[i]}"
+    if n < 1024:
+        return f"{n} B"
+    # Each unit is 2**10 of the previous one, so the bit length picks it.
+    i = min(len(_SIZE_UNITS) - 1, (n.bit_length() - 1) // 10)
+    return f"{n / (1 << (10 * i)):.1f} {_SIZE_UNITS[i]}"
 
 
+@lru_cache(maxsize=4096)
 def _fmt_mtime(ts: int) -> str:
+    # Listings repeat timestamps a lot (batch-written job outputs), hence
+    # the cache; time.strftime also skips building a datetime per row.
     if not ts:
         return ""
     try:
-        return datetime.datetime.fromtimestamp(int(ts)).strftime("%d-%m-%y %H:%M")
+        return time.strftime("%d-%m-%y %H:%M", time.localtime(int(ts)))
     except Exception:
         return ""
 
 
+_EXT_TO_TYPE = {
+    "iso": "Disc Image File",
+    "zip": "WinRAR ZIP archive",
+    "rar": "WinRAR ZIP archive",
+    "7z": "WinRAR ZIP archive",
+    "tgz": "TAR archive",
+    "tar.gz": "TAR archive",
+    "tar": "TAR archive",
+}
+_EXT_TO_CATEGORY = {
+    "iso": "iso",
+    "zip": "archives",
+    "rar": "archives",
+    "7z": "archives",
+    "tgz": "archives",
+    "tar.gz": "archives",
+    "tar": "archives",
+    "sh": "shell",
+    "slurm": "slurm",
+    "sbatch": "slurm",
+}
+
+
+def _extension(name: str) -> str:
+    """Lower-case last suffix of ``name``; ``.tar.gz`` counts as one suffix."""
+    head, sep, ext = name.rpartition(".")
+    if not sep:
+        return ""
+    ext = ext.lower()
+    if ext == "gz" and head.lower().endswith(".tar"):
+        return "tar.gz"
+    return ext
+
+
 def _file_type(name: str, is_dir: bool) -> str:
     if is_dir:
-        return t("dirs.type_folder") if t("dirs.type_folder") != "[dirs.type_folder]" else "Klasör"
-    lower = name.lower()
-    if lower.endswith(".iso"):
-        return "Disc Image File"
-    if lower.endswith((".zip", ".rar", ".7z")):
-        return "WinRAR ZIP archive"
-    if lower.endswith((".tgz", ".tar.gz", ".tar")):
-        return "TAR archive"
+        return tr("dirs.type_folder", "Klasör")
+    return _file_type_for_ext(name, _extension(name))
+
+
+def _file_type_for_ext(name: str, ext: str) -> str:
+    file_type = _EXT_TO_TYPE.get(ext)
+    if file_type is not None:
+        return file_type
     if "." in name:
-        return name.split(".")[-1].upper() + " File"
+        return name.rpartition(".")[2].upper() + " File"
     return "File"
 
 
 def _category(entry: RemoteEntry) -> str:
     if entry.is_dir:
         return "folders"
-    lower = entry.name.lower()
-    if lower.endswith(".iso"):
-        return "iso"
-    if lower.endswith((".zip", ".rar", ".7z", ".tgz", ".tar.gz", ".tar")):
-        return "archives"
-    if lower.endswith(".sh"):
-        return "shell"
-    if lower.endswith((".slurm", ".sbatch")):
-        return "slurm"
-    return "other"
-
+    return _EXT_TO_CATEGORY.get(_extension(entry.name), "other")
+
+
+_KEY_MOD_ANY = object()
+_KEY_MOD_NONE = object()
+_CTRL = Qt.KeyboardModifier.ControlModifier
+# Tree view key -> (required modifiers, RemoteDirPanel handler name).  A
+# handler returns True when it consumed the key.
+_VIEW_KEY_BINDINGS = {
+    Qt.Key.Key_Backspace: (_KEY_MOD_NONE, "_key_go_parent"),
+    Qt.Key.Key_Delete: (_KEY_MOD_ANY, "_key_delete"),
+    Qt.Key.Key_F5: (_KEY_MOD_NONE, "_key_refresh"),
+    Qt.Key.Key_F2: (_KEY_MOD_NONE, "_key_rename"),
+    Qt.Key.Key_C: (_CTRL, "_key_copy"),
+    Qt.Key.Key_X: (_CTRL, "_key_cut"),
+    Qt.Key.Key_V: (_CTRL, "_key_paste"),
+    Qt.Key.Key_Z: (_CTRL, "_key_undo"),
+}
 
 MIME_REMOTE_PATHS = "application/x-truba-remote-paths"
 DIRECTORY_CACHE_TTL_SECONDS = 3600.0
+_COLUMN_FIT_SAMPLE_ROWS = 64
+# Columns whose width depends on the listing. Size texts have a bounded
+# width (see _fmt_size) and the last column stretches, so neither is fitted.
+_FITTED_COLUMNS = (0, 2)
+_SIZE_COLUMN_SAMPLE = "9999.9 MB"
+# Category views in tab order, with their label keys and fallbacks.
+_VIEW_TABS = (
+    ("all", "Tümü"),
+    ("folders", "Klasörler"),
+    ("iso", "ISO"),
+    ("archives", "Arşivler"),
+    ("slurm", "Slurm"),
+    ("shell", "SH"),
+    ("other", "Diğer"),
+)
+
+
+def _view_header_labels() -> List[str]:
+    return [
+        tr("dirs.col_name", "Filename"),
+        tr("dirs.col_size", "Filesize"),
+        tr("dirs.col_type", "Filetype"),
+        tr("dirs.col_mtime", "Last modified"),
+    ]
 
 REMOTE_CONTEXT_MENU_LABELS = [
     "Download",
@@ -157,11 +233,6 @@ def _natural_sort_key(value: str) -> tuple:
     )
 
 
-def _tr(key: str, fallback: str) -> str:
-    value = t(key)
-    return fallback if value == f"[{key}]" else value
-
-
 class _PermissionsDialog(QDialog):
     _GROUPS = (
         ("dirs.permissions_owner", "Owner"),
@@ -184,40 +255,40 @@ class _PermissionsDialog(QDialog):
         self._syncing = False
         self._boxes: Dict[Tuple[int, int], QCheckBox] = {}
         self._special_boxes: Dict[int, QCheckBox] = {}
-        self.setWindowTitle(_tr("dirs.permissions_change_title", "Change file attributes"))
+        self.setWindowTitle(tr("dirs.permissions_change_title", "Change file attributes"))
         self.setModal(True)
 
         layout = QVBoxLayout(self)
 
         intro = QLabel(
-            _tr(
+            tr(
                 "dirs.permissions_intro",
                 'Please select the new attributes for the selected item "{name}".',
-            ).format(name=target_name or _tr("dirs.permissions_selected_items", "selected items"))
+            ).format(name=target_name or tr("dirs.permissions_selected_items", "selected items"))
         )
         intro.setWordWrap(True)
         layout.addWidget(intro)
 
         for group_index, (group_key, group_fallback) in enumerate(self._GROUPS):
             box_group = QGroupBox(
-                _tr("dirs.permissions_group_title", "{group} permissions").format(
-                    group=_tr(group_key, group_fallback)
+                tr("dirs.permissions_group_title", "{group} permissions").format(
+                    group=tr(group_key, group_fallback)
                 )
             )
             row = QHBoxLayout(box_group)
             for permission_index, (key, fallback, _bit) in enumerate(self._PERMISSIONS):
                 box = QCheckBox()
-                box.setText(_tr(key, fallback))
+                box.setText(tr(key, fallback))
                 box.stateChanged.connect(self._update_code_from_checks)
                 row.addWidget(box)
                 self._boxes[(permission_index, group_index)] = box
             row.addStretch(1)
             layout.addWidget(box_group)
 
-        special_group = QGroupBox(_tr("dirs.permissions_special_title", "Public permissions"))
+        special_group = QGroupBox(tr("dirs.permissions_special_title", "Public permissions"))
         special_row = QHBoxLayout(special_group)
         for key, fallback, bit in self._SPECIAL_PERMISSIONS:
-            box = QCheckBox(_tr(key, fallback))
+            box = QCheckBox(tr(key, fallback))
             box.stateChanged.connect(self._update_code_from_checks)
             special_row.addWidget(box)
             self._special_boxes[bit] = box
@@ -225,7 +296,7 @@ class _PermissionsDialog(QDialog):
         layout.addWidget(special_group)
 
         code_row = QHBoxLayout()
-        code_row.addWidget(QLabel(_tr("dirs.permissions_chmod_label", "Chmod:")))
+        code_row.addWidget(QLabel(tr("dirs.permissions_chmod_label", "Chmod:")))
         self.mode_edit = QLineEdit()
         self.mode_edit.setMaxLength(5)
         self.mode_edit.setPlaceholderText("00755")
@@ -234,7 +305,7 @@ class _PermissionsDialog(QDialog):
         layout.addLayout(code_row)
 
         help_label = QLabel(
-            _tr(
+            tr(
                 "dirs.permissions_help",
                 "You can enter a textual mode change (chmod), or the new mode bits in octal.",
             )
@@ -242,17 +313,17 @@ class _PermissionsDialog(QDialog):
         help_label.setWordWrap(True)
         layout.addWidget(help_label)
 
-        self.recurse_check = QCheckBox(_tr("dirs.permissions_recurse", "Recurse into subdirectories"))
+        self.recurse_check = QCheckBox(tr("dirs.permissions_recurse", "Recurse into subdirectories"))
         self.recurse_check.setEnabled(False)
         layout.addWidget(self.recurse_check)
         self.recurse_all_radio = QRadioButton(
-            _tr("dirs.permissions_recurse_all", "Apply to all files and directories")
+            tr("dirs.permissions_recurse_all", "Apply to all files and directories")
         )
         self.recurse_files_radio = QRadioButton(
-            _tr("dirs.permissions_recurse_files", "Apply to files only")
+            tr("dirs.permissions_recurse_files", "Apply to files only")
         )
         self.recurse_dirs_radio = QRadioButton(
-            _tr("dirs.permissions_recurse_dirs", "Apply to directories only")
+            tr("dirs.permissions_recurse_dirs", "Apply to directories only")
         )
         self.recurse_all_radio.setChecked(True)
         for radio in (self.recurse_all_radio, self.recurse_files_radio, self.recurse_dirs_radio):
@@ -321,7 +392,7 @@ class _PermissionsDialog(QDialog):
             QMessageBox.warning(
                 self,
                 t("common.error"),
-                _tr("dirs.permissions_invalid", "Enter a valid octal mode such as 755 or 0644."),
+                tr("dirs.permissions_invalid", "Enter a valid octal mode such as 755 or 0644."),
             )
             return
         super().accept()
@@ -333,15 +404,47 @@ class _DragPayload:
     src_panel_id: str
 
 
+# Drag payload layout: magic, then length-prefixed UTF-8 strings
+# (uint32 little-endian): the source panel id, a path count, each path.
+_PAYLOAD_MAGIC = b"TRDP\x01"
+_U32 = struct.Struct("<I")
+
+
 def _encode_payload(payload: _DragPayload) -> bytes:
-    return json.dumps({"paths": payload.paths, "src_panel_id": payload.src_panel_id}).encode("utf-8")
+    parts = [_PAYLOAD_MAGIC]
+    panel_id = payload.src_panel_id.encode("utf-8")
+    parts += [_U32.pack(len(panel_id)), panel_id, _U32.pack(len(payload.paths))]
+    for path in payload.paths:
+        raw = path.encode("utf-8")
+        parts += [_U32.pack(len(raw)), raw]
+    return b"".join(parts)
 
 
 def _decode_payload(raw: bytes) -> Optional[_DragPayload]:
     try:
-        obj = json.loads(raw.decode("utf-8"))
-        paths = [str(p) for p in obj.get("paths", []) if p]
-        src_panel_id = str(obj.get("src_panel_id", ""))
+        if not raw.startswith(_PAYLOAD_MAGIC):
+            # JSON payload from an older build.
+            obj = json.loads(raw.decode("utf-8"))
+            paths = [str(p) for p in obj.get("paths", []) if p]
+            src_panel_id = str(obj.get("src_panel_id", ""))
+        else:
+            view = memoryview(raw)
+            offset = len(_PAYLOAD_MAGIC)
+
+            def read_text() -> str:
+                nonlocal offset
+                (size,) = _U32.unpack_from(view, offset)
+                offset += _U32.size
+                if offset + size > len(view):
+                    raise ValueError("truncated drag payload")
+                text = str(view[offset:offset + size], "utf-8")
+                offset += size
+                return text
+
+            src_panel_id = read_text()
+            (count,) = _U32.unpack_from(view, offset)
+            offset += _U32.size
+            paths = [p for p in (read_text() for _ in range(count)) if p]
         if not paths or not src_panel_id:
             return None
         return _DragPayload(paths=paths, src_panel_id=src_panel_id)
@@ -357,6 +460,169 @@ class _PlannedOp:
     recursive: Optional[bool] = False
 
 
+class _RemoteDirIndex:
+    """Answer exists/is_dir for planning from one listing per directory.
+
+    Only directories passed as ``listed_dirs`` are listed (callers pick
+    those probed more than once); other paths, and directories whose
+    listing fails, fall back to the backend's per-path calls.
+    """
+
+    def __init__(self, files, listed_dirs: Iterable[str]) -> None:
+        self._files = files
+        self._listed_dirs = {d.rstrip("/") or "/" for d in listed_dirs}
+        self._entries: Dict[str, Optional[Dict[str, RemoteEntry]]] = {}
+
+    def _listed_entry(self, remote_path: str) -> Tuple[bool, Optional[RemoteEntry]]:
+        clean = remote_path.rstrip("/")
+        parent, _sep, name = clean.rpartition("/")
+        parent = parent or "/"
+        if parent not in self._listed_dirs or not name:
+            return False, None
+        if parent not in self._entries:
+            try:
+                listing = self._files.listdir_entries(parent)
+                self._entries[parent] = {entry.name: entry for entry in listing}
+            except Exception:
+                self._entries[parent] = None
+        by_name = self._entries[parent]
+        if by_name is None:
+            return False, None
+        return True, by_name.get(name)
+
+    def _entry(self, remote_path: str) -> Tuple[bool, Optional[RemoteEntry]]:
+        known, entry = self._listed_entry(remote_path)
+        if entry is not None and pystat.S_ISLNK(entry.mode):
+            # A listing describes the link itself; the backend's per-path
+            # calls follow it to the target (and see dangling links).
+            return False, None
+        return known, entry
+
+    def is_symlink(self, remote_path: str) -> bool:
+        """True when ``remote_path`` itself is a symlink.
+
+        Unlisted paths are lstat'ed through the backend, which raises when
+        it cannot tell.
+        """
+        known, entry = self._listed_entry(remote_path)
+        if known:
+            return entry is not None and pystat.S_ISLNK(entry.mode)
+        return bool(self._files.is_symlink(remote_path))
+
+    def exists(self, remote_path: str) -> bool:
+        known, entry = self._entry(remote_path)
+        if known:
+            return entry is not None
+        return bool(self._files.exists(remote_path))
+
+    def is_dir(self, remote_path: str) -> bool:
+        known, entry = self._entry(remote_path)
+        if known:
+            return bool(entry is not None and entry.is_dir)
+        return bool(self._files.is_dir(remote_path))
+
+
+def _dirs_probed_repeatedly(remote_paths: Iterable[str]) -> List[str]:
+    counts: Dict[str, int] = {}
+    for path in remote_paths:
+        parent = path.rstrip("/").rpartition("/")[0] or "/"
+        counts[parent] = counts.get(parent, 0) + 1
+    return [parent for parent, count in counts.items() if count > 1]
+
+
+# One scan classifies an operation error; the group name picks the message.
+_OP_ERROR_RE = re.compile(
+    r"(?P<denied>permission denied|access is denied)"
+    r"|(?P<full>no space left on device|quota exceeded)"
+    r"|(?P<readonly>read-only file system)",
+    re.IGNORECASE,
+)
+_OP_ERROR_MESSAGES: Dict[str, Tuple[str, str]] = {
+    "denied": (
+        "İzin yok (Permission denied)",
+        "Bu işlem için gerekli izinlerin yok. (chmod/chown veya doğru dizin?)",
+    ),
+    "full": (
+        "Disk dolu / Kota aşıldı",
+        "Hedef tarafta boş alan kalmamış veya kota limitine ulaşıldı.",
+    ),
+    "readonly": (
+        "Salt okunur dosya sistemi",
+        "Hedef dosya sistemi read-only. Yazma işlemi yapılamaz.",
+    ),
+}
+
+
+def _walk_local_tree(base: str) -> Iterator[Tuple[str, str, List[str], List[str]]]:
+    """Top-down walk like ``os.walk`` yielding ``(path, rel, dirs, files)``.
+
+    ``rel`` is "/"-joined ("" for ``base``) so callers can append it to a
+    remote path directly. Directory entries come from ``os.scandir`` and
+    symlinked directories are listed but not descended, as in ``os.walk``.
+    """
+    stack: List[Tuple[str, str]] = [(base, "")]
+    while stack:
+        path, rel = stack.pop()
+        dirs: List[str] = []
+        files: List[str] = []
+        subdirs: List[Tuple[str, str]] = []
+        try:
+            with os.scandir(path) as it:
+                for entry in it:
+                    try:
+                        is_dir = entry.is_dir()
+                    except OSError:
+                        is_dir = False
+                    if not is_dir:
+                        files.append(entry.name)
+                        continue
+                    dirs.append(entry.name)
+                    try:
+                        is_link = entry.is_symlink()
+                    except OSError:
+                        is_link = False
+                    if not is_link:
+                        subdirs.append((entry.path, rel + "/" + entry.name if rel else entry.name))
+        except OSError:
+            continue
+        yield path, rel, dirs, files
+        stack.extend(reversed(subdirs))
+
+
+# Threads dropped by a panel while still running. Keeping a reference until
+# QThread.finished stops Qt from destroying a running thread.
+_RETIRED_THREADS: set[QThread] = set()
+
+
+def _retire_thread(thread: QThread) -> None:
+    if not thread.isRunning():
+        return
+    _RETIRED_THREADS.add(thread)
+    thread.finished.connect(lambda current=thread: _RETIRED_THREADS.discard(current))
+
+
+def wait_for_retired_threads(timeout_ms: int = 1500) -> None:
+    """Run the event loop until retired threads finish, for at most ``timeout_ms``.
+
+    Called at application exit so Qt does not destroy a thread that is
+    still running.
+    """
+    threads = [thread for thread in _RETIRED_THREADS if thread.isRunning()]
+    if not threads:
+        return
+    loop = QEventLoop()
+    deadline = QTimer()
+    deadline.setSingleShot(True)
+    deadline.timeout.connect(loop.quit)
+    for thread in threads:
+        # Queued to this thread, so a finish before exec() still wakes the loop.
+        thread.finished.connect(loop.quit)
+    deadline.start(timeout_ms)
+    while deadline.isActive() and any(thread.isRunning() for thread in threads):
+        loop.exec()
+    deadline.stop()
+
+
 @dataclass
 class _LocalUploadPlanJob:
     steps: Generator[None, None, Optional[List[_PlannedOp]]]
@@ -396,6 +662,15 @@ class _UndoRecord:
     moves: List[Tuple[str, str]]  # (src, dst) executed
 
 
+class _UndoBus(QObject):
+    """Announces changes to the shared undo record to every live panel."""
+
+    changed = Signal()
+
+
+_UNDO_BUS = _UndoBus()
+
+
 class _FileOpWorker(QObject):
     progress = Signal(int, str)  # step, label
     finished = Signal(bool, str)  # cancelled, message
@@ -462,6 +737,8 @@ class _RemoteTree(QTreeWidget):
         self._panel = panel
         self._sort_column: Optional[int] = None
         self._sort_order = Qt.SortOrder.AscendingOrder
+        # "remote" / "local" while an acceptable drag hovers the tree.
+        self._drag_accept_mode: Optional[str] = None
 
         self.setDragEnabled(True)
         self.setAcceptDrops(True)
@@ -555,26 +832,32 @@ class _RemoteTree(QTreeWidget):
         super().mouseReleaseEvent(event)
 
     def dragEnterEvent(self, event):  # type: ignore[override]
+        # The payload cannot change mid-drag, so classify it once here and
+        # let the move events (fired per mouse move) reuse the answer.
         md = event.mimeData()
         if md.hasFormat(MIME_REMOTE_PATHS):
-            event.acceptProposedAction()
-            return
-        if self._panel._local_paths_from_mime(md):
+            self._drag_accept_mode = "remote"
+        elif md.hasUrls() and any(url.isLocalFile() for url in md.urls()):
+            self._drag_accept_mode = "local"
+        else:
+            self._drag_accept_mode = None
+        if self._drag_accept_mode is not None:
             event.acceptProposedAction()
             return
         super().dragEnterEvent(event)
 
     def dragMoveEvent(self, event):  # type: ignore[override]
-        md = event.mimeData()
-        if md.hasFormat(MIME_REMOTE_PATHS):
-            event.acceptProposedAction()
-            return
-        if self._panel._local_paths_from_mime(md):
+        if self._drag_accept_mode is not None:
             event.acceptProposedAction()
             return
         super().dragMoveEvent(event)
 
+    def dragLeaveEvent(self, event):  # type: ignore[override]
+        self._drag_accept_mode = None
+        super().dragLeaveEvent(event)
+
     def dropEvent(self, event):  # type: ignore[override]
+        self._drag_accept_mode = None
         md = event.mimeData()
         # 1) Remote->Remote drag payload
         if md.hasFormat(MIME_REMOTE_PATHS):
@@ -664,6 +947,13 @@ class RemoteDirPanel(QWidget):
         self._next_planning_job_id = 0
         self._show_transfer_dialog = True
         self._directory_cache: Dict[str, Tuple[float, List[RemoteEntry]]] = {}
+        self._listing_generation = 0
+        self._listing_workers: Dict[tuple, AsyncCall] = {}
+        # Whether the OS clipboard holds local file URLs; None until the
+        # next context menu asks, reset whenever the clipboard changes.
+        self._clipboard_has_local_urls: Optional[bool] = None
+        self._conflict_dialog: Optional[TransferConflictDialog] = None
+        QApplication.clipboard().dataChanged.connect(self._on_system_clipboard_changed)
 
         self.panel_id = str(id(self))
         RemoteDirPanel._instances[self.panel_id] = self
@@ -682,43 +972,49 @@ class RemoteDirPanel(QWidget):
         self.path = QLineEdit()
         self.path.returnPressed.connect(self._open_path_field)
 
-        self.btn_upload = QPushButton(t("dirs.upload") if t("dirs.upload") != "[dirs.upload]" else "Yükle")
+        self.btn_upload = QPushButton(tr("dirs.upload", "Yükle"))
         self.btn_upload.clicked.connect(self.upload_files)
 
         self.btn_new_folder = QPushButton(
-            t("dirs.new_folder") if t("dirs.new_folder") != "[dirs.new_folder]" else "Yeni Klasör"
+            tr("dirs.new_folder", "Yeni Klasör")
         )
         self.btn_new_folder.clicked.connect(self.create_new_folder)
 
         self.btn_new_file = QPushButton(
-            t("dirs.new_file") if t("dirs.new_file") != "[dirs.new_file]" else "Yeni Dosya"
+            tr("dirs.new_file", "Yeni Dosya")
         )
         self.btn_new_file.clicked.connect(self.create_new_file)
 
         self.btn_template_upload = QPushButton(
-            t("dirs.template_upload") if t("dirs.template_upload") != "[dirs.template_upload]" else "Template Upload"
+            tr("dirs.template_upload", "Template Upload")
         )
         self.btn_template_upload.clicked.connect(self.show_template_upload_menu)
 
         self.btn_download = QPushButton(
-            t("dirs.download_selected") if t("dirs.download_selected") != "[dirs.download_selected]" else "Seçilenleri İndir"
+            tr("dirs.download_selected", "Seçilenleri İndir")
         )
         self.btn_download.clicked.connect(self.download_selected)
 
-        self.btn_delete = QPushButton(t("dirs.delete") if t("dirs.delete") != "[dirs.delete]" else "Sil")
+        self.btn_delete = QPushButton(tr("dirs.delete", "Sil"))
         self.btn_delete.clicked.connect(self.delete_selected)
 
-        self.btn_undo = QPushButton(t("dirs.undo") if t("dirs.undo") != "[dirs.undo]" else "Geri Al")
+        self.btn_undo = QPushButton(tr("dirs.undo", "Geri Al"))
         self.btn_undo.clicked.connect(self.undo_last)
 
+        st = self.style()
+        # Row icons are shared by every entry; build them once per panel.
+        self._icon_dir = st.standardIcon(QStyle.StandardPixmap.SP_DirIcon)
+        self._icon_iso = st.standardIcon(QStyle.StandardPixmap.SP_DriveDVDIcon)
+        self._icon_file = st.standardIcon(QStyle.StandardPixmap.SP_FileIcon)
+
         self.btn_parent = QToolButton()
         self.btn_parent.setAutoRaise(False)
         self.btn_parent.setToolButtonStyle(Qt.ToolButtonStyle.ToolButtonIconOnly)
-        self.btn_parent.setIcon(self.style().standardIcon(QStyle.StandardPixmap.SP_ArrowUp))
+        self.btn_parent.setIcon(st.standardIcon(QStyle.StandardPixmap.SP_ArrowUp))
         self.btn_parent.clicked.connect(self.go_parent)
         self.btn_parent.setEnabled(False)
 
-        self.btn_refresh = QPushButton(t("dirs.refresh") if t("dirs.refresh") != "[dirs.refresh]" else "Yenile")
+        self.btn_refresh = QPushButton(tr("dirs.refresh", "Yenile"))
         self.btn_refresh.clicked.connect(lambda: self.refresh(force=True))
 
         self.refresh_shortcut = QShortcut(QKeySequence.Refresh, self)
@@ -744,24 +1040,26 @@ class RemoteDirPanel(QWidget):
         self.directory_tabs.currentChanged.connect(self._on_directory_tab_changed)
 
         self.tabs = QTabWidget()
+        # Views whose columns were already fitted; later refreshes keep the
+        # widths instead of rescanning every row.
+        self._columns_sized: set[str] = set()
+        # Hidden category views are filled from the last listing on first
+        # show rather than on every refresh.
+        self._views_needing_fill: set[str] = set()
+        self._view_listing: Tuple[str, List[RemoteEntry]] = ("", [])
+        # (entry, type label, category, icon) per entry of _view_listing,
+        # computed by the first view fill and shared by the others.
+        self._view_classified: Optional[List[Tuple[RemoteEntry, str, str, QIcon]]] = None
+        # Translate the shared header labels once for all category views.
+        self._headers = _view_header_labels()
+        # Header "Fit columns" actions, kept for retranslate_ui.
+        self._fit_column_actions: List[QAction] = []
         self.views: Dict[str, _RemoteTree] = {
-            "all": self._make_view(),
-            "folders": self._make_view(),
-            "iso": self._make_view(),
-            "archives": self._make_view(),
-            "slurm": self._make_view(),
-            "shell": self._make_view(),
-            "other": self._make_view(),
+            key: self._make_view() for key, _ in _VIEW_TABS
         }
-        self.tabs.addTab(self.views["all"], t("dirs.tab_all") if t("dirs.tab_all") != "[dirs.tab_all]" else "Tümü")
-        self.tabs.addTab(self.views["folders"], t("dirs.tab_folders") if t("dirs.tab_folders") != "[dirs.tab_folders]" else "Klasörler")
-        self.tabs.addTab(self.views["iso"], t("dirs.tab_iso") if t("dirs.tab_iso") != "[dirs.tab_iso]" else "ISO")
-        self.tabs.addTab(
-            self.views["archives"], t("dirs.tab_archives") if t("dirs.tab_archives") != "[dirs.tab_archives]" else "Arşivler"
-        )
-        self.tabs.addTab(self.views["slurm"], t("dirs.tab_slurm") if t("dirs.tab_slurm") != "[dirs.tab_slurm]" else "Slurm")
-        self.tabs.addTab(self.views["shell"], t("dirs.tab_shell") if t("dirs.tab_shell") != "[dirs.tab_shell]" else "SH")
-        self.tabs.addTab(self.views["other"], t("dirs.tab_other") if t("dirs.tab_other") != "[dirs.tab_other]" else "Diğer")
+        self._view_to_key: Dict[QWidget, str] = {v: k for k, v in self.views.items()}
+        for key, default in _VIEW_TABS:
+            self.tabs.addTab(self.views[key], tr(f"dirs.tab_{key}", default))
         self.tabs.currentChanged.connect(self._on_tab_changed)
 
         lay = QVBoxLayout(self)
@@ -772,29 +1070,13 @@ class RemoteDirPanel(QWidget):
         lay.addWidget(self.directory_tabs)
         lay.addWidget(self.tabs)
 
-        # Transfer queue (batch view)
-        self.queue_group = QGroupBox(t("dirs.queue_title") if t("dirs.queue_title") != "[dirs.queue_title]" else "İşlem Kuyruğu")
-        qlay = QVBoxLayout(self.queue_group)
-        self.queue_current = QLabel("-")
-        self.queue_list = QListWidget()
-        self.queue_list.setMinimumHeight(80)
-        self.queue_current_label = QLabel(t("dirs.queue_current"))
-        qlay.addWidget(self.queue_current_label)
-
         # ---- active batch tracking (for graceful shutdown / diagnostics)
         self._active_thread: Optional[QThread] = None
         self._active_worker: Optional[_FileOpWorker] = None
-        self._active_plan: List[_PlannedOp] = []
-        self._active_step: int = 0
-        self._active_title: str = ""
-        qlay.addWidget(self.queue_current)
-        self.queue_next_label = QLabel(t("dirs.queue_pending"))
-        qlay.addWidget(self.queue_next_label)
-        qlay.addWidget(self.queue_list)
-        self.queue_group.setVisible(False)
-        lay.addWidget(self.queue_group)
 
         self._update_undo_enabled()
+        # Qt drops the connection when the panel is destroyed.
+        _UNDO_BUS.changed.connect(self._update_undo_enabled)
         self._update_navigation_controls()
 
     def retranslate_ui(self) -> None:
@@ -807,43 +1089,53 @@ class RemoteDirPanel(QWidget):
         self.btn_undo.setText(t("dirs.undo"))
         self.btn_refresh.setText(t("dirs.refresh"))
         self.path_label.setText(t("dirs.path"))
-        self.queue_group.setTitle(t("dirs.queue_title"))
-        self.queue_current_label.setText(t("dirs.queue_current"))
-        self.queue_next_label.setText(t("dirs.queue_pending"))
-        tab_keys = ("all", "folders", "iso", "archives", "slurm", "shell", "other")
-        for index, key in enumerate(tab_keys):
-            self.tabs.setTabText(index, t(f"dirs.tab_{key}"))
+        for index, (key, default) in enumerate(_VIEW_TABS):
+            self.tabs.setTabText(index, tr(f"dirs.tab_{key}", default))
         for index in range(self.directory_tabs.count()):
             directory = str(self.directory_tabs.tabData(index) or "")
             if directory:
                 self.directory_tabs.setTabText(index, self._directory_tab_label(directory))
-        headers = [
-            t("dirs.col_name"),
-            t("dirs.col_size"),
-            t("dirs.col_type"),
-            t("dirs.col_mtime"),
-        ]
+        self._headers = _view_header_labels()
         for view in self.views.values():
-            view.setHeaderLabels(headers)
+            view.setHeaderLabels(self._headers)
+        fit_text = tr("dirs.fit_columns", "Fit columns")
+        for action in self._fit_column_actions:
+            action.setText(fit_text)
+        # The cached conflict dialog holds the old language; rebuild on demand.
+        if self._conflict_dialog is not None:
+            self._conflict_dialog.deleteLater()
+            self._conflict_dialog = None
 
     def _make_view(self) -> _RemoteTree:
         w = _RemoteTree(panel=self)
         w.setColumnCount(4)
-        w.setHeaderLabels(
-            [
-                t("dirs.col_name") if t("dirs.col_name") != "[dirs.col_name]" else "Filename",
-                t("dirs.col_size") if t("dirs.col_size") != "[dirs.col_size]" else "Filesize",
-                t("dirs.col_type") if t("dirs.col_type") != "[dirs.col_type]" else "Filetype",
-                t("dirs.col_mtime") if t("dirs.col_mtime") != "[dirs.col_mtime]" else "Last modified",
-            ]
-        )
+        w.setHeaderLabels(self._headers)
         w.setRootIsDecorated(False)
+        # Every row is one line of text plus an icon; letting Qt assume a
+        # uniform height skips measuring each row during layout.
+        w.setUniformRowHeights(True)
         w.setAlternatingRowColors(True)
         w.setSelectionMode(QTreeWidget.SelectionMode.ExtendedSelection)
         w.itemDoubleClicked.connect(self._handle_item_double_clicked)
         w.header().setStretchLastSection(True)
+        # Fit columns from the rows around the viewport instead of measuring
+        # every entry of a large directory.
+        w.header().setResizeContentsPrecision(_COLUMN_FIT_SAMPLE_ROWS)
         w.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
         w.customContextMenuRequested.connect(lambda pos, view=w: self._on_context_menu(view, pos))
+        header = w.header()
+        header.resizeSection(
+            1,
+            max(
+                header.sectionSizeHint(1),
+                w.fontMetrics().horizontalAdvance(_SIZE_COLUMN_SAMPLE) + 16,
+            ),
+        )
+        header.setContextMenuPolicy(Qt.ContextMenuPolicy.ActionsContextMenu)
+        fit_action = QAction(tr("dirs.fit_columns", "Fit columns"), header)
+        fit_action.triggered.connect(self.fit_columns)
+        header.addAction(fit_action)
+        self._fit_column_actions.append(fit_action)
         w.installEventFilter(self)
         return w
 
@@ -853,8 +1145,27 @@ class RemoteDirPanel(QWidget):
         return cleaned.rsplit("/", 1)[-1] or cleaned
 
     def _on_tab_changed(self, index: int) -> None:
+        self._fill_current_view()
+        self._resize_current_view_columns()
         self._update_navigation_controls()
 
+    def _resize_current_view_columns(self) -> None:
+        key = self._current_view_key()
+        if key in self._columns_sized:
+            return
+        view = self.views[key]
+        if view.topLevelItemCount() == 0:
+            return
+        self._columns_sized.add(key)
+        for column in _FITTED_COLUMNS:
+            view.resizeColumnToContents(column)
+
+    @Slot()
+    def fit_columns(self) -> None:
+        """Fit the visible view's columns to its current rows."""
+        self._columns_sized.discard(self._current_view_key())
+        self._resize_current_view_columns()
+
     def _on_directory_tab_changed(self, index: int) -> None:
         if index < 0:
             return
@@ -867,7 +1178,7 @@ class RemoteDirPanel(QWidget):
         self.refresh()
 
     def open_directory_in_new_tab(self, remote_dir: str) -> bool:
-        if not self.session or not self.session.get("files"):
+        if not self._files:
             return False
         target = (remote_dir or "").rstrip("/") or "/"
         if not target:
@@ -897,43 +1208,77 @@ class RemoteDirPanel(QWidget):
         self.set_dir(self.path.text())
 
     def eventFilter(self, watched, event):
-        # Delete / Paste / Undo key support on directory views
-        if isinstance(watched, QTreeWidget) and event.type() == QEvent.Type.KeyPress:
+        # Delete / Paste / Undo key support on directory views.  Test the
+        # event type first: most events reaching the filter are not keys.
+        if event.type() == QEvent.Type.KeyPress and isinstance(watched, QTreeWidget):
             e: QKeyEvent = event  # type: ignore
-            if e.key() == Qt.Key.Key_Backspace and not e.modifiers():
-                self.go_parent()
-                return True
-            if e.key() == Qt.Key.Key_Delete:
-                self.delete_selected()
-                return True
-            if e.key() == Qt.Key.Key_F5 and not e.modifiers():
-                self.refresh(force=True)
-                return True
-            if e.key() == Qt.Key.Key_F2 and not e.modifiers():
-                if self.rename_selected(watched):
-                    return True
-            if (e.modifiers() & Qt.KeyboardModifier.ControlModifier) and e.key() == Qt.Key.Key_C:
-                paths = self._selected_paths_from_view(watched)
-                if paths:
-                    get_file_clipboard().set("copy", paths)
-                    return True
-            if (e.modifiers() & Qt.KeyboardModifier.ControlModifier) and e.key() == Qt.Key.Key_X:
-                paths = self._selected_paths_from_view(watched)
-                if paths:
-                    get_file_clipboard().set("move", paths)
-                    return True
-            if (e.modifiers() & Qt.KeyboardModifier.ControlModifier) and e.key() == Qt.Key.Key_V:
-                if self._paste_system_clipboard_into(self.current_dir or "/"):
+            binding = _VIEW_KEY_BINDINGS.get(e.key())
+            if binding is not None:
+                required, handler = binding
+                modifiers = e.modifiers()
+                if required is _KEY_MOD_ANY:
+                    matched = True
+                elif required is _KEY_MOD_NONE:
+                    matched = not modifiers
+                else:
+                    matched = bool(modifiers & _CTRL)
+                if matched and getattr(self, handler)(watched):
                     return True
-                self._paste_remote_clipboard_into(self.current_dir or "/")
-                return True
-            if (e.modifiers() & Qt.KeyboardModifier.ControlModifier) and e.key() == Qt.Key.Key_Z:
-                self.undo_last()
-                return True
         return super().eventFilter(watched, event)
 
+    def _key_go_parent(self, _view: QTreeWidget) -> bool:
+        self.go_parent()
+        return True
+
+    def _key_delete(self, _view: QTreeWidget) -> bool:
+        self.delete_selected()
+        return True
+
+    def _key_refresh(self, _view: QTreeWidget) -> bool:
+        self.refresh(force=True)
+        return True
+
+    def _key_rename(self, view: QTreeWidget) -> bool:
+        return bool(self.rename_selected(view))
+
+    def _key_copy(self, view: QTreeWidget) -> bool:
+        paths = self._selected_paths_from_view(view)
+        if paths:
+            get_file_clipboard().set("copy", paths)
+            return True
+        return False
+
+    def _key_cut(self, view: QTreeWidget) -> bool:
+        paths = self._selected_paths_from_view(view)
+        if paths:
+            get_file_clipboard().set("move", paths)
+            return True
+        return False
+
+    def _key_paste(self, _view: QTreeWidget) -> bool:
+        if self._paste_system_clipboard_into(self.current_dir or "/"):
+            return True
+        self._paste_remote_clipboard_into(self.current_dir or "/")
+        return True
+
+    def _key_undo(self, _view: QTreeWidget) -> bool:
+        self.undo_last()
+        return True
+
+    @property
+    def session(self):
+        return self._session
+
+    @session.setter
+    def session(self, session) -> None:
+        # Keep the files backend at hand; almost every action needs it.
+        self._session = session
+        self._files = session.get("files") if session else None
+
     def set_session(self, session):
         self.session = session
+        # Listings still running belong to the previous session.
+        self._listing_generation += 1
         self._directory_cache.clear()
         self._update_navigation_controls()
 
@@ -996,7 +1341,7 @@ class RemoteDirPanel(QWidget):
         clean = (remote_path or "/").rstrip("/") or "/"
         if clean == "/":
             return "/"
-        return cls._normalize_remote_dir("/".join(clean.split("/")[:-1]) or "/")
+        return cls._normalize_remote_dir(clean.rpartition("/")[0] or "/")
 
     def _invalidate_directory_cache(self, remote_dir: Optional[str] = None) -> None:
         if remote_dir is None:
@@ -1048,25 +1393,69 @@ class RemoteDirPanel(QWidget):
                 if RemoteDirPanel._instances.get(panel_id) is panel:
                     RemoteDirPanel._instances.pop(panel_id, None)
 
+    def _fresh_cached_listing(self, key: str, now: float) -> Optional[List[RemoteEntry]]:
+        cached = self._directory_cache.get(key)
+        if cached is None:
+            cached = self._peer_cached_listing(key)
+            if cached is not None:
+                self._directory_cache[key] = cached
+        if cached is not None:
+            cached_at, entries = cached
+            if now - cached_at <= DIRECTORY_CACHE_TTL_SECONDS:
+                return list(entries)
+        return None
+
     def _listdir_entries_cached(
         self,
         remote_dir: str,
         *,
         force: bool = False,
     ) -> List[RemoteEntry]:
-        if not self.session or not self.session.get("files"):
+        if not self._files:
             return []
         key = self._cache_key(remote_dir)
         now = monotonic()
-        cached = self._directory_cache.get(key)
-        if not force and cached is not None:
-            cached_at, entries = cached
-            if now - cached_at <= DIRECTORY_CACHE_TTL_SECONDS:
-                return list(entries)
-        entries = list(self.session["files"].listdir_entries(key))
+        if not force:
+            entries = self._fresh_cached_listing(key, now)
+            if entries is not None:
+                return entries
+        entries = list(self._files.listdir_entries(key))
         self._directory_cache[key] = (now, entries)
         return list(entries)
 
+    @staticmethod
+    def _probe_exists_many(files, remote_paths: List[str]) -> Dict[str, bool]:
+        probe = getattr(files, "exists_many", None)
+        if not callable(probe) or not remote_paths:
+            return {}
+        try:
+            return dict(probe(remote_paths))
+        except Exception:
+            return {}
+
+    def _peer_cached_listing(self, key: str) -> Optional[Tuple[float, List[RemoteEntry]]]:
+        """Freshest listing of ``key`` held by another panel on the same backend.
+
+        Scratch, home and the job output browsers often show the same
+        directory; reusing a sibling's listing saves the SFTP round trip.
+        Mutations already invalidate every panel's copy.
+        """
+        files = self._files
+        best: Optional[Tuple[float, List[RemoteEntry]]] = None
+        for panel in list(RemoteDirPanel._instances.values()):
+            if panel is self:
+                continue
+            try:
+                peer_session = panel.session
+                cached = panel._directory_cache.get(key)
+            except RuntimeError:
+                continue
+            if not peer_session or peer_session.get("files") is not files:
+                continue
+            if cached is not None and (best is None or cached[0] > best[0]):
+                best = cached
+        return best
+
     @staticmethod
     def _local_paths_from_mime(mime) -> List[str]:
         if not mime or not mime.hasUrls():
@@ -1145,7 +1534,7 @@ class RemoteDirPanel(QWidget):
         return name
 
     def _create_remote_item(self, *, kind: str, parent_dir: Optional[str] = None) -> bool:
-        if not self.session or not self.session.get("files"):
+        if not self._files:
             QMessageBox.warning(self, t("common.error"), t("common.no_connection"))
             return False
         raw_target_dir = parent_dir or self.current_dir or ""
@@ -1158,7 +1547,7 @@ class RemoteDirPanel(QWidget):
         if not name:
             return False
         target_path = self._child_path(target_dir, name)
-        files = self.session["files"]
+        files = self._files
         try:
             if files.exists(target_path):
                 QMessageBox.warning(
@@ -1181,7 +1570,7 @@ class RemoteDirPanel(QWidget):
         return self._create_remote_item(kind="folder", parent_dir=parent_dir)
 
     def create_new_folder_and_enter(self, parent_dir: Optional[str] = None) -> bool:
-        if not self.session or not self.session.get("files"):
+        if not self._files:
             QMessageBox.warning(self, t("common.error"), t("common.no_connection"))
             return False
         raw_target_dir = parent_dir or self.current_dir or ""
@@ -1193,7 +1582,7 @@ class RemoteDirPanel(QWidget):
         if not name:
             return False
         target_path = self._child_path(target_dir, name)
-        files = self.session["files"]
+        files = self._files
         try:
             if files.exists(target_path):
                 QMessageBox.warning(
@@ -1229,44 +1618,134 @@ class RemoteDirPanel(QWidget):
             return
         self.set_dir(parent)
 
-    def _icon_for(self, entry: RemoteEntry) -> QIcon:
-        st = self.style()
+    def _classify(self, entry: RemoteEntry) -> Tuple[str, str, QIcon]:
+        """Type label, category and icon of ``entry`` from one suffix lookup."""
         if entry.is_dir:
-            return st.standardIcon(QStyle.StandardPixmap.SP_DirIcon)
-        lower = entry.name.lower()
-        if lower.endswith(".iso"):
-            return st.standardIcon(QStyle.StandardPixmap.SP_DriveDVDIcon)
-        return st.standardIcon(QStyle.StandardPixmap.SP_FileIcon)
+            return tr("dirs.type_folder", "Klasör"), "folders", self._icon_dir
+        ext = _extension(entry.name)
+        icon = self._icon_iso if ext == "iso" else self._icon_file
+        return (
+            _file_type_for_ext(entry.name, ext),
+            _EXT_TO_CATEGORY.get(ext, "other"),
+            icon,
+        )
 
     def refresh(self, force: bool = False):
-        if not self.session or not self.session.get("files"):
-            for v in self.views.values():
-                v.clear()
+        if not self._files:
+            self._listing_generation += 1
+            self._clear_views()
             self._update_navigation_controls()
             return
 
         category_dir = self._category_dir or self.current_dir
-        try:
-            entries = self._listdir_entries_cached(category_dir, force=bool(force))
-        except Exception as e:
-            self._show_op_error(
-                f"{t('dirs.load_failed') if t('dirs.load_failed') != '[dirs.load_failed]' else 'Dizin okunamadı'}: {e}"
-            )
-            for v in self.views.values():
-                v.clear()
+        # Any listing still in flight is for a directory we no longer want.
+        self._listing_generation += 1
+        key = self._cache_key(category_dir)
+        now = monotonic()
+        if not force:
+            entries = self._fresh_cached_listing(key, now)
+            if entries is not None:
+                self._show_listing(category_dir, entries)
+                return
+
+        files = self._files
+        token = (self._listing_generation, category_dir, now)
+        list_isolated = getattr(files, "listdir_entries_isolated", None)
+        if not (
+            callable(list_isolated)
+            and getattr(files, "supports_parallel_transfers", False)
+        ):
+            # Without a private listing channel the listing has to share the
+            # browsing client, which only the GUI thread may use.
+            try:
+                entries = list(files.listdir_entries(key))
+            except Exception as exc:
+                self._apply_listing_error(token, exc)
+                return
+            self._apply_listing(token, entries)
+            return
+
+        # A directory listing is an SFTP round trip; run it on the pool over
+        # the backend's own listing channel so the window stays responsive.
+        if category_dir != self._view_listing[0]:
+            # Don't leave the previous directory's rows under the new path.
+            self._clear_views()
+        worker = AsyncCall(token, lambda: list(list_isolated(key)))
+        self._listing_workers[token] = worker
+        worker.signals.finished.connect(self._on_listing_finished)
+        worker.signals.failed.connect(self._on_listing_failed)
+        QThreadPool.globalInstance().start(worker)
+
+    @Slot(object, object)
+    def _on_listing_finished(self, token, entries) -> None:
+        if self._listing_workers.pop(token, None) is not None:
+            self._apply_listing(token, entries)
+
+    @Slot(object, object)
+    def _on_listing_failed(self, token, exc) -> None:
+        if self._listing_workers.pop(token, None) is not None:
+            self._apply_listing_error(token, exc)
+
+    def _apply_listing(self, token, entries: List[RemoteEntry]) -> None:
+        generation, category_dir, started_at = token
+        self._directory_cache[self._cache_key(category_dir)] = (started_at, entries)
+        if generation == self._listing_generation:
+            self._show_listing(category_dir, list(entries))
+
+    def _apply_listing_error(self, token, exc: Exception) -> None:
+        if token[0] != self._listing_generation:
             return
+        self._show_op_error(
+            f"{tr('dirs.load_failed', 'Dizin okunamadı')}: {exc}"
+        )
+        self._clear_views()
+
+    def _show_listing(self, category_dir: str, entries: List[RemoteEntry]) -> None:
+        # A repeated refresh of an unchanged directory keeps the filled
+        # views instead of rebuilding every row.
+        if (category_dir, entries) != self._view_listing:
+            self._view_listing = (category_dir, entries)
+            self._view_classified = None
+            self._views_needing_fill = set(self.views)
+            self._fill_current_view()
+            # Column fitting walks every row, so each view is fitted once
+            # when it first has rows; fit_columns() refits on request.
+            self._resize_current_view_columns()
 
+        self._update_undo_enabled()
+        self._update_navigation_controls()
+
+    def _clear_views(self) -> None:
+        self._view_listing = ("", [])
+        self._view_classified = None
+        self._views_needing_fill.clear()
         for v in self.views.values():
             v.clear()
 
-        def add(view: QTreeWidget, entry: RemoteEntry):
-            it = QTreeWidgetItem()
-            it.setText(0, entry.name)
-            it.setIcon(0, self._icon_for(entry))
-            it.setText(1, "" if entry.is_dir else _fmt_size(entry.size))
-            file_type = _file_type(entry.name, entry.is_dir)
-            it.setText(2, file_type)
-            it.setText(3, _fmt_mtime(entry.mtime))
+    def _current_view_key(self) -> str:
+        return self._view_to_key.get(self.tabs.currentWidget(), "all")
+
+    def _fill_current_view(self) -> None:
+        key = self._view_to_key.get(self.tabs.currentWidget())
+        if key in self._views_needing_fill:
+            self._fill_view(key)
+
+    def _fill_view(self, key: str) -> None:
+        self._views_needing_fill.discard(key)
+        category_dir, entries = self._view_listing
+
+        def make_item(entry: RemoteEntry, file_type: str, icon: QIcon) -> QTreeWidgetItem:
+            # Passing the column texts to the constructor sets all four in
+            # one call into Qt instead of one setText per column.
+            it = QTreeWidgetItem(
+                [
+                    entry.name,
+                    "" if entry.is_dir else _fmt_size(entry.size),
+                    file_type,
+                    _fmt_mtime(entry.mtime),
+                ]
+            )
+            it.setIcon(0, icon)
             it.setData(0, Qt.ItemDataRole.UserRole, entry.path)
             it.setData(0, Qt.ItemDataRole.UserRole + 1, bool(entry.is_dir))
             it.setData(0, _SORT_NAME_ROLE, entry.name)
@@ -1274,46 +1753,40 @@ class RemoteDirPanel(QWidget):
             it.setData(0, _SORT_TYPE_ROLE, file_type)
             it.setData(0, _SORT_MTIME_ROLE, int(entry.mtime or 0))
             it.setData(0, _FILE_MODE_ROLE, int(entry.mode or 0))
-            view.addTopLevelItem(it)
+            return it
 
+        items: List[QTreeWidgetItem] = []
         parent_dir = self._remote_parent_dir(category_dir)
-        if parent_dir:
-            def make_parent_item() -> QTreeWidgetItem:
-                item = QTreeWidgetItem()
-                item.setText(0, "..")
-                item.setIcon(0, self.style().standardIcon(QStyle.StandardPixmap.SP_DirIcon))
-                item.setText(1, "")
-                item.setText(2, _file_type("..", True))
-                item.setText(3, "")
-                item.setData(0, Qt.ItemDataRole.UserRole, parent_dir)
-                item.setData(0, Qt.ItemDataRole.UserRole + 1, True)
-                item.setData(0, Qt.ItemDataRole.UserRole + 2, True)
-                item.setData(0, _SORT_NAME_ROLE, "..")
-                item.setData(0, _SORT_SIZE_ROLE, 0)
-                item.setData(0, _SORT_TYPE_ROLE, _file_type("..", True))
-                item.setData(0, _SORT_MTIME_ROLE, 0)
-                item.setData(0, _FILE_MODE_ROLE, 0)
-                return item
-
-            self.views["all"].addTopLevelItem(make_parent_item())
-            if "folders" in self.views:
-                self.views["folders"].addTopLevelItem(make_parent_item())
-
-        for e in entries:
-            add(self.views["all"], e)
-            cat = _category(e)
-            if cat in self.views:
-                add(self.views[cat], e)
-
-        for v in self.views.values():
+        if parent_dir and key in ("all", "folders"):
+            item = QTreeWidgetItem(["..", "", _file_type("..", True), ""])
+            item.setIcon(0, self._icon_dir)
+            item.setData(0, Qt.ItemDataRole.UserRole, parent_dir)
+            item.setData(0, Qt.ItemDataRole.UserRole + 1, True)
+            item.setData(0, Qt.ItemDataRole.UserRole + 2, True)
+            item.setData(0, _SORT_NAME_ROLE, "..")
+            item.setData(0, _SORT_SIZE_ROLE, 0)
+            item.setData(0, _SORT_TYPE_ROLE, _file_type("..", True))
+            item.setData(0, _SORT_MTIME_ROLE, 0)
+            item.setData(0, _FILE_MODE_ROLE, 0)
+            items.append(item)
+
+        classified = self._view_classified
+        if classified is None:
+            classified = [(e, *self._classify(e)) for e in entries]
+            self._view_classified = classified
+        for e, file_type, cat, icon in classified:
+            if key == "all" or cat == key:
+                items.append(make_item(e, file_type, icon))
+
+        # One insert and one repaint instead of one per entry.
+        v = self.views[key]
+        v.setUpdatesEnabled(False)
+        try:
+            v.clear()
+            v.addTopLevelItems(items)
             v.apply_sort()
-            v.resizeColumnToContents(0)
-            v.resizeColumnToContents(1)
-            v.resizeColumnToContents(2)
-            v.resizeColumnToContents(3)
-
-        self._update_undo_enabled()
-        self._update_navigation_controls()
+        finally:
+            v.setUpdatesEnabled(True)
 
     # ---------- selection helpers ----------
     def _selected_paths_from_view(self, view: QTreeWidget) -> List[str]:
@@ -1364,15 +1837,10 @@ class RemoteDirPanel(QWidget):
 
     def _set_last_undo(self, rec: Optional[_UndoRecord]) -> None:
         RemoteDirPanel._last_undo = rec
-        # reflect on all panels
-        for p in list(RemoteDirPanel._instances.values()):
-            try:
-                p._update_undo_enabled()
-            except Exception:
-                pass
+        _UNDO_BUS.changed.emit()
 
     def undo_last(self) -> None:
-        if not self.session or not self.session.get("files"):
+        if not self._files:
             return
         rec = RemoteDirPanel._last_undo
         if not rec:
@@ -1381,7 +1849,7 @@ class RemoteDirPanel(QWidget):
             self._set_last_undo(None)
             return
 
-        files = self.session["files"]
+        files = self._files
         # reverse order for safety
         moves = list(reversed(rec.moves))
         affected_dirs = set()
@@ -1389,6 +1857,9 @@ class RemoteDirPanel(QWidget):
         # build undo plan (dst -> src)
         plan: List[_PlannedOp] = []
         policy: Optional[str] = None
+        # One batched probe for every undo target instead of a round trip
+        # per move; paths it could not answer fall back to the single probe.
+        known_exists = self._probe_exists_many(files, [src.rstrip("/") for src, _dst in moves])
 
         for src, dst in moves:
             # undo means: move dst back to src
@@ -1398,26 +1869,27 @@ class RemoteDirPanel(QWidget):
             affected_dirs.add(self._parent_remote_dir(undo_dst))
 
             # if destination already exists, resolve
-            try:
-                exists = bool(files.exists(undo_dst))
-            except Exception:
+            exists = known_exists.get(undo_dst)
+            if exists is None:
                 try:
-                    files.listdir(undo_dst)
-                    exists = True
+                    exists = bool(files.exists(undo_dst))
                 except Exception:
-                    exists = False
+                    try:
+                        files.listdir(undo_dst)
+                        exists = True
+                    except Exception:
+                        exists = False
 
             if exists:
                 if policy is None:
-                    action = self._resolve_conflict(
+                    action_simple, apply_all = self._resolve_conflict(
                         undo_dst,
                         src=undo_src,
                         source_is_local=False,
                         target_is_local=False,
                     )
-                    if action.endswith("_all"):
-                        policy = action.replace("_all", "")
-                    action_simple = action.replace("_all", "")
+                    if apply_all:
+                        policy = action_simple
                 else:
                     action_simple = policy
 
@@ -1456,10 +1928,10 @@ class RemoteDirPanel(QWidget):
 
     # ---------- context menu ----------
     def _on_context_menu(self, view: QTreeWidget, pos: QPoint):
-        if not self.session or not self.session.get("files"):
+        if not self._files:
             return
 
-        files = self.session.get("files")
+        files = self._files
 
         item = view.itemAt(pos)
         clicked_path: Optional[str] = None
@@ -1480,6 +1952,8 @@ class RemoteDirPanel(QWidget):
         submit_path = self._submit_candidate(selected_entries)
         shell_run_path = self._shell_run_candidate(selected_entries)
 
+        # Parented to the panel for positioning; delete it once handled so
+        # every right-click does not leave a menu and its actions behind.
         menu = QMenu(self)
         clipboard = get_file_clipboard()
 
@@ -1490,10 +1964,10 @@ class RemoteDirPanel(QWidget):
         act_open_new_tab = menu.addAction(REMOTE_CONTEXT_MENU_LABELS[3])
         act_submit = None
         if submit_path:
-            act_submit = menu.addAction(_tr("dirs.submit_sbatch", "Submit with sbatch"))
+            act_submit = menu.addAction(tr("dirs.submit_sbatch", "Submit with sbatch"))
         act_run_shell = None
         if shell_run_path:
-            act_run_shell = menu.addAction(_tr("dirs.run_shell_terminal", "Run in terminal"))
+            act_run_shell = menu.addAction(tr("dirs.run_shell_terminal", "Run in terminal"))
         act_open_out1 = None
         act_open_out2 = None
         act_open_file_new_window = None
@@ -1504,37 +1978,37 @@ class RemoteDirPanel(QWidget):
         existing_output_actions: Dict[object, Tuple[str, int]] = {}
         if self.enable_output_menu:
             act_open_out1 = menu.addAction(
-                _tr("jobs_outputs.open_out1", "Follow in Output 1")
+                tr("jobs_outputs.open_out1", "Follow in Output 1")
             )
             act_open_out2 = menu.addAction(
-                _tr("jobs_outputs.open_out2", "Follow in Output 2")
+                tr("jobs_outputs.open_out2", "Follow in Output 2")
             )
             act_open_file_new_window = menu.addAction(
-                _tr(
+                tr(
                     "jobs_outputs.open_file_new_window",
                     "Follow file in new window",
                 )
             )
             act_open_out1_new_window = menu.addAction(
-                _tr(
+                tr(
                     "jobs_outputs.open_out1_new_window",
                     "Follow in Output 1 in new window",
                 )
             )
             act_open_out2_new_window = menu.addAction(
-                _tr(
+                tr(
                     "jobs_outputs.open_out2_new_window",
                     "Follow in Output 2 in new window",
                 )
             )
             act_open_out1_new_tab = menu.addAction(
-                _tr(
+                tr(
                     "jobs_outputs.open_out1_new_tab",
                     "Follow in Output 1 in new tab",
                 )
             )
             act_open_out2_new_tab = menu.addAction(
-                _tr(
+                tr(
                     "jobs_outputs.open_out2_new_tab",
                     "Follow in Output 2 in new tab",
                 )
@@ -1549,13 +2023,13 @@ class RemoteDirPanel(QWidget):
                 menu.addSeparator()
                 for target_id, target_label in output_targets:
                     existing_out1 = menu.addAction(
-                        _tr(
+                        tr(
                             "jobs_outputs.assign_existing_out1",
                             "Assign to {target} Output 1",
                         ).format(target=target_label)
                     )
                     existing_out2 = menu.addAction(
-                        _tr(
+                        tr(
                             "jobs_outputs.assign_existing_out2",
                             "Assign to {target} Output 2",
                         ).format(target=target_label)
@@ -1568,8 +2042,7 @@ class RemoteDirPanel(QWidget):
         act_new_file = menu.addAction(REMOTE_CONTEXT_MENU_LABELS[7])
         act_refresh = menu.addAction(REMOTE_CONTEXT_MENU_LABELS[8])
         menu.addSeparator()
-        sys_clip = QApplication.clipboard().mimeData()
-        has_local_urls = bool(self._local_paths_from_mime(sys_clip))
+        has_local_urls = self._system_clipboard_has_local_urls()
         clip = clipboard.get()
         act_paste_local_here = None
         act_paste_local_into = None
@@ -1579,21 +2052,21 @@ class RemoteDirPanel(QWidget):
         act_undo = None
         if has_local_urls:
             act_paste_local_here = menu.addAction(
-                _tr("dirs.paste_from_local", "Paste from local")
+                tr("dirs.paste_from_local", "Paste from local")
             )
             if clicked_path and clicked_is_dir:
                 act_paste_local_into = menu.addAction(
-                    _tr("dirs.paste_from_local_into", "Paste from local into folder")
+                    tr("dirs.paste_from_local_into", "Paste from local into folder")
                 )
         if clip and clip.paths:
-            act_paste_here = menu.addAction(_tr("dirs.paste", "Paste"))
+            act_paste_here = menu.addAction(tr("dirs.paste", "Paste"))
             if clicked_path and clicked_is_dir:
-                act_paste_into = menu.addAction(_tr("dirs.paste_into", "Paste into folder"))
+                act_paste_into = menu.addAction(tr("dirs.paste_into", "Paste into folder"))
             act_paste_to_local = menu.addAction(
-                _tr("dirs.paste_to_local", "Paste to local (download)")
+                tr("dirs.paste_to_local", "Paste to local (download)")
             )
         if RemoteDirPanel._last_undo is not None:
-            act_undo = menu.addAction(_tr("dirs.undo", "Undo"))
+            act_undo = menu.addAction(tr("dirs.undo", "Undo"))
         if any(
             action is not None
             for action in (
@@ -1606,8 +2079,8 @@ class RemoteDirPanel(QWidget):
         act_delete = menu.addAction(REMOTE_CONTEXT_MENU_LABELS[10])
         act_rename = menu.addAction(REMOTE_CONTEXT_MENU_LABELS[11])
         act_copy_path = menu.addAction(REMOTE_CONTEXT_MENU_LABELS[12])
-        act_copy = menu.addAction(_tr("dirs.copy", "Copy"))
-        act_move = menu.addAction(_tr("dirs.move", "Move"))
+        act_copy = menu.addAction(tr("dirs.copy", "Copy"))
+        act_move = menu.addAction(tr("dirs.move", "Move"))
         act_permissions = menu.addAction(REMOTE_CONTEXT_MENU_LABELS[13])
 
         has_selection = bool(sel_paths)
@@ -1639,6 +2112,7 @@ class RemoteDirPanel(QWidget):
         act_permissions.setEnabled(has_selection)
 
         chosen = menu.exec(view.viewport().mapToGlobal(pos))
+        menu.deleteLater()
         if not chosen:
             return
 
@@ -1775,7 +2249,7 @@ class RemoteDirPanel(QWidget):
         paths: Optional[List[str]] = None,
         selected_items: Optional[List[QTreeWidgetItem]] = None,
     ) -> bool:
-        if not self.session or not self.session.get("files"):
+        if not self._files:
             return False
         if paths is None:
             current = self.tabs.currentWidget()
@@ -1806,17 +2280,17 @@ class RemoteDirPanel(QWidget):
             QMessageBox.warning(
                 self,
                 t("common.error"),
-                _tr("dirs.permissions_invalid", "Enter a valid octal mode such as 755 or 0644."),
+                tr("dirs.permissions_invalid", "Enter a valid octal mode such as 755 or 0644."),
             )
             return False
 
-        files = self.session["files"]
+        files = self._files
         try:
             for path in paths:
                 files.chmod(path, mode)
         except Exception as exc:
             self._show_op_error(
-                _tr("dirs.permissions_failed", "Permission update failed: {err}").format(err=exc)
+                tr("dirs.permissions_failed", "Permission update failed: {err}").format(err=exc)
             )
             return False
 
@@ -1830,25 +2304,25 @@ class RemoteDirPanel(QWidget):
         return self._rename_paths(self._selected_paths_from_view(view))
 
     def _rename_paths(self, paths: List[str]) -> bool:
-        if not self.session or not self.session.get("files"):
+        if not self._files:
             return False
         if len(paths) != 1:
             QMessageBox.information(self, t("common.info"), t("dirs.rename_single_required"))
             return False
         old = paths[0].rstrip("/")
-        base = old.split("/")[-1]
+        parent, _sep, base = old.rpartition("/")
+        parent = parent or "/"
         new_name, ok = QInputDialog.getText(
             self,
-            t("dirs.rename") if t("dirs.rename") != "[dirs.rename]" else "Yeniden Adlandır",
+            tr("dirs.rename", "Yeniden Adlandır"),
             t("dirs.rename_label"),
             text=base,
         )
         if not ok or not new_name.strip():
             return False
-        parent = "/".join(old.split("/")[:-1]) or "/"
         dst = parent.rstrip("/") + "/" + new_name.strip()
         try:
-            self.session["files"].rename(old, dst)
+            self._files.rename(old, dst)
             self._finish_remote_directory_mutation([parent])
             return True
         except Exception as e:
@@ -1861,17 +2335,17 @@ class RemoteDirPanel(QWidget):
         paths: List[str],
         selected_entries: Optional[List[Tuple[str, bool]]] = None,
     ) -> bool:
-        if not self.session or not self.session.get("files"):
+        if not self._files:
             QMessageBox.warning(self, t("common.error"), t("common.no_connection"))
             return False
         if not paths:
             return False
-        msg = t("dirs.delete_confirm") + "\n" + "\n".join([p.split("/")[-1] for p in paths[:10]])
+        msg = t("dirs.delete_confirm") + "\n" + "\n".join(p.rpartition("/")[2] for p in paths[:10])
         if len(paths) > 10:
             msg += f"\n... (+{len(paths)-10})"
         if QMessageBox.question(
             self,
-            t("common.confirm") if t("common.confirm") != "[common.confirm]" else "Onay",
+            tr("common.confirm", "Onay"),
             msg,
         ) != QMessageBox.StandardButton.Yes:
             return False
@@ -1891,17 +2365,13 @@ class RemoteDirPanel(QWidget):
         affected_dirs.add(self.current_dir or "/")
         return self._run_plan_with_progress(
             plan,
-            _tr("transfer.delete_title", "Deleting..."),
+            tr("transfer.delete_title", "Deleting..."),
             after_finished=lambda dirs=sorted(affected_dirs): self._finish_remote_directory_mutation(dirs),
         )
 
     def delete_selected(self):
         tab = self.tabs.currentWidget()
-        tab_key = "all"
-        for k, v in self.views.items():
-            if v is tab:
-                tab_key = k
-                break
+        tab_key = self._current_view_key()
         sel = self.selected_paths(tab_key)
         if not sel:
             QMessageBox.information(self, t("common.info"), t("dirs.no_file_selected"))
@@ -1916,18 +2386,22 @@ class RemoteDirPanel(QWidget):
         src: str = "",
         source_is_local: bool | None = None,
         target_is_local: bool | None = None,
-    ):
-        """Return one of: overwrite|resume|skip|rename|cancel (optionally applied to all)."""
+    ) -> Tuple[str, bool]:
+        """Return ``(action, apply_all)``; action is overwrite|resume|skip|rename|cancel."""
         source = self._conflict_info(src or dst, is_local=source_is_local)
         target = self._conflict_info(dst, is_local=target_is_local)
-        decision = TransferConflictDialog.get_decision(
-            self,
-            source=source,
-            target=target,
-        )
+        # Batches can raise many conflicts in a row; build the dialog once.
+        if self._conflict_dialog is None:
+            self._conflict_dialog = TransferConflictDialog(
+                self,
+                source=source,
+                target=target,
+            )
+        else:
+            self._conflict_dialog.set_files(source=source, target=target)
+        decision = self._conflict_dialog.ask()
         action = self._normalize_conflict_decision(decision, source, target)
-        apply_all = bool(decision.always_use or decision.apply_current_queue_only)
-        return action + "_all" if apply_all else action
+        return action, bool(decision.always_use or decision.apply_current_queue_only)
 
     def _conflict_info(
         self,
@@ -1945,9 +2419,9 @@ class RemoteDirPanel(QWidget):
                 )
             except Exception:
                 return TransferConflictInfo(path=path)
-        if is_local is False and self.session and self.session.get("files"):
+        if is_local is False and self._files:
             try:
-                size, mtime = self.session["files"].stat(path)
+                size, mtime = self._files.stat(path)
                 return TransferConflictInfo(
                     path=path,
                     size=int(size),
@@ -1965,9 +2439,9 @@ class RemoteDirPanel(QWidget):
                 )
         except Exception:
             pass
-        if self.session and self.session.get("files"):
+        if self._files:
             try:
-                size, mtime = self.session["files"].stat(path)
+                size, mtime = self._files.stat(path)
                 return TransferConflictInfo(
                     path=path,
                     size=int(size),
@@ -2016,20 +2490,10 @@ class RemoteDirPanel(QWidget):
     # ---------- friendly errors (permission/quota UX) ----------
     def _humanize_error(self, raw: str) -> Tuple[str, str]:
         """Return (title, short_message), raw goes to details."""
-        text = (raw or "").strip()
-        lo = text.lower()
-
-        if "permission denied" in lo or "access is denied" in lo:
-            return "İzin yok (Permission denied)", "Bu işlem için gerekli izinlerin yok. (chmod/chown veya doğru dizin?)"
-
-        if "no space left on device" in lo or "disk quota exceeded" in lo or "quota exceeded" in lo:
-            return "Disk dolu / Kota aşıldı", "Hedef tarafta boş alan kalmamış veya kota limitine ulaşıldı."
-
-        if "read-only file system" in lo:
-            return "Salt okunur dosya sistemi", "Hedef dosya sistemi read-only. Yazma işlemi yapılamaz."
-
-        # fallback
-        return t("common.error"), "İşlem başarısız oldu. Detaylar aşağıda."
+        m = _OP_ERROR_RE.search(raw or "")
+        if m is None:
+            return t("common.error"), "İşlem başarısız oldu. Detaylar aşağıda."
+        return _OP_ERROR_MESSAGES[m.lastgroup]
 
     def _show_op_error(self, raw: str) -> None:
         title, short = self._humanize_error(raw)
@@ -2040,28 +2504,6 @@ class RemoteDirPanel(QWidget):
         box.setDetailedText(raw)
         box.exec()
 
-    # ---------- queue UI ----------
-    def _queue_set(self, plan: List[_PlannedOp]) -> None:
-        self.queue_list.clear()
-        for op in plan:
-            name = os.path.basename((op.dst or op.src).rstrip("/"))
-            label = f"{op.op}: {name}"
-            self.queue_list.addItem(label)
-        self.queue_current.setText("-")
-        self.queue_group.setVisible(True)
-
-    def _queue_progress(self, step: int, label: str) -> None:
-        self.queue_current.setText(label)
-        # Worker emits progress *before* executing the step, so we remove the
-        # previous item when step advances.
-        if step > 1 and self.queue_list.count() > 0:
-            self.queue_list.takeItem(0)
-
-    def _queue_clear(self) -> None:
-        self.queue_current.setText("-")
-        self.queue_list.clear()
-        self.queue_group.setVisible(False)
-
     def _journal_transfer(self, event: str, **fields) -> None:
         """Append transfer operation events for diagnostics/audit."""
         try:
@@ -2087,7 +2529,7 @@ class RemoteDirPanel(QWidget):
         *,
         confirm_before_start: bool = False,
     ) -> bool:
-        if not self.session or not self.session.get("files"):
+        if not self._files:
             return False
         if not plan:
             return True
@@ -2104,7 +2546,7 @@ class RemoteDirPanel(QWidget):
             return True
         plan = filtered_plan
         transfer_items = [TransferItem(op=p.op, src=p.src, dst=p.dst, recursive=p.recursive) for p in plan]
-        files = self.session["files"]
+        files = self._files
         configured_parallel_limit = get_transfer_parallelism()
         backend_parallel_limit = (
             configured_parallel_limit
@@ -2134,9 +2576,6 @@ class RemoteDirPanel(QWidget):
         )
         if self._transfer_activity_callback is not None:
             self._transfer_activity_callback("controller", [dlg], title)
-        self._active_plan = list(plan)
-        self._active_step = 0
-        self._active_title = title
         def handle_finished(_result: int) -> None:
             try:
                 if self._transfer_activity_callback is not None:
@@ -2162,9 +2601,6 @@ class RemoteDirPanel(QWidget):
         dlg.start()
         if self._show_transfer_dialog:
             dlg.show()
-        self._active_plan = []
-        self._active_step = 0
-        self._active_title = ""
         return True
 
     def _confirm_transfer_plan(
@@ -2196,9 +2632,9 @@ class RemoteDirPanel(QWidget):
         return (op.op, op.src, op.dst)
 
     def _execute_transfer_item(self, item: TransferItem, progress_cb=None) -> None:
-        if not self.session or not self.session.get("files"):
+        if not self._files:
             raise RuntimeError(t("common.no_connection"))
-        files = self.session["files"]
+        files = self._files
         op = item.op
         if op == "delete":
             recursive = item.recursive
@@ -2237,13 +2673,16 @@ class RemoteDirPanel(QWidget):
         elif op == "mkdir_local":
             os.makedirs(item.dst, exist_ok=True)
         elif op == "delete_local":
-            if os.path.isdir(item.dst):
+            # Most targets are files: try the unlink first and only fall back
+            # to rmtree (already scandir/dir_fd based) for directories.
+            try:
+                os.remove(item.dst)
+            except FileNotFoundError:
+                pass
+            except (IsADirectoryError, PermissionError):
+                if not os.path.isdir(item.dst):
+                    raise
                 shutil.rmtree(item.dst, ignore_errors=True)
-            else:
-                try:
-                    os.remove(item.dst)
-                except FileNotFoundError:
-                    pass
         else:
             raise RuntimeError(f"Unknown op: {op}")
 
@@ -2259,13 +2698,12 @@ class RemoteDirPanel(QWidget):
                     self._active_worker.cancel()
                 except Exception:
                     pass
+            # No wait() here: threads still running are parked until they
+            # finish, so closing the window never blocks the event loop.
             if self._active_thread is not None:
                 try:
                     self._active_thread.quit()
-                except Exception:
-                    pass
-                try:
-                    self._active_thread.wait(1500)
+                    _retire_thread(self._active_thread)
                 except Exception:
                     pass
             planning_jobs = list(self._planning_jobs.values())
@@ -2274,15 +2712,20 @@ class RemoteDirPanel(QWidget):
             for thread, _worker in planning_jobs:
                 try:
                     thread.quit()
-                    thread.wait(1500)
+                    _retire_thread(thread)
                 except Exception:
                     pass
-            # Persist remaining plan if any.
+            # Persist the transfers that have not finished, if any.
             try:
-                if self._active_plan:
-                    remaining = self._active_plan[max(0, self._active_step - 1):]
-                    if remaining:
-                        self._persist_batch_state(remaining, title=self._active_title or "shutdown")
+                remaining: List[TransferItem] = []
+                titles: List[str] = []
+                for dlg in self._transfer_dialogs:
+                    items = dlg.unfinished_items()
+                    if items:
+                        remaining.extend(items)
+                        titles.append(dlg.windowTitle())
+                if remaining:
+                    self._persist_batch_state(remaining, title="; ".join(titles) or "shutdown")
             except Exception:
                 pass
         finally:
@@ -2292,20 +2735,13 @@ class RemoteDirPanel(QWidget):
             self._planning_jobs.clear()
             self._active_thread = None
             self._active_worker = None
-            self._active_plan = []
-            self._active_step = 0
-            self._active_title = ""
 
-    def _persist_batch_state(self, remaining: List[_PlannedOp], *, title: str) -> None:
+    def _persist_batch_state(self, remaining: List[TransferItem], *, title: str) -> None:
         """Write remaining batch operations to ~/.truba_slurm_gui/last_batch.json.
 
         This is *logs-only* / diagnostics; it does not auto-resume.
         """
         try:
-            from pathlib import Path
-            import json
-            import time
-
             out_path = Path.home() / ".truba_slurm_gui" / "last_batch.json"
             out_path.parent.mkdir(parents=True, exist_ok=True)
             payload = {
@@ -2321,29 +2757,40 @@ class RemoteDirPanel(QWidget):
                     for op in remaining
                 ],
             }
-            out_path.write_text(json.dumps(payload, ensure_ascii=False, indent=2), encoding="utf-8")
+            if orjson is not None:
+                raw = orjson.dumps(payload, option=orjson.OPT_INDENT_2)
+            else:
+                raw = json.dumps(payload, ensure_ascii=False, indent=2).encode("utf-8")
+            out_path.write_bytes(raw)
         except Exception:
             pass
 
     # ---------- copy/move helpers ----------
     def _build_copy_move_plan_with_conflicts(self, op: str, src_paths: List[str], dest_dir: str) -> List[_PlannedOp] | None:
-        if not self.session or not self.session.get("files"):
+        if not self._files:
             return None
-        files = self.session.get("files")
+        files = self._files
 
         plan: List[_PlannedOp] = []
         policy: Optional[str] = None  # overwrite/skip/rename/cancel
 
-        for src in src_paths:
-            src_clean = src.rstrip("/")
-            name = os.path.basename(src_clean)
-            dst_dir = dest_dir.rstrip("/") or "/"
-            dst = dst_dir.rstrip("/") + "/" + name
+        # One listing per directory instead of a stat per source/target.
+        dst_dir = dest_dir.rstrip("/") or "/"
+        dst_prefix = dst_dir.rstrip("/") + "/"
+        sources = [src.rstrip("/") for src in src_paths]
+        probed = [dst_prefix + src.rpartition("/")[2] for src in sources]
+        if op == "copy":
+            probed += sources
+        index = _RemoteDirIndex(files, _dirs_probed_repeatedly(probed))
+
+        for src_clean in sources:
+            name = src_clean.rpartition("/")[2]
+            dst = dst_prefix + name
 
             recursive = False
             if op == "copy":
                 try:
-                    recursive = bool(files.is_dir(src_clean))
+                    recursive = index.is_dir(src_clean)
                 except Exception:
                     try:
                         files.listdir(src_clean)
@@ -2353,7 +2800,7 @@ class RemoteDirPanel(QWidget):
 
             while True:
                 try:
-                    exists = bool(files.exists(dst))
+                    exists = index.exists(dst)
                 except Exception:
                     try:
                         files.listdir(dst)
@@ -2363,15 +2810,14 @@ class RemoteDirPanel(QWidget):
 
                 if exists:
                     if policy is None:
-                        action = self._resolve_conflict(
+                        action_simple, apply_all = self._resolve_conflict(
                             dst,
                             src=src_clean,
                             source_is_local=False,
                             target_is_local=False,
                         )
-                        if action.endswith("_all"):
-                            policy = action.replace("_all", "")
-                        action_simple = action.replace("_all", "")
+                        if apply_all:
+                            policy = action_simple
                     else:
                         action_simple = policy
 
@@ -2387,35 +2833,79 @@ class RemoteDirPanel(QWidget):
                         continue
                     if action_simple == "overwrite":
                         try:
-                            isdir = bool(files.is_dir(dst))
+                            isdir = index.is_dir(dst)
                         except Exception:
                             isdir = False
-                        plan.append(_PlannedOp(op="delete", src="", dst=dst, recursive=isdir))
+                        if isdir or not self._copy_move_overwrites_file(
+                            files, index, op, src_clean, recursive, dst
+                        ):
+                            plan.append(_PlannedOp(op="delete", src="", dst=dst, recursive=isdir))
 
                 plan.append(_PlannedOp(op=op, src=src_clean, dst=dst, recursive=recursive))
                 break
 
         return plan
 
+    @staticmethod
+    def _copy_move_overwrites_file(
+        files,
+        index: _RemoteDirIndex,
+        op: str,
+        src: str,
+        src_is_dir: bool,
+        dst: str,
+    ) -> bool:
+        """True when copying/moving ``src`` onto the existing file ``dst`` replaces it.
+
+        A directory cannot replace a file through cp/mv, so directory
+        sources keep the delete; ``src_is_dir`` is only known up front for
+        copies.  ``dst`` must be known not to be a symlink, since cp would
+        write through a link instead of replacing it.
+        """
+        if not getattr(files, "supports_overwrite", False):
+            return False
+        try:
+            if index.is_symlink(dst):
+                return False
+        except Exception:
+            return False
+        if op == "move":
+            try:
+                src_is_dir = index.is_dir(src)
+            except Exception:
+                return False
+        return not src_is_dir
+
     def _apply_copy_move_with_conflicts(self, op: str, src_paths: List[str], dest_dir: str) -> bool:
         plan = self._build_copy_move_plan_with_conflicts(op, src_paths, dest_dir)
         if plan is None:
             return False
+        return self._run_copy_move_plan(
+            op,
+            plan,
+            self._copy_move_affected_dirs(op, src_paths, dest_dir),
+        )
 
-        title = "İşlem yapılıyor..."
+    @staticmethod
+    def _copy_move_title(op: str) -> str:
         if op == "copy":
-            title = "Kopyalanıyor..."
-        elif op == "move":
-            title = "Taşınıyor..."
+            return "Kopyalanıyor..."
+        if op == "move":
+            return "Taşınıyor..."
+        return "İşlem yapılıyor..."
 
+    def _copy_move_affected_dirs(self, op: str, src_paths: List[str], dest_dir: str) -> set[str]:
         affected_dirs = {self._normalize_remote_dir(dest_dir)}
         if op == "move":
             for src in src_paths:
                 affected_dirs.add(self._parent_remote_dir(src))
+        return affected_dirs
 
+    def _run_copy_move_plan(self, op: str, plan: List[_PlannedOp], affected_dirs: Iterable[str]) -> bool:
+        affected_dirs = set(affected_dirs)
         ok = self._run_plan_with_progress(
             plan,
-            title,
+            self._copy_move_title(op),
             after_finished=lambda: self._finish_remote_directory_mutation(affected_dirs),
         )
         if not ok:
@@ -2428,8 +2918,83 @@ class RemoteDirPanel(QWidget):
                 self._set_last_undo(_UndoRecord(kind="move", moves=moves))
         return True
 
+    def _apply_copy_move_incremental(
+        self,
+        op: str,
+        src_paths: List[str],
+        dest_dir: str,
+        *,
+        on_started: Optional[Callable[[], None]] = None,
+    ) -> bool:
+        """Probe copy/move targets off the GUI thread, then run the plan.
+
+        Conflicts need dialogs, so a plan that hits one is rebuilt by the
+        interactive GUI-thread planner instead.
+        """
+        if not self._files:
+            return False
+        files = self._files
+        clean_paths = [path for path in src_paths if path]
+        if not clean_paths:
+            return True
+        return self._start_transfer_planning(
+            op,
+            lambda worker: self._build_copy_move_plan_background(
+                worker,
+                files,
+                op,
+                clean_paths,
+                dest_dir,
+                on_started,
+            ),
+        )
+
+    def _build_copy_move_plan_background(
+        self,
+        worker: _TransferPlanWorker,
+        files,
+        op: str,
+        src_paths: List[str],
+        dest_dir: str,
+        on_started: Optional[Callable[[], None]],
+    ) -> dict:
+        dst_dir = dest_dir.rstrip("/") or "/"
+        probed = [dst_dir.rstrip("/") + "/" + os.path.basename(src.rstrip("/")) for src in src_paths]
+        if op == "copy":
+            probed += [src.rstrip("/") for src in src_paths]
+        index = _RemoteDirIndex(files, _dirs_probed_repeatedly(probed))
+        plan: List[_PlannedOp] = []
+        for src in src_paths:
+            if worker.cancelled:
+                return {}
+            src_clean = src.rstrip("/")
+            dst = dst_dir.rstrip("/") + "/" + os.path.basename(src_clean)
+            try:
+                exists = index.exists(dst)
+            except Exception:
+                exists = True  # let the interactive planner decide
+            if exists:
+                return {
+                    "conflict": True,
+                    "paths": src_paths,
+                    "directory": dest_dir,
+                    "on_started": on_started,
+                }
+            recursive = False
+            if op == "copy":
+                try:
+                    recursive = index.is_dir(src_clean)
+                except Exception:
+                    recursive = False
+            plan.append(_PlannedOp(op=op, src=src_clean, dst=dst, recursive=recursive))
+        return {
+            "plan": plan,
+            "affected_dirs": sorted(self._copy_move_affected_dirs(op, src_paths, dest_dir)),
+            "on_started": on_started,
+        }
+
     def _paste_remote_clipboard_into(self, dest_dir: str) -> None:
-        if not self.session or not self.session.get("files"):
+        if not self._files:
             return
         clipboard = get_file_clipboard()
         clip = clipboard.get()
@@ -2441,15 +3006,35 @@ class RemoteDirPanel(QWidget):
             dest_dir = "/" + dest_dir
         dest_dir = dest_dir.rstrip("/") or "/"
 
+        def clear_moved_clipboard(moved=clip) -> None:
+            # Planning ran in the background; keep anything copied since.
+            if clipboard.get() is moved:
+                clipboard.clear()
+
         try:
             op = "copy" if clip.op == "copy" else "move"
-            ok = self._apply_copy_move_with_conflicts(op, [s for s in clip.paths], dest_dir)
-            if ok and clip.op == "move":
-                clipboard.clear()
+            self._apply_copy_move_incremental(
+                op,
+                [s for s in clip.paths],
+                dest_dir,
+                on_started=clear_moved_clipboard if op == "move" else None,
+            )
         except Exception as e:
             show_exception(self, title=t("common.error"), user_message=str(e), exc=e, area="FILES")
 
 
+    def _on_system_clipboard_changed(self) -> None:
+        self._clipboard_has_local_urls = None
+
+    def _system_clipboard_has_local_urls(self) -> bool:
+        # Reading the clipboard can be an IPC round trip to its owner under
+        # X11/Wayland; do it once per clipboard change, not per right-click.
+        if self._clipboard_has_local_urls is None:
+            self._clipboard_has_local_urls = bool(
+                self._local_paths_from_mime(QApplication.clipboard().mimeData())
+            )
+        return self._clipboard_has_local_urls
+
     def _paste_system_clipboard_into(self, dest_dir: str) -> bool:
         """If OS clipboard contains local file urls, upload them into dest_dir."""
         cb = QApplication.clipboard().mimeData()
@@ -2462,7 +3047,7 @@ class RemoteDirPanel(QWidget):
 
     def _paste_remote_to_local(self) -> None:
         """Download internal remote clipboard items into a chosen local directory."""
-        if not self.session or not self.session.get("files"):
+        if not self._files:
             return
         clip = get_file_clipboard().get()
         if not clip or not clip.paths:
@@ -2477,34 +3062,40 @@ class RemoteDirPanel(QWidget):
             # move doesn't make sense for remote->local; keep clipboard as-is
             pass
 
-    def _remote_walk(self, base_remote: str) -> List[Tuple[str, str, bool]]:
-        """Return list of (remote_path, rel_path, is_dir) under base_remote including base."""
-        files = self.session["files"]
+    def _remote_walk(self, base_remote: str) -> Iterator[Tuple[str, str, bool]]:
+        """Yield (remote_path, rel_path, is_dir) under base_remote including base.
+
+        Depth-first, parents before children, with an explicit stack so deep
+        trees neither build a full list nor hit the recursion limit.
+        """
+        files = self._files
         base_remote = base_remote.rstrip("/")
-        out: List[Tuple[str, str, bool]] = []
+        yield (base_remote, "", True)
 
-        def rec(cur: str, rel: str):
+        def listing(cur: str) -> Iterator[RemoteEntry]:
             try:
-                entries = files.listdir_entries(cur)
+                return iter(files.listdir_entries(cur))
             except Exception:
-                return
-            for e in entries:
-                epath = e.path.rstrip("/")
-                erel = (rel + "/" if rel else "") + e.name
-                if e.is_dir:
-                    out.append((epath, erel, True))
-                    rec(epath, erel)
-                else:
-                    out.append((epath, erel, False))
-
-        out.append((base_remote, "", True))
-        rec(base_remote, "")
-        return out
+                return iter(())
+
+        # Each level carries its relative prefix ("" or "a/b/").
+        stack: List[Tuple[Iterator[RemoteEntry], str]] = [(listing(base_remote), "")]
+        while stack:
+            entries, rel_prefix = stack[-1]
+            e = next(entries, None)
+            if e is None:
+                stack.pop()
+                continue
+            epath = e.path.rstrip("/")
+            erel = rel_prefix + e.name
+            yield (epath, erel, bool(e.is_dir))
+            if e.is_dir:
+                stack.append((listing(epath), erel + "/"))
 
     def _apply_remote_download(self, src_paths: List[str], target_dir: str) -> bool:
-        if not self.session or not self.session.get("files"):
+        if not self._files:
             return False
-        files = self.session["files"]
+        files = self._files
         target_dir = os.path.abspath(target_dir)
 
         plan: List[_PlannedOp] = []
@@ -2528,15 +3119,14 @@ class RemoteDirPanel(QWidget):
             # conflict resolution on local target
             while os.path.exists(local_dst):
                 if policy is None:
-                    action = self._resolve_conflict(
+                    action_simple, apply_all = self._resolve_conflict(
                         local_dst,
                         src=src_clean,
                         source_is_local=False,
                         target_is_local=True,
                     )
-                    if action.endswith("_all"):
-                        policy = action.replace("_all", "")
-                    action_simple = action.replace("_all", "")
+                    if apply_all:
+                        policy = action_simple
                 else:
                     action_simple = policy
 
@@ -2564,6 +3154,7 @@ class RemoteDirPanel(QWidget):
             if not is_dir:
                 plan.append(_PlannedOp(op="download", src=src_clean, dst=local_dst))
             else:
+                fresh = self._is_fresh_local_target(plan, local_dst)
                 # mkdir base local
                 plan.append(_PlannedOp(op="mkdir_local", src="", dst=local_dst, recursive=False))
                 # walk remote dir and download files
@@ -2574,17 +3165,16 @@ class RemoteDirPanel(QWidget):
                     if r_is_dir:
                         plan.append(_PlannedOp(op="mkdir_local", src="", dst=lp))
                     else:
-                        while os.path.exists(lp):
+                        while not fresh and os.path.exists(lp):
                             if policy is None:
-                                action = self._resolve_conflict(
+                                action_simple, apply_all = self._resolve_conflict(
                                     lp,
                                     src=rpath,
                                     source_is_local=False,
                                     target_is_local=True,
                                 )
-                                if action.endswith("_all"):
-                                    policy = action.replace("_all", "")
-                                action_simple = action.replace("_all", "")
+                                if apply_all:
+                                    policy = action_simple
                             else:
                                 action_simple = policy
 
@@ -2623,9 +3213,9 @@ class RemoteDirPanel(QWidget):
         src_paths: List[str],
         target_dir: str,
     ) -> bool:
-        if not self.session or not self.session.get("files"):
+        if not self._files:
             return False
-        files = self.session["files"]
+        files = self._files
         clean_paths = [path for path in src_paths if path]
         absolute_target = os.path.abspath(target_dir)
         if not clean_paths:
@@ -2648,7 +3238,7 @@ class RemoteDirPanel(QWidget):
         affected_dirs: Optional[List[str]] = None,
     ) -> bool:
         """Schedule remote traversal/planning in bounded GUI event-loop steps."""
-        if not self.session or not self.session.get("files"):
+        if not self._files:
             return False
         job_id = self._next_remote_download_plan_id
         self._next_remote_download_plan_id += 1
@@ -2704,6 +3294,9 @@ class RemoteDirPanel(QWidget):
     ) -> None:
         if job_id not in self._planning_jobs or not result:
             return
+        if kind in ("copy", "move"):
+            self._on_copy_move_plan_finished(kind, result)
+            return
         if result.get("conflict"):
             if kind == "upload":
                 self._apply_local_upload_incremental_gui(
@@ -2730,6 +3323,26 @@ class RemoteDirPanel(QWidget):
             confirm_before_start=bool(result.get("confirm_before_start")),
         )
 
+    def _on_copy_move_plan_finished(self, op: str, result: dict) -> None:
+        try:
+            if result.get("conflict"):
+                ok = self._apply_copy_move_with_conflicts(
+                    op,
+                    result["paths"],
+                    result["directory"],
+                )
+            else:
+                ok = bool(result.get("plan")) and self._run_copy_move_plan(
+                    op,
+                    result["plan"],
+                    result.get("affected_dirs") or [],
+                )
+            on_started = result.get("on_started")
+            if ok and on_started is not None:
+                on_started()
+        except Exception as e:
+            show_exception(self, title=t("common.error"), user_message=str(e), exc=e, area="FILES")
+
     @Slot(int, str, object)
     def _on_transfer_plan_failed(
         self,
@@ -2852,14 +3465,30 @@ class RemoteDirPanel(QWidget):
             ),
         )
 
+    @staticmethod
+    def _is_fresh_local_target(plan: List[_PlannedOp], local_dir: str) -> bool:
+        """True when nothing can already exist below ``local_dir``.
+
+        That holds if it is missing now or the plan deletes it first; files
+        downloaded into such a tree need no per-file conflict stat.
+        """
+        if plan and plan[-1].op == "delete_local" and plan[-1].dst == local_dir:
+            return True
+        return not os.path.exists(local_dir)
+
+    @staticmethod
+    def _is_fresh_remote_target(plan: List[_PlannedOp], remote_dir: str) -> bool:
+        """True when the plan deletes ``remote_dir`` right before recreating it."""
+        return bool(plan) and plan[-1].op == "delete" and plan[-1].dst == remote_dir
+
     def _iter_remote_download_plan(
         self,
         src_paths: List[str],
         target_dir: str,
     ) -> Generator[None, None, Optional[List[_PlannedOp]]]:
-        if not self.session or not self.session.get("files"):
+        if not self._files:
             return None
-        files = self.session["files"]
+        files = self._files
         plan: List[_PlannedOp] = []
         policy: Optional[str] = None
         seen_sources: set[str] = set()
@@ -2869,20 +3498,20 @@ class RemoteDirPanel(QWidget):
             remote_path: str,
             *,
             is_dir: bool,
+            fresh: bool = False,
         ) -> Generator[None, None, Optional[str]]:
             nonlocal policy
-            while os.path.exists(local_path):
+            while not fresh and os.path.exists(local_path):
                 yield
                 if policy is None:
-                    action = self._resolve_conflict(
+                    action_simple, apply_all = self._resolve_conflict(
                         local_path,
                         src=remote_path,
                         source_is_local=False,
                         target_is_local=True,
                     )
-                    if action.endswith("_all"):
-                        policy = action.replace("_all", "")
-                    action_simple = action.replace("_all", "")
+                    if apply_all:
+                        policy = action_simple
                 else:
                     action_simple = policy
                 if action_simple == "cancel":
@@ -2940,6 +3569,7 @@ class RemoteDirPanel(QWidget):
                 yield
                 continue
 
+            fresh = self._is_fresh_local_target(plan, local_dst)
             plan.append(_PlannedOp(op="mkdir_local", src="", dst=local_dst))
             stack: List[Tuple[str, str]] = [(src_clean, "")]
             while stack:
@@ -2973,6 +3603,7 @@ class RemoteDirPanel(QWidget):
                         local_path,
                         remote_path,
                         is_dir=False,
+                        fresh=fresh,
                     )
                     if local_path is None:
                         return None
@@ -2989,9 +3620,9 @@ class RemoteDirPanel(QWidget):
         return plan
 
     def _apply_local_upload(self, local_paths: List[str], dest_dir: str) -> bool:
-        if not self.session or not self.session.get("files"):
+        if not self._files:
             return False
-        files = self.session["files"]
+        files = self._files
 
         dest_dir = (dest_dir or "/").strip()
         if not dest_dir.startswith("/"):
@@ -3001,6 +3632,10 @@ class RemoteDirPanel(QWidget):
         plan: List[_PlannedOp] = []
         policy: Optional[str] = None
 
+        index = _RemoteDirIndex(
+            files,
+            [dest_dir] if len([lp for lp in local_paths if lp]) > 1 else [],
+        )
         seen_sources: set[str] = set()
         for lp in local_paths:
             if not lp:
@@ -3016,21 +3651,20 @@ class RemoteDirPanel(QWidget):
             # conflict resolution on remote target
             while True:
                 try:
-                    exists = bool(files.exists(rp_base))
+                    exists = index.exists(rp_base)
                 except Exception:
                     exists = False
 
                 if exists:
                     if policy is None:
-                        action = self._resolve_conflict(
+                        action_simple, apply_all = self._resolve_conflict(
                             rp_base,
                             src=lp,
                             source_is_local=True,
                             target_is_local=False,
                         )
-                        if action.endswith("_all"):
-                            policy = action.replace("_all", "")
-                        action_simple = action.replace("_all", "")
+                        if apply_all:
+                            policy = action_simple
                     else:
                         action_simple = policy
 
@@ -3048,7 +3682,7 @@ class RemoteDirPanel(QWidget):
                         continue
                     if action_simple == "overwrite":
                         try:
-                            isdir_remote = bool(files.is_dir(rp_base))
+                            isdir_remote = index.is_dir(rp_base)
                         except Exception:
                             isdir_remote = False
                         plan.append(_PlannedOp(op="delete", src="", dst=rp_base, recursive=isdir_remote))
@@ -3062,36 +3696,41 @@ class RemoteDirPanel(QWidget):
             if not is_dir:
                 plan.append(_PlannedOp(op="upload", src=lp, dst=rp_base))
             else:
+                fresh = self._is_fresh_remote_target(plan, rp_base)
                 # mkdir base
                 plan.append(_PlannedOp(op="mkdir_remote", src="", dst=rp_base))
                 # walk local dir
-                for root, dirs, files_ls in os.walk(lp):
-                    rel_root = os.path.relpath(root, lp)
-                    rel_root = "" if rel_root == "." else rel_root
+                for root, rel_root, dirs, files_ls in _walk_local_tree(lp):
+                    remote_root = rp_base + ("/" + rel_root if rel_root else "") + "/"
                     for d in dirs:
-                        rdir = rp_base + ("/" + rel_root if rel_root else "") + "/" + d
+                        rdir = remote_root + d
                         plan.append(_PlannedOp(op="mkdir_remote", src="", dst=rdir))
+                    # One listing answers every probe in a directory with
+                    # several files; nothing exists below a deleted base.
+                    dir_index = _RemoteDirIndex(
+                        files,
+                        [remote_root] if len(files_ls) > 1 and not fresh else [],
+                    )
                     for fn in files_ls:
                         lfile = os.path.join(root, fn)
-                        rfile = rp_base + ("/" + rel_root if rel_root else "") + "/" + fn
+                        rfile = remote_root + fn
                         while True:
                             try:
-                                exists = bool(files.exists(rfile))
+                                exists = not fresh and dir_index.exists(rfile)
                             except Exception:
                                 exists = False
                             if not exists:
                                 break
 
                             if policy is None:
-                                action = self._resolve_conflict(
+                                action_simple, apply_all = self._resolve_conflict(
                                     rfile,
                                     src=lfile,
                                     source_is_local=True,
                                     target_is_local=False,
                                 )
-                                if action.endswith("_all"):
-                                    policy = action.replace("_all", "")
-                                action_simple = action.replace("_all", "")
+                                if apply_all:
+                                    policy = action_simple
                             else:
                                 action_simple = policy
 
@@ -3135,7 +3774,7 @@ class RemoteDirPanel(QWidget):
         )
 
     def _apply_local_upload_incremental(self, local_paths: List[str], dest_dir: str) -> bool:
-        if not self.session or not self.session.get("files"):
+        if not self._files:
             return False
         normalized_dest = (dest_dir or "/").strip()
         if not normalized_dest.startswith("/"):
@@ -3144,7 +3783,7 @@ class RemoteDirPanel(QWidget):
         clean_paths = [path for path in local_paths if path]
         if not clean_paths:
             return True
-        files = self.session["files"]
+        files = self._files
         return self._start_transfer_planning(
             "upload",
             lambda worker: self._build_local_upload_plan_background(
@@ -3189,16 +3828,10 @@ class RemoteDirPanel(QWidget):
                 )
                 continue
             plan.append(_PlannedOp("mkdir_remote", "", remote_base))
-            for root, dirs, filenames in os.walk(absolute_path):
+            for root, rel_root, dirs, filenames in _walk_local_tree(absolute_path):
                 if worker.cancelled:
                     return {}
-                rel_root = os.path.relpath(root, absolute_path)
-                rel_root = "" if rel_root == "." else rel_root
-                remote_root = remote_base + (
-                    "/" + rel_root.replace(os.sep, "/")
-                    if rel_root
-                    else ""
-                )
+                remote_root = remote_base + ("/" + rel_root if rel_root else "")
                 for dirname in dirs:
                     plan.append(
                         _PlannedOp(
@@ -3229,7 +3862,7 @@ class RemoteDirPanel(QWidget):
         }
 
     def _apply_local_upload_incremental_gui(self, local_paths: List[str], dest_dir: str) -> bool:
-        if not self.session or not self.session.get("files"):
+        if not self._files:
             return False
         dest_dir = (dest_dir or "/").strip()
         if not dest_dir.startswith("/"):
@@ -3272,12 +3905,16 @@ class RemoteDirPanel(QWidget):
         local_paths: List[str],
         dest_dir: str,
     ) -> Generator[None, None, Optional[List[_PlannedOp]]]:
-        if not self.session or not self.session.get("files"):
+        if not self._files:
             return None
-        files = self.session["files"]
+        files = self._files
         plan: List[_PlannedOp] = []
         policy: Optional[str] = None
 
+        index = _RemoteDirIndex(
+            files,
+            [dest_dir] if len([lp for lp in local_paths if lp]) > 1 else [],
+        )
         seen_sources: set[str] = set()
         for lp in local_paths:
             if not lp:
@@ -3294,22 +3931,21 @@ class RemoteDirPanel(QWidget):
 
             while True:
                 try:
-                    exists = bool(files.exists(rp_base))
+                    exists = index.exists(rp_base)
                 except Exception:
                     exists = False
                 yield
 
                 if exists:
                     if policy is None:
-                        action = self._resolve_conflict(
+                        action_simple, apply_all = self._resolve_conflict(
                             rp_base,
                             src=lp,
                             source_is_local=True,
                             target_is_local=False,
                         )
-                        if action.endswith("_all"):
-                            policy = action.replace("_all", "")
-                        action_simple = action.replace("_all", "")
+                        if apply_all:
+                            policy = action_simple
                     else:
                         action_simple = policy
 
@@ -3328,7 +3964,7 @@ class RemoteDirPanel(QWidget):
                         continue
                     if action_simple == "overwrite":
                         try:
-                            isdir_remote = bool(files.is_dir(rp_base))
+                            isdir_remote = index.is_dir(rp_base)
                         except Exception:
                             isdir_remote = False
                         plan.append(_PlannedOp(op="delete", src="", dst=rp_base, recursive=isdir_remote))
@@ -3345,22 +3981,26 @@ class RemoteDirPanel(QWidget):
                 yield
                 continue
 
+            fresh = self._is_fresh_remote_target(plan, rp_base)
             plan.append(_PlannedOp(op="mkdir_remote", src="", dst=rp_base))
             yield
-            for root, dirs, files_ls in os.walk(lp):
+            for root, rel_root, dirs, files_ls in _walk_local_tree(lp):
                 yield
-                rel_root = os.path.relpath(root, lp)
-                rel_root = "" if rel_root == "." else rel_root
+                remote_root = rp_base + ("/" + rel_root if rel_root else "") + "/"
                 for d in dirs:
-                    rdir = rp_base + ("/" + rel_root if rel_root else "") + "/" + d
+                    rdir = remote_root + d
                     plan.append(_PlannedOp(op="mkdir_remote", src="", dst=rdir))
                     yield
+                dir_index = _RemoteDirIndex(
+                    files,
+                    [remote_root] if len(files_ls) > 1 and not fresh else [],
+                )
                 for fn in files_ls:
                     lfile = os.path.join(root, fn)
-                    rfile = rp_base + ("/" + rel_root if rel_root else "") + "/" + fn
+                    rfile = remote_root + fn
                     while True:
                         try:
-                            exists = bool(files.exists(rfile))
+                            exists = not fresh and dir_index.exists(rfile)
                         except Exception:
                             exists = False
                         yield
@@ -3368,15 +4008,14 @@ class RemoteDirPanel(QWidget):
                             break
 
                         if policy is None:
-                            action = self._resolve_conflict(
+                            action_simple, apply_all = self._resolve_conflict(
                                 rfile,
                                 src=lfile,
                                 source_is_local=True,
                                 target_is_local=False,
                             )
-                            if action.endswith("_all"):
-                                policy = action.replace("_all", "")
-                            action_simple = action.replace("_all", "")
+                            if apply_all:
+                                policy = action_simple
                         else:
                             action_simple = policy
 
@@ -3418,7 +4057,7 @@ class RemoteDirPanel(QWidget):
         return Path(__file__).resolve().parents[4] / "templates" / "extract_iso.py"
 
     def show_template_upload_menu(self) -> None:
-        if not self.session or not self.session.get("files"):
+        if not self._files:
             QMessageBox.warning(self, t("common.error"), t("common.no_connection"))
             return
         if not self.current_dir:
@@ -3427,15 +4066,16 @@ class RemoteDirPanel(QWidget):
 
         menu = QMenu(self)
         act_extract_iso = menu.addAction(
-            t("dirs.template_extract_iso") if t("dirs.template_extract_iso") != "[dirs.template_extract_iso]" else "extract_iso.py"
+            tr("dirs.template_extract_iso", "extract_iso.py")
         )
         chosen = menu.exec(self.btn_template_upload.mapToGlobal(self.btn_template_upload.rect().bottomLeft()))
+        menu.deleteLater()
         if chosen != act_extract_iso:
             return
         self.upload_template_file(self._template_upload_path())
 
     def upload_template_file(self, template_path: Path) -> bool:
-        if not self.session or not self.session.get("files"):
+        if not self._files:
             QMessageBox.warning(self, t("common.error"), t("common.no_connection"))
             return False
         if not self.current_dir:
@@ -3445,9 +4085,9 @@ class RemoteDirPanel(QWidget):
             QMessageBox.warning(
                 self,
                 t("common.error"),
-                t("dirs.template_missing").format(path=str(template_path))
-                if t("dirs.template_missing") != "[dirs.template_missing]"
-                else f"Template file not found: {template_path}",
+                tr("dirs.template_missing", "Template file not found: {path}").format(
+                    path=str(template_path)
+                ),
             )
             return False
         return self._apply_local_upload_incremental(
@@ -3457,34 +4097,29 @@ class RemoteDirPanel(QWidget):
 
     # ---------- upload / download ----------
     def upload_files(self):
-        if not self.session or not self.session.get("files"):
+        if not self._files:
             QMessageBox.warning(self, t("common.error"), t("common.no_connection"))
             return
         if not self.current_dir:
             QMessageBox.warning(self, t("common.error"), t("dirs.no_directory_selected"))
             return
-        paths, _ = QFileDialog.getOpenFileNames(self, t("dirs.upload") if t("dirs.upload") != "[dirs.upload]" else "Yükle")
+        paths, _ = QFileDialog.getOpenFileNames(self, tr("dirs.upload", "Yükle"))
         if not paths:
             return
         self._apply_local_upload_incremental(paths, self.current_dir)
 
     def download_selected(self):
-        if not self.session or not self.session.get("files"):
+        if not self._files:
             QMessageBox.warning(self, t("common.error"), t("common.no_connection"))
             return
-        files = self.session["files"]
-        tab = self.tabs.currentWidget()
-        tab_key = "all"
-        for k, v in self.views.items():
-            if v is tab:
-                tab_key = k
-                break
+        files = self._files
+        tab_key = self._current_view_key()
         sel = self.selected_paths(tab_key)
         if not sel:
             QMessageBox.information(self, t("common.info"), t("dirs.no_file_selected"))
             return
         target_dir = QFileDialog.getExistingDirectory(
-            self, t("dirs.download_selected") if t("dirs.download_selected") != "[dirs.download_selected]" else "Seçilenleri İndir"
+            self, tr("dirs.download_selected", "Seçilenleri İndir")
         )
         if not target_dir:
             return
@@ -3492,7 +4127,7 @@ class RemoteDirPanel(QWidget):
 
     # ---------- drag/drop apply ----------
     def _apply_drag_drop(self, src_paths: List[str], dest_dir: str, *, is_copy: bool, src_panel_id: str) -> bool:
-        if not self.session or not self.session.get("files"):
+        if not self._files:
             return False
 
         dest_dir = (dest_dir or "/").strip()
@@ -3502,7 +4137,7 @@ class RemoteDirPanel(QWidget):
 
         try:
             op = "copy" if is_copy else "move"
-            return self._apply_copy_move_with_conflicts(op, src_paths, dest_dir)
+            return self._apply_copy_move_incremental(op, src_paths, dest_dir)
         except Exception as e:
             show_exception(self, title=t("common.error"), user_message=str(e), exc=e, area="FILES")
             return False
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import concurrent.futures
 import os
 import stat
 import tempfile
@@ -13,7 +14,7 @@ from unittest.mock import patch
 
 os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
 
-from PySide6.QtCore import QEvent, QMimeData, QPoint, Qt, QUrl
+from PySide6.QtCore import QEvent, QMimeData, QPoint, Qt, QThread, QTimer, QUrl
 from PySide6.QtGui import QKeyEvent
 from PySide6.QtWidgets import QApplication, QDialog, QPlainTextEdit, QMessageBox
 
@@ -62,10 +63,14 @@ from truba_gui.ui.widgets.remote_dir_panel import (
     _DragPayload,
     _PlannedOp,
     _PermissionsDialog,
+    _RETIRED_THREADS,
     _encode_payload,
+    _retire_thread,
+    wait_for_retired_threads,
 )
 from truba_gui.services.files_base import RemoteEntry
 from truba_gui.services.files_ssh import SSHFilesBackend
+from truba_gui.config.models import SSHConfig
 from truba_gui.core.i18n import load_language
 
 
@@ -294,6 +299,23 @@ class FtpWidgetTests(unittest.TestCase):
         self.widget.transfer_activity.record("completed", [item], "Upload")
         self.assertEqual(self.widget.transfer_activity.completed_list.topLevelItemCount(), 1)
 
+    def test_transfer_activity_sync_repaints_each_view_once(self) -> None:
+        activity = self.widget.transfer_activity
+        item = SimpleNamespace(op="upload", src="a.txt", dst="/remote/a.txt")
+        calls: list[bool] = []
+        original = activity.completed_list.setUpdatesEnabled
+
+        def record(enabled: bool) -> None:
+            calls.append(enabled)
+            original(enabled)
+
+        with patch.object(activity.completed_list, "setUpdatesEnabled", side_effect=record):
+            activity._sync_lists([], [], [item], [])
+
+        self.assertEqual(calls, [False, True])
+        self.assertTrue(activity.completed_list.updatesEnabled())
+        self.assertEqual(activity.completed_list.topLevelItemCount(), 1)
+
     def test_multi_folder_download_queue_caps_rows_without_truncating_plan(self) -> None:
         items = [
             TransferItem(
@@ -1076,6 +1098,43 @@ class FtpWidgetTests(unittest.TestCase):
             dialog.cancel_all()
             dialog.deleteLater()
 
+    def test_transfer_dialog_serializes_transfers_to_the_same_target(self) -> None:
+        active: list[str] = []
+        overlaps: list[str] = []
+        lock = threading.Lock()
+        items = [
+            TransferItem("upload", "old/data.bin", "/remote/data.bin"),
+            TransferItem("upload", "new/data.bin", "/remote/data.bin"),
+            TransferItem("upload", "other.bin", "/remote/other.bin"),
+        ]
+
+        def run_item(item, _progress=None):
+            with lock:
+                if item.dst in active:
+                    overlaps.append(item.src)
+                active.append(item.dst)
+            time.sleep(0.03)
+            with lock:
+                active.remove(item.dst)
+
+        dialog = TransferDialog(
+            title="Upload",
+            items=items,
+            run_item=run_item,
+            parallel_limit=3,
+        )
+        try:
+            dialog.start()
+            deadline = time.monotonic() + 3
+            while time.monotonic() < deadline and not dialog.finished_cleanly():
+                QApplication.processEvents()
+                time.sleep(0.01)
+            self.assertTrue(dialog.finished_cleanly())
+            self.assertEqual(overlaps, [])
+        finally:
+            dialog.cancel_all()
+            dialog.deleteLater()
+
     def test_transfer_dialog_finishes_mkdir_before_parallel_transfer_batch(self) -> None:
         prepared = threading.Event()
         started_uploads: list[str] = []
@@ -1178,6 +1237,27 @@ class FtpWidgetTests(unittest.TestCase):
         )._WorkerThread(items, lambda _item, _progress=None: None, parallel_limit=3)
         self.assertEqual(worker._items, items)
 
+    def test_worker_coalesces_chunk_progress_but_keeps_the_final_update(self) -> None:
+        item = TransferItem("upload", "big.bin", "/remote/big.bin")
+
+        def run_item(_item, progress=None) -> None:
+            for done in range(1, 101):
+                progress(done * 32768, 100 * 32768)
+
+        worker = __import__(
+            "truba_gui.ui.dialogs.transfer_dialog",
+            fromlist=["_WorkerThread"],
+        )._WorkerThread([item], run_item)
+        updates: list[tuple[int, int]] = []
+        worker.transfer_progress.connect(
+            lambda _item, done, total: updates.append((done, total)),
+            Qt.ConnectionType.DirectConnection,
+        )
+
+        self.assertEqual(worker._run_one(item), (item, False, ""))
+        self.assertLess(len(updates), 100)
+        self.assertEqual(updates[-1], (100 * 32768, 100 * 32768))
+
     def test_transfer_dialog_never_exceeds_backend_safe_cap(self) -> None:
         dialog = TransferDialog(
             title="Upload",
@@ -1400,6 +1480,97 @@ class FtpWidgetTests(unittest.TestCase):
         self.assertTrue(all(channel.closed for channel in transfer_channels))
         self.assertEqual(ssh.assert_modes, ["wb", "wb", "wb"])
 
+    def test_ssh_background_listings_use_one_serialized_channel(self) -> None:
+        class Attr:
+            def __init__(self, name: str) -> None:
+                self.filename = name
+                self.st_mode = 0o100644
+                self.st_size = 1
+                self.st_mtime = 1
+
+        class ListingChannel:
+            def __init__(self, owner) -> None:
+                self.owner = owner
+
+            def listdir_iter(self, path: str):
+                with self.owner.lock:
+                    self.owner.active += 1
+                    self.owner.max_active = max(self.owner.max_active, self.owner.active)
+                time.sleep(0.02)
+                with self.owner.lock:
+                    self.owner.active -= 1
+                return [Attr(path.rsplit("/", 1)[-1] + ".txt")]
+
+            def close(self) -> None:
+                pass
+
+        class BrowsingChannel:
+            def listdir_iter(self, _path: str):
+                raise AssertionError("background listings must not use the browsing channel")
+
+        class FakeSSH:
+            sftp = BrowsingChannel()
+
+            def __init__(self) -> None:
+                self.opened = 0
+                self.lock = threading.Lock()
+                self.active = 0
+                self.max_active = 0
+
+            def open_transfer_sftp(self):
+                self.opened += 1
+                return ListingChannel(self)
+
+            def supports_transfer_sftp_channels(self) -> bool:
+                return True
+
+        ssh = FakeSSH()
+        backend = SSHFilesBackend(ssh)
+        opened_by_probe = ssh.opened
+        with concurrent.futures.ThreadPoolExecutor(max_workers=4) as pool:
+            names = list(
+                pool.map(
+                    lambda path: backend.listdir_entries_isolated(path)[0].name,
+                    ["/r/a", "/r/b", "/r/c", "/r/d"],
+                )
+            )
+
+        self.assertEqual(names, ["a.txt", "b.txt", "c.txt", "d.txt"])
+        self.assertEqual(ssh.max_active, 1)
+        self.assertEqual(ssh.opened - opened_by_probe, 1)
+
+    def test_ssh_backend_close_releases_the_listing_channel(self) -> None:
+        class ListingChannel:
+            def __init__(self) -> None:
+                self.closed = False
+
+            def listdir_iter(self, _path: str):
+                return []
+
+            def close(self) -> None:
+                self.closed = True
+
+        class FakeSSH:
+            sftp = object()
+
+            def __init__(self) -> None:
+                self.channels: list[ListingChannel] = []
+
+            def open_transfer_sftp(self):
+                self.channels.append(ListingChannel())
+                return self.channels[-1]
+
+        ssh = FakeSSH()
+        backend = SSHFilesBackend(ssh)
+        backend.listdir_entries_isolated("/r")
+        backend.close()
+        backend.close()
+
+        self.assertEqual([channel.closed for channel in ssh.channels], [True])
+        with self.assertRaises(RuntimeError):
+            backend.listdir_entries_isolated("/r")
+        self.assertEqual(len(ssh.channels), 1)
+
     def test_ssh_backend_without_transfer_channel_capability_clamps_parallelism(self) -> None:
         class UnavailableSSH:
             sftp = object()
@@ -1472,6 +1643,44 @@ class FtpWidgetTests(unittest.TestCase):
         self.assertEqual(bytes(channel.writer.data), b"abcdefgh")
         self.assertTrue(channel.closed)
 
+    def test_ssh_exists_many_falls_back_to_isolated_channels_without_shell(self) -> None:
+        existing = {"/remote/a", "/remote/c"}
+        opened: list[object] = []
+
+        class ProbeChannel:
+            def __init__(self) -> None:
+                self.closed = False
+
+            def stat(self, path: str):
+                if path not in existing:
+                    raise FileNotFoundError(path)
+                return SimpleNamespace(st_size=0)
+
+            def close(self) -> None:
+                self.closed = True
+
+        def open_transfer_sftp():
+            channel = ProbeChannel()
+            opened.append(channel)
+            return channel
+
+        ssh = SimpleNamespace(
+            sftp=object(),
+            supports_transfer_sftp_channels=lambda: True,
+            open_transfer_sftp=open_transfer_sftp,
+            run=lambda _cmd, log_output=False: (127, "", "sh: not found"),
+        )
+        backend = SSHFilesBackend(ssh)
+
+        result = backend.exists_many(["/remote/a", "/remote/b", "/remote/c"])
+
+        self.assertEqual(
+            result,
+            {"/remote/a": True, "/remote/b": False, "/remote/c": True},
+        )
+        self.assertTrue(opened)
+        self.assertTrue(all(channel.closed for channel in opened))
+
     def test_upload_preflight_shows_counts_and_source_destination_rows(self) -> None:
         items = [
             TransferItem("mkdir_remote", "", "/remote/folder"),
@@ -1818,6 +2027,16 @@ class FtpWidgetTests(unittest.TestCase):
                 TransferConflictDialog._format_time(local_ts),
                 "11/16/2025 11:26:39 AM",
             )
+
+            dialog.set_files(
+                source=TransferConflictInfo("/source/next.txt", size=3),
+                target=TransferConflictInfo("/target/next.txt", size=4),
+            )
+            self.assertEqual(dialog.decision(), TransferConflictDecision("overwrite"))
+            self.assertEqual(
+                [path.text() for path, _info in dialog._file_labels],
+                ["/source/next.txt", "/target/next.txt"],
+            )
         finally:
             dialog.deleteLater()
 
@@ -2740,6 +2959,59 @@ class FtpWidgetTests(unittest.TestCase):
                 time.sleep(0.01)
             self.assertTrue(run_plan.called)
 
+    def test_remote_paste_move_probes_targets_off_gui_thread(self) -> None:
+        from truba_gui.services.file_clipboard import get_file_clipboard
+
+        class ProbeFiles:
+            def __init__(self) -> None:
+                self.threads: list[int] = []
+
+            def listdir_entries(self, remote_dir: str) -> list[RemoteEntry]:
+                self.threads.append(threading.get_ident())
+                return []
+
+            def exists(self, _path: str) -> bool:
+                self.threads.append(threading.get_ident())
+                return False
+
+        files = ProbeFiles()
+        panel = self.widget.panel_scratch
+        panel.session = {"connected": True, "files": files}
+        clipboard = get_file_clipboard()
+        clipboard.set("move", ["/remote/a.txt", "/remote/b.txt"])
+        try:
+            with patch.object(
+                panel,
+                "_run_plan_with_progress",
+                return_value=True,
+            ) as run_plan:
+                panel._paste_remote_clipboard_into("/remote/target")
+                run_plan.assert_not_called()
+                deadline = time.monotonic() + 3
+                while time.monotonic() < deadline and not run_plan.called:
+                    self.app.processEvents()
+                    time.sleep(0.01)
+
+            self.assertTrue(run_plan.called)
+            plan = run_plan.call_args.args[0]
+            self.assertEqual(
+                [(op.op, op.src, op.dst) for op in plan],
+                [
+                    ("move", "/remote/a.txt", "/remote/target/a.txt"),
+                    ("move", "/remote/b.txt", "/remote/target/b.txt"),
+                ],
+            )
+            self.assertTrue(files.threads)
+            self.assertNotIn(threading.get_ident(), files.threads)
+            self.assertIsNone(clipboard.get())
+            self.assertEqual(
+                RemoteDirPanel._last_undo.moves,
+                [(op.src, op.dst) for op in plan],
+            )
+        finally:
+            clipboard.clear()
+            panel._set_last_undo(None)
+
     def test_remote_multi_folder_download_pipeline_stays_off_gui_thread(self) -> None:
         class PipelineFiles:
             supports_parallel_transfers = True
@@ -3284,6 +3556,9 @@ class FtpWidgetTests(unittest.TestCase):
             def addSeparator(self) -> None:
                 self.actions.append(None)
 
+            def deleteLater(self) -> None:
+                pass
+
             def exec(self, _pos):
                 for action in self.actions:
                     if action is not None and action.text == self.choose_text:
@@ -3364,6 +3639,9 @@ class FtpWidgetTests(unittest.TestCase):
             def addSeparator(self) -> None:
                 self.actions.append(None)
 
+            def deleteLater(self) -> None:
+                pass
+
             def exec(self, _pos):
                 for action in self.actions:
                     if action is not None and action.text == "Submit with sbatch":
@@ -3416,6 +3694,9 @@ class FtpWidgetTests(unittest.TestCase):
             def addSeparator(self) -> None:
                 self.actions.append(None)
 
+            def deleteLater(self) -> None:
+                pass
+
             def exec(self, _pos):
                 for action in self.actions:
                     if action is not None and action.text == "Run in terminal":
@@ -3476,6 +3757,9 @@ class FtpWidgetTests(unittest.TestCase):
             def addSeparator(self) -> None:
                 self.actions.append(None)
 
+            def deleteLater(self) -> None:
+                pass
+
             def exec(self, _pos):
                 return None
 
@@ -3799,6 +4083,9 @@ class FtpWidgetTests(unittest.TestCase):
             def addSeparator(self) -> None:
                 self.actions.append(None)
 
+            def deleteLater(self) -> None:
+                pass
+
             def exec(self, _pos):
                 for action in self.actions:
                     if action is not None and action.text == "Open in new tab":
@@ -3891,6 +4178,9 @@ class FtpWidgetTests(unittest.TestCase):
             def addSeparator(self) -> None:
                 self.actions.append(None)
 
+            def deleteLater(self) -> None:
+                pass
+
             def exec(self, _pos):
                 for action in self.actions:
                     if action is not None and action.text == "Open in new tab":
@@ -3946,6 +4236,9 @@ class FtpWidgetTests(unittest.TestCase):
             def addSeparator(self) -> None:
                 self.actions.append(None)
 
+            def deleteLater(self) -> None:
+                pass
+
             def exec(self, _pos):
                 for action in self.actions:
                     if action is not None and action.text == "File permissions...":
@@ -4113,8 +4406,8 @@ class FtpWidgetTests(unittest.TestCase):
         self.assertEqual(panel.current_dir, "/arf/scratch/user")
         self.assertTrue(
             any(
-                panel.views["all"].topLevelItem(index).text(0) == "project"
-                for index in range(panel.views["all"].topLevelItemCount())
+                panel.views["folders"].topLevelItem(index).text(0) == "project"
+                for index in range(panel.views["folders"].topLevelItemCount())
             )
         )
 
@@ -4231,6 +4524,24 @@ class FtpWidgetTests(unittest.TestCase):
 
         self.assertEqual(files.calls, ["/remote", "/remote/child"])
 
+    def test_remote_directory_cache_is_shared_by_panels_on_the_same_backend(self) -> None:
+        files = _CountingFiles()
+        session = {"connected": True, "files": files}
+        self.widget.panel_scratch.session = session
+        self.widget.panel_home.session = session
+
+        self.widget.panel_scratch.set_dir("/remote")
+        self.widget.panel_home.set_dir("/remote")
+
+        self.assertEqual(files.calls, ["/remote"])
+
+        other = _CountingFiles()
+        self.widget.panel_home.session = {"connected": True, "files": other}
+        self.widget.panel_home._invalidate_directory_cache()
+        self.widget.panel_home.refresh()
+
+        self.assertEqual(other.calls, ["/remote"])
+
     def test_remote_directory_cache_force_refresh_bypasses_cache(self) -> None:
         files = _CountingFiles()
         panel = self.widget.panel_scratch
@@ -4260,6 +4571,102 @@ class FtpWidgetTests(unittest.TestCase):
 
         refresh.assert_called_once_with(force=True)
 
+    def test_slow_remote_listing_arrives_without_blocking_refresh(self) -> None:
+        release = threading.Event()
+
+        class SlowFiles(_CountingFiles):
+            supports_parallel_transfers = True
+
+            def listdir_entries_isolated(self, path: str):
+                release.wait(5)
+                return self.listdir_entries(path)
+
+        files = SlowFiles()
+        panel = self.widget.panel_scratch
+        panel.session = {"connected": True, "files": files}
+        view = panel.views["all"]
+
+        panel.set_dir("/remote")
+        self.assertEqual(view.topLevelItemCount(), 0)
+
+        release.set()
+        deadline = time.monotonic() + 5
+        while panel._listing_workers and time.monotonic() < deadline:
+            QApplication.processEvents()
+            time.sleep(0.01)
+
+        names = [view.topLevelItem(i).text(0) for i in range(view.topLevelItemCount())]
+        self.assertIn("root.txt", names)
+
+    def test_stale_remote_listing_is_dropped(self) -> None:
+        release = threading.Event()
+
+        class SlowFiles(_CountingFiles):
+            supports_parallel_transfers = True
+
+            def listdir_entries_isolated(self, path: str):
+                if path.rstrip("/") == "/remote":
+                    release.wait(5)
+                return self.listdir_entries(path)
+
+        files = SlowFiles()
+        panel = self.widget.panel_scratch
+        panel.session = {"connected": True, "files": files}
+        view = panel.views["all"]
+
+        panel.set_dir("/remote")
+        panel.set_dir("/remote/child")
+        # The old rows must not stay under the new path while it loads.
+        self.assertEqual(view.topLevelItemCount(), 0)
+        release.set()
+        deadline = time.monotonic() + 5
+        while panel._listing_workers and time.monotonic() < deadline:
+            QApplication.processEvents()
+            time.sleep(0.01)
+
+        names = [view.topLevelItem(i).text(0) for i in range(view.topLevelItemCount())]
+        self.assertIn("nested.txt", names)
+        self.assertNotIn("root.txt", names)
+
+    def test_refresh_fits_columns_only_once_per_view(self) -> None:
+        files = _CountingFiles()
+        panel = self.widget.panel_scratch
+        panel.session = {"connected": True, "files": files}
+        view = panel.views["all"]
+
+        with patch.object(view, "resizeColumnToContents") as resize:
+            panel.set_dir("/remote")
+            panel.refresh()
+            self.assertEqual(resize.call_count, 2)
+
+            panel.fit_columns()
+            self.assertEqual(resize.call_count, 4)
+
+    def test_header_fit_columns_action_follows_language(self) -> None:
+        panel = self.widget.panel_scratch
+        header = panel.views["all"].header()
+        try:
+            load_language("tr")
+            panel.retranslate_ui()
+            self.assertEqual([action.text() for action in header.actions()], ["Sütunları sığdır"])
+        finally:
+            load_language("en")
+            panel.retranslate_ui()
+        self.assertEqual([action.text() for action in header.actions()], ["Fit columns"])
+
+    def test_refresh_of_unchanged_listing_keeps_rows(self) -> None:
+        files = _CountingFiles()
+        panel = self.widget.panel_scratch
+        panel.session = {"connected": True, "files": files}
+        view = panel.views["all"]
+
+        panel.set_dir("/remote")
+        first_row = view.topLevelItem(0)
+        panel.refresh(force=True)
+
+        self.assertEqual(files.calls, ["/remote", "/remote"])
+        self.assertIs(view.topLevelItem(0), first_row)
+
     def test_remote_directory_cache_expires_after_ttl(self) -> None:
         files = _CountingFiles()
         panel = self.widget.panel_scratch
@@ -4326,6 +4733,206 @@ class FtpWidgetTests(unittest.TestCase):
         finally:
             source_panel.deleteLater()
 
+    def test_copy_plan_probes_shared_directories_with_one_listing_each(self) -> None:
+        class ListingFiles:
+            def __init__(self) -> None:
+                self.listed: list[str] = []
+                self.entries = {
+                    "/src": [
+                        RemoteEntry("a.txt", "/src/a.txt", False),
+                        RemoteEntry("data", "/src/data", True),
+                    ],
+                    "/dst": [RemoteEntry("a.txt", "/dst/a.txt", False)],
+                }
+
+            def listdir_entries(self, remote_dir: str) -> list[RemoteEntry]:
+                self.listed.append(remote_dir)
+                return list(self.entries[remote_dir])
+
+            def exists(self, _path: str) -> bool:
+                raise AssertionError("per-path probe not expected")
+
+            def is_dir(self, _path: str) -> bool:
+                raise AssertionError("per-path probe not expected")
+
+        files = ListingFiles()
+        panel = self.widget.panel_scratch
+        panel.session = {"connected": True, "files": files}
+
+        with patch.object(panel, "_resolve_conflict", return_value=("skip", False)) as resolve:
+            plan = panel._build_copy_move_plan_with_conflicts(
+                "copy",
+                ["/src/a.txt", "/src/data"],
+                "/dst",
+            )
+
+        resolve.assert_called_once()
+        self.assertEqual(
+            [(op.op, op.src, op.dst, op.recursive) for op in plan],
+            [("copy", "/src/data", "/dst/data", True)],
+        )
+        self.assertCountEqual(files.listed, ["/src", "/dst"])
+
+    def test_copy_plan_follows_symlinks_listed_in_shared_directories(self) -> None:
+        link_mode = stat.S_IFLNK | 0o777
+
+        class ListingFiles:
+            def __init__(self) -> None:
+                self.probed: list[str] = []
+                self.entries = {
+                    "/src": [
+                        RemoteEntry("a.txt", "/src/a.txt", False),
+                        RemoteEntry("linked", "/src/linked", False, mode=link_mode),
+                        RemoteEntry("b.txt", "/src/b.txt", False),
+                    ],
+                    "/dst": [
+                        RemoteEntry("b.txt", "/dst/b.txt", False, mode=link_mode),
+                        RemoteEntry("x.txt", "/dst/x.txt", False),
+                    ],
+                }
+
+            def listdir_entries(self, remote_dir: str) -> list[RemoteEntry]:
+                return list(self.entries[remote_dir])
+
+            def exists(self, path: str) -> bool:
+                self.probed.append(path)
+                # /dst/b.txt is a dangling link.
+                return False
+
+            def is_dir(self, path: str) -> bool:
+                self.probed.append(path)
+                return path == "/src/linked"
+
+        files = ListingFiles()
+        panel = self.widget.panel_scratch
+        panel.session = {"connected": True, "files": files}
+
+        with patch.object(panel, "_resolve_conflict") as resolve:
+            plan = panel._build_copy_move_plan_with_conflicts(
+                "copy",
+                ["/src/a.txt", "/src/linked", "/src/b.txt"],
+                "/dst",
+            )
+
+        resolve.assert_not_called()
+        self.assertEqual(
+            [(op.op, op.src, op.recursive) for op in plan],
+            [
+                ("copy", "/src/a.txt", False),
+                ("copy", "/src/linked", True),
+                ("copy", "/src/b.txt", False),
+            ],
+        )
+        self.assertCountEqual(files.probed, ["/src/linked", "/dst/b.txt"])
+
+    def test_copy_move_overwrite_of_file_skips_delete_when_backend_replaces(self) -> None:
+        files = MockFilesBackend()
+        files.mkdir("/src/data")
+        files.write_text("/src/a.txt", "new")
+        files.mkdir("/dst/data")
+        files.write_text("/dst/a.txt", "old")
+        panel = self.widget.panel_scratch
+        panel.session = {"connected": True, "files": files}
+
+        with patch.object(panel, "_resolve_conflict", return_value=("overwrite", True)):
+            plan = panel._build_copy_move_plan_with_conflicts(
+                "move",
+                ["/src/a.txt", "/src/data"],
+                "/dst",
+            )
+
+        self.assertEqual(
+            [(op.op, op.src, op.dst) for op in plan],
+            [
+                ("move", "/src/a.txt", "/dst/a.txt"),
+                ("delete", "", "/dst/data"),
+                ("move", "/src/data", "/dst/data"),
+            ],
+        )
+
+        files.supports_overwrite = False
+        with patch.object(panel, "_resolve_conflict", return_value=("overwrite", True)):
+            plan = panel._build_copy_move_plan_with_conflicts("copy", ["/src/a.txt"], "/dst")
+
+        self.assertEqual(
+            [(op.op, op.dst) for op in plan],
+            [("delete", "/dst/a.txt"), ("copy", "/dst/a.txt")],
+        )
+
+    def test_copy_move_overwrite_of_symlink_keeps_delete(self) -> None:
+        link_mode = stat.S_IFLNK | 0o777
+
+        class LinkFiles:
+            supports_overwrite = True
+
+            def listdir_entries(self, remote_dir: str) -> list[RemoteEntry]:
+                if remote_dir == "/src":
+                    return [
+                        RemoteEntry("a.txt", "/src/a.txt", False),
+                        RemoteEntry("b.txt", "/src/b.txt", False),
+                    ]
+                return [
+                    RemoteEntry("a.txt", "/dst/a.txt", False, mode=link_mode),
+                    RemoteEntry("b.txt", "/dst/b.txt", False, mode=link_mode),
+                ]
+
+            def exists(self, path: str) -> bool:
+                return True
+
+            def is_dir(self, path: str) -> bool:
+                # /dst/a.txt links to a directory, /dst/b.txt to a file.
+                return path == "/dst/a.txt"
+
+        panel = self.widget.panel_scratch
+        panel.session = {"connected": True, "files": LinkFiles()}
+
+        for op in ("copy", "move"):
+            with patch.object(panel, "_resolve_conflict", return_value=("overwrite", True)):
+                plan = panel._build_copy_move_plan_with_conflicts(
+                    op, ["/src/a.txt", "/src/b.txt"], "/dst"
+                )
+
+            self.assertEqual(
+                [(p.op, p.dst) for p in plan],
+                [
+                    ("delete", "/dst/a.txt"),
+                    (op, "/dst/a.txt"),
+                    ("delete", "/dst/b.txt"),
+                    (op, "/dst/b.txt"),
+                ],
+            )
+
+    def test_copy_overwrite_of_single_unlisted_target_lstats_it(self) -> None:
+        class SingleFiles:
+            supports_overwrite = True
+
+            def __init__(self, link: bool) -> None:
+                self.link = link
+                self.lstat_calls: list[str] = []
+
+            def exists(self, path: str) -> bool:
+                return True
+
+            def is_dir(self, path: str) -> bool:
+                return False
+
+            def is_symlink(self, path: str) -> bool:
+                self.lstat_calls.append(path)
+                return self.link
+
+        panel = self.widget.panel_scratch
+        for link, expected in (
+            (True, [("delete", "/dst/a.txt"), ("copy", "/dst/a.txt")]),
+            (False, [("copy", "/dst/a.txt")]),
+        ):
+            files = SingleFiles(link)
+            panel.session = {"connected": True, "files": files}
+            with patch.object(panel, "_resolve_conflict", return_value=("overwrite", True)):
+                plan = panel._build_copy_move_plan_with_conflicts("copy", ["/src/a.txt"], "/dst")
+
+            self.assertEqual([(p.op, p.dst) for p in plan], expected)
+            self.assertEqual(files.lstat_calls, ["/dst/a.txt"])
+
     def test_remote_panel_shutdown_unregisters_idempotently_and_by_identity(self) -> None:
         panel = RemoteDirPanel()
         panel_id = panel.panel_id
@@ -4345,7 +4952,7 @@ class FtpWidgetTests(unittest.TestCase):
                 RemoteDirPanel._instances.pop(panel_id, None)
             panel.deleteLater()
 
-    def test_remote_panel_shutdown_waits_once_for_active_thread_without_planning_jobs(self) -> None:
+    def test_remote_panel_shutdown_quits_active_thread_without_waiting(self) -> None:
         panel = RemoteDirPanel()
 
         class FakeThread:
@@ -4359,6 +4966,9 @@ class FtpWidgetTests(unittest.TestCase):
             def wait(self, timeout: int) -> None:
                 self.wait_calls.append(timeout)
 
+            def isRunning(self) -> bool:
+                return False
+
         active_thread = FakeThread()
         panel._active_thread = active_thread
         panel._planning_jobs.clear()
@@ -4366,11 +4976,28 @@ class FtpWidgetTests(unittest.TestCase):
             panel.shutdown()
 
             self.assertEqual(active_thread.quit_calls, 1)
-            self.assertEqual(active_thread.wait_calls, [1500])
+            self.assertEqual(active_thread.wait_calls, [])
         finally:
             panel.deleteLater()
 
-    def test_remote_panel_shutdown_waits_once_for_active_and_each_planning_thread(self) -> None:
+    def test_remote_panel_shutdown_persists_unfinished_transfers(self) -> None:
+        panel = RemoteDirPanel()
+        items = [
+            TransferItem("download", "/remote/a.txt", "a.txt"),
+            TransferItem("download", "/remote/b.txt", "b.txt"),
+        ]
+        dialog = TransferDialog(title="Download", items=items, run_item=lambda _item: None)
+        panel._transfer_dialogs.append(dialog)
+        try:
+            with patch.object(panel, "_persist_batch_state") as persist:
+                panel.shutdown()
+
+            persist.assert_called_once_with(items, title="Download")
+        finally:
+            dialog.deleteLater()
+            panel.deleteLater()
+
+    def test_remote_panel_shutdown_quits_active_and_planning_threads_without_waiting(self) -> None:
         panel = RemoteDirPanel()
 
         class FakeThread:
@@ -4384,6 +5011,9 @@ class FtpWidgetTests(unittest.TestCase):
             def wait(self, timeout: int) -> None:
                 self.wait_calls.append(timeout)
 
+            def isRunning(self) -> bool:
+                return False
+
         active_thread = FakeThread()
         planning_threads = [FakeThread(), FakeThread(), FakeThread()]
         planning_workers = [SimpleNamespace(cancelled=False) for _thread in planning_threads]
@@ -4396,14 +5026,54 @@ class FtpWidgetTests(unittest.TestCase):
             panel.shutdown()
 
             self.assertEqual(active_thread.quit_calls, 1)
-            self.assertEqual(active_thread.wait_calls, [1500])
+            self.assertEqual(active_thread.wait_calls, [])
             for thread in planning_threads:
                 self.assertEqual(thread.quit_calls, 1)
-                self.assertEqual(thread.wait_calls, [1500])
+                self.assertEqual(thread.wait_calls, [])
             self.assertTrue(all(worker.cancelled for worker in planning_workers))
         finally:
             panel.deleteLater()
 
+    def test_retired_thread_is_kept_alive_until_it_finishes(self) -> None:
+        release = threading.Event()
+
+        class SlowThread(QThread):
+            def run(self) -> None:
+                release.wait(5)
+
+        thread = SlowThread()
+        thread.start()
+        _retire_thread(thread)
+        self.assertIn(thread, _RETIRED_THREADS)
+
+        release.set()
+        self.assertTrue(thread.wait(5000))
+        QApplication.processEvents()
+        self.assertNotIn(thread, _RETIRED_THREADS)
+
+    def test_wait_for_retired_threads_returns_when_threads_finish_or_time_runs_out(self) -> None:
+        release = threading.Event()
+
+        class SlowThread(QThread):
+            def run(self) -> None:
+                release.wait(5)
+
+        thread = SlowThread()
+        thread.start()
+        _retire_thread(thread)
+        try:
+            started = time.monotonic()
+            wait_for_retired_threads(50)
+            self.assertLess(time.monotonic() - started, 2.0)
+            self.assertTrue(thread.isRunning())
+
+            QTimer.singleShot(20, release.set)
+            wait_for_retired_threads(5000)
+            self.assertFalse(thread.isRunning())
+        finally:
+            release.set()
+            thread.wait(5000)
+
     def test_remote_panel_deferred_delete_unregisters_instance(self) -> None:
         panel = RemoteDirPanel()
         panel_id = panel.panel_id
@@ -4500,7 +5170,7 @@ class FtpWidgetTests(unittest.TestCase):
             target = Path(tmp, "existing.txt")
             target.write_text("local", encoding="utf-8")
             with (
-                patch.object(panel, "_resolve_conflict", return_value="skip") as resolve,
+                patch.object(panel, "_resolve_conflict", return_value=("skip", False)) as resolve,
                 patch.object(panel, "_run_plan_with_progress") as run_plan,
             ):
                 self.assertTrue(panel._apply_remote_download(["/remote/existing.txt"], tmp))
@@ -4509,6 +5179,23 @@ class FtpWidgetTests(unittest.TestCase):
             self.assertEqual(resolve.call_args.kwargs["src"], "/remote/existing.txt")
             self.assertFalse(run_plan.called)
 
+    def test_conflict_dialog_is_rebuilt_after_language_change(self) -> None:
+        panel = self.widget.panel_scratch
+        dialogs: list[TransferConflictDialog] = []
+
+        def ask(dialog: TransferConflictDialog) -> TransferConflictDecision:
+            dialogs.append(dialog)
+            return TransferConflictDecision(action="skip")
+
+        with patch.object(TransferConflictDialog, "ask", autospec=True, side_effect=ask):
+            panel._resolve_conflict("/remote/a.txt")
+            panel._resolve_conflict("/remote/b.txt")
+            panel.retranslate_ui()
+            panel._resolve_conflict("/remote/c.txt")
+
+        self.assertIs(dialogs[0], dialogs[1])
+        self.assertIsNot(dialogs[1], dialogs[2])
+
     def test_download_resume_keeps_partial_target_and_plans_one_transfer(self) -> None:
         files = _Files()
         files.remote["/remote/existing.txt"] = b"remote"
@@ -4518,7 +5205,7 @@ class FtpWidgetTests(unittest.TestCase):
             target = Path(tmp, "existing.txt")
             target.write_text("part", encoding="utf-8")
             with (
-                patch.object(panel, "_resolve_conflict", return_value="resume"),
+                patch.object(panel, "_resolve_conflict", return_value=("resume", False)),
                 patch.object(panel, "_run_plan_with_progress", return_value=True) as run_plan,
             ):
                 self.assertTrue(
@@ -4542,7 +5229,7 @@ class FtpWidgetTests(unittest.TestCase):
             source = Path(tmp, "existing.txt")
             source.write_text("remote", encoding="utf-8")
             with (
-                patch.object(panel, "_resolve_conflict", return_value="resume"),
+                patch.object(panel, "_resolve_conflict", return_value=("resume", False)),
                 patch.object(panel, "_run_plan_with_progress", return_value=True) as run_plan,
             ):
                 self.assertTrue(
@@ -4574,7 +5261,7 @@ class FtpWidgetTests(unittest.TestCase):
                 patch.object(
                     panel,
                     "_resolve_conflict",
-                    side_effect=["overwrite", "overwrite"],
+                    side_effect=[("overwrite", False), ("overwrite", False)],
                 ) as resolve,
                 patch.object(panel, "_run_plan_with_progress", return_value=True) as run_plan,
             ):
@@ -4594,6 +5281,47 @@ class FtpWidgetTests(unittest.TestCase):
             ],
         )
 
+    def test_upload_folder_overwrite_skips_nested_exists_probes(self) -> None:
+        class TreeFiles:
+            def __init__(self) -> None:
+                self.probed: list[str] = []
+
+            def exists(self, path: str) -> bool:
+                self.probed.append(path)
+                return path == "/remote/folder"
+
+            def is_dir(self, path: str) -> bool:
+                return path == "/remote/folder"
+
+        files = TreeFiles()
+        panel = self.widget.panel_scratch
+        panel.session = {"connected": True, "files": files}
+
+        with tempfile.TemporaryDirectory() as tmp:
+            folder = Path(tmp, "folder")
+            (folder / "sub").mkdir(parents=True)
+            (folder / "a.txt").write_text("a", encoding="utf-8")
+            (folder / "sub" / "b.txt").write_text("b", encoding="utf-8")
+
+            with (
+                patch.object(panel, "_resolve_conflict", return_value=("overwrite", False)),
+                patch.object(panel, "_run_plan_with_progress", return_value=True) as run_plan,
+            ):
+                self.assertTrue(panel._apply_local_upload([str(folder)], "/remote"))
+
+            plan = run_plan.call_args.args[0]
+            self.assertEqual(files.probed, ["/remote/folder"])
+            self.assertEqual(
+                [(item.op, item.src, item.dst) for item in plan],
+                [
+                    ("delete", "", "/remote/folder"),
+                    ("mkdir_remote", "", "/remote/folder"),
+                    ("mkdir_remote", "", "/remote/folder/sub"),
+                    ("upload", str(folder / "a.txt"), "/remote/folder/a.txt"),
+                    ("upload", str(folder / "sub" / "b.txt"), "/remote/folder/sub/b.txt"),
+                ],
+            )
+
     def test_download_folder_conflicts_ask_for_each_nested_file_without_apply_all(self) -> None:
         class TreeFiles:
             def listdir_entries(self, path: str):
@@ -4626,7 +5354,7 @@ class FtpWidgetTests(unittest.TestCase):
                 patch.object(
                     panel,
                     "_resolve_conflict",
-                    side_effect=["resume", "overwrite", "overwrite"],
+                    side_effect=[("resume", False), ("overwrite", False), ("overwrite", False)],
                 ) as resolve,
                 patch.object(panel, "_run_plan_with_progress", return_value=True) as run_plan,
             ):
@@ -4737,5 +5465,33 @@ class FtpWidgetTests(unittest.TestCase):
                 login.deleteLater()
 
 
+    def test_replacing_the_login_session_closes_its_files_backend(self) -> None:
+        login = LoginWidget()
+        old_files = MockFilesBackend()
+        try:
+            login._session["files"] = old_files
+            with patch.object(old_files, "close") as close:
+                login._finish_mock_connection(SSHConfig(host="mock"), None)
+
+            close.assert_called_once_with()
+            self.assertIsNot(login._session["files"], old_files)
+        finally:
+            login.deleteLater()
+
+    def test_login_console_appends_log_lines_without_resetting_document(self) -> None:
+        login = LoginWidget()
+        try:
+            login._terminal_emulation_enabled = False
+            login._append_log_line("first")
+            login._render_console_view()
+            with patch.object(login.console, "setPlainText") as set_plain_text:
+                login._append_log_line("second\nthird")
+                login._render_console_view()
+
+            set_plain_text.assert_not_called()
+            self.assertEqual(login.console.toPlainText(), "first\nsecond\nthird")
+        finally:
+            login.deleteLater()
+
 if __name__ == "__main__":
     unittest.main()
@@ -3,6 +3,7 @@ from __future__ import annotations
 import sys
 import unittest
 from pathlib import Path
+from types import SimpleNamespace
 from unittest.mock import patch
 
 
@@ -19,9 +20,59 @@ class _Transport:
         return False
 
 
-class _SSHClient:
+class _ActiveTransport(_Transport):
+    def __init__(self):
+        self.keepalive = None
+
+    def is_active(self):
+        return True
+
+    def is_authenticated(self):
+        return True
+
+    def set_keepalive(self, interval):
+        self.keepalive = interval
+
+
+class _ExecChannel:
+    def __init__(self, stdout: bytes, stderr: bytes = b"", code: int = 0):
+        self.command = None
+        self.closed = False
+        self._stdout = [stdout, b""]
+        self._stderr = [stderr, b""]
+        self._code = code
+
+    def exec_command(self, command):
+        self.command = command
+
+    def recv(self, _nbytes):
+        return self._stdout.pop(0) if self._stdout else b""
+
+    def recv_stderr(self, _nbytes):
+        return self._stderr.pop(0) if self._stderr else b""
+
+    def recv_exit_status(self):
+        return self._code
+
+    def close(self):
+        self.closed = True
+
+
+class _ExecTransport(_ActiveTransport):
     def __init__(self):
+        super().__init__()
+        self.channels = []
+
+    def open_session(self):
+        channel = _ExecChannel(b"out\n", b"warn\n", 3)
+        self.channels.append(channel)
+        return channel
+
+
+class _SSHClient:
+    def __init__(self, transport=None):
         self.connect_kwargs = None
+        self._transport = transport or _Transport()
 
     def set_missing_host_key_policy(self, policy):
         pass
@@ -30,7 +81,7 @@ class _SSHClient:
         self.connect_kwargs = kwargs
 
     def get_transport(self):
-        return _Transport()
+        return self._transport
 
     def open_sftp(self):
         return object()
@@ -58,6 +109,66 @@ class OptionalSSHCredentialsTests(unittest.TestCase):
         self.assertTrue(fake_client.connect_kwargs["allow_agent"])
         self.assertTrue(fake_client.connect_kwargs["look_for_keys"])
 
+    def test_live_connection_is_reused_only_for_the_same_target(self):
+        transport = _ActiveTransport()
+        fake_client = _SSHClient(transport)
+        info = SSHConnInfo(host="cluster.example", port=22, username="alice")
+        with (
+            patch(
+                "truba_gui.ssh.client.paramiko.SSHClient",
+                return_value=fake_client,
+            ),
+            patch.object(SSHClientWrapper, "_start_shell_session"),
+        ):
+            wrapper = SSHClientWrapper(info)
+            wrapper.connect()
+
+        self.assertEqual(transport.keepalive, 30)
+        # No interactive shell yet: a reconnect must build a fresh session.
+        self.assertFalse(wrapper.can_reuse_for(info))
+
+        wrapper._shell_channel = SimpleNamespace(closed=False)
+        self.assertTrue(
+            wrapper.can_reuse_for(
+                SSHConnInfo(host="cluster.example", port=22, username="alice")
+            )
+        )
+        self.assertFalse(
+            wrapper.can_reuse_for(
+                SSHConnInfo(host="cluster.example", port=22, username="bob")
+            )
+        )
+        self.assertFalse(
+            wrapper.can_reuse_for(
+                SSHConnInfo(
+                    host="cluster.example",
+                    port=22,
+                    username="alice",
+                    x11_forwarding=True,
+                )
+            )
+        )
+        wrapper._shell_channel.closed = True
+        self.assertFalse(wrapper.can_reuse_for(info))
+        wrapper._shell_channel.closed = False
+        wrapper.client = None
+        self.assertFalse(wrapper.can_reuse_for(info))
+
+    def test_run_opens_a_channel_on_the_existing_transport(self):
+        transport = _ExecTransport()
+        wrapper = SSHClientWrapper()
+        wrapper.client = _SSHClient(transport)
+
+        first = wrapper.run("squeue -u alice", log_output=False)
+        wrapper.run("scancel 42", log_output=False)
+
+        self.assertEqual(first, (3, "out\n", "warn\n"))
+        self.assertEqual(
+            [channel.command for channel in transport.channels],
+            ["squeue -u alice", "scancel 42"],
+        )
+        self.assertTrue(all(channel.closed for channel in transport.channels))
+
 
 if __name__ == "__main__":
     unittest.main()
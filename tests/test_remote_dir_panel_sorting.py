@@ -9,7 +9,7 @@ from PySide6.QtCore import Qt
 from PySide6.QtWidgets import QApplication
 
 from truba_gui.services.files_base import RemoteEntry
-from truba_gui.ui.widgets.remote_dir_panel import RemoteDirPanel
+from truba_gui.ui.widgets.remote_dir_panel import RemoteDirPanel, _category, _file_type
 
 
 class _Files:
@@ -144,6 +144,7 @@ class RemoteDirPanelSortingTests(unittest.TestCase):
         self.assertEqual(all_view.header().sortIndicatorOrder(), Qt.SortOrder.DescendingOrder)
 
         for key, view in self.panel.views.items():
+            self.panel.tabs.setCurrentWidget(view)
             self._click(view, 0)
             self.assertTrue(view.header().isSortIndicatorShown(), key)
             self.assertEqual(view.header().sortIndicatorSection(), 0, key)
@@ -153,6 +154,36 @@ class RemoteDirPanelSortingTests(unittest.TestCase):
             if key in ("all", "folders"):
                 self.assertEqual(names[0], "..", key)
 
+    def test_hidden_category_views_fill_when_first_shown(self) -> None:
+        iso_view = self.panel.views["iso"]
+        self.assertEqual(self._names(iso_view), [])
+
+        self.panel.tabs.setCurrentWidget(iso_view)
+        self.assertEqual(set(self._names(iso_view)), {"image2.iso", "image10.iso"})
+
+        self.files.entries = self.entries[:1]
+        self.panel.refresh(force=True)
+        self.assertEqual(self._names(iso_view), [])
+        self.panel.tabs.setCurrentWidget(self.panel.views["all"])
+        self.assertEqual(self._names(self.panel.views["all"]), ["..", "folder10"])
+
+    def test_file_type_and_category_come_from_the_extension_table(self) -> None:
+        cases = {
+            "disk.ISO": ("Disc Image File", "iso"),
+            "data.tar.gz": ("TAR archive", "archives"),
+            "tar.gz": ("GZ File", "other"),
+            "bundle.7z": ("WinRAR ZIP archive", "archives"),
+            "job.SBATCH": ("SBATCH File", "slurm"),
+            "run.sh": ("SH File", "shell"),
+            "plain": ("File", "other"),
+        }
+        for name, (file_type, category) in cases.items():
+            entry = RemoteEntry(name, f"/work/{name}", False)
+            self.assertEqual(_file_type(name, False), file_type, name)
+            self.assertEqual(_category(entry), category, name)
+            self.assertEqual(self.panel._classify(entry)[:2], (file_type, category), name)
+        self.assertEqual(_category(RemoteEntry("run.sh", "/work/run.sh", True)), "folders")
+
 
 if __name__ == "__main__":
     unittest.main()